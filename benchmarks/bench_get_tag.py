@@ -0,0 +1,72 @@
+"""Micro-benchmark for the per-call cost of ``get_tag``.
+
+Compares the cached ``get_tag`` against the previous implementation, which
+matched a regex against every tag and rebuilt the reverse namespace map on
+every call with an ``nsdict``, over the tags of a synthetic body.  Run from
+the repository root::
+
+    python benchmarks/bench_get_tag.py --paragraphs 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from bench_xml_iter import synthetic_body  # noqa: E402
+
+from simplify_docx.utils.tag import NS_NAMES, NS_SCHEMA, Tag, _re_tag, get_tag  # noqa: E402
+
+
+def legacy_get_tag(element: object, nsdict: dict[str, str] | None = None) -> Tag:
+    """Re-implementation of the uncached ``get_tag``."""
+    ns_names = NS_NAMES if nsdict is None else dict(zip(nsdict.values(), nsdict.keys(), strict=False))
+    match = _re_tag.match(element.tag)
+    if match is None:
+        return Tag(None, None, element.tag, element.tag)
+    namespace, tag = match.groups()
+    if namespace in ns_names:
+        ns = ns_names[namespace]
+        return Tag(namespace, ns, tag, f"{ns}:{tag}")
+    return Tag(namespace, None, tag, element.tag)
+
+
+def main() -> None:
+    """Run the benchmark and print the per-call cost."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    elements = list(synthetic_body(args.paragraphs).iter())
+    for element in elements:
+        if get_tag(element) != legacy_get_tag(element) or get_tag(element, NS_SCHEMA) != legacy_get_tag(
+            element, NS_SCHEMA
+        ):
+            raise RuntimeError(f"legacy and cached get_tag disagree on {element.tag}")
+
+    print(f"{len(elements)} elements")
+    for nsdict in (None, NS_SCHEMA):
+        results: dict[str, float] = {}
+        for label, fun in (("legacy", legacy_get_tag), ("cached", get_tag)):
+            best = min(
+                timeit.repeat(
+                    lambda fun=fun, nsdict=nsdict: [fun(element, nsdict) for element in elements],
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            results[label] = best
+            print(
+                f"nsdict={'NS_SCHEMA' if nsdict else None!s:>9} {label:>6}: {best / len(elements) * 1e9:7.1f} ns/call"
+            )
+        print(f"{'speedup':>23}: {results['legacy'] / results['cached']:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Memory benchmark for the element classes.
+
+Holds one element object per run-level XML node of a large synthetic body and
+reports the growth in peak RSS, comparing the ``__slots__`` element classes
+with lazily read props against the previous layout (an instance ``__dict__``
+and props read eagerly in ``__init__``).  Each layout is measured in a fresh
+interpreter.  Run from the repository root::
+
+    python benchmarks/bench_memory.py --paragraphs 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import resource
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from bench_xml_iter import synthetic_body  # noqa: E402
+
+from simplify_docx import __default_options__  # noqa: E402
+from simplify_docx.elements import el  # noqa: E402
+from simplify_docx.iterators.generic import xml_iter  # noqa: E402
+from simplify_docx.utils.context import ConversionContext  # noqa: E402
+from simplify_docx.utils.set_options import compile_plan  # noqa: E402
+
+# ``ru_maxrss`` is reported in bytes on macOS and in kilobytes elsewhere
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def legacy_layout(cls: type[el]) -> type[el]:
+    """Subclass ``cls`` with an instance ``__dict__`` and eagerly read props."""
+
+    def init(self: el, x: object) -> None:
+        cls.__init__(self, x)
+        if cls.__prop_names__:
+            _ = self.props
+
+    return type(cls.__name__, (cls,), {"__init__": init})
+
+
+def peak_rss() -> int:
+    """Peak resident set size of this process, in bytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+
+
+def measure(layout: str, paragraphs: int) -> None:
+    """Print the element count and the peak RSS growth from holding them."""
+    body = synthetic_body(paragraphs)
+    context = ConversionContext(__default_options__, compile_plan(__default_options__))
+    classes: dict[type[el], type[el]] = {}
+    nodes = []
+    for block in xml_iter(body, "CT_Body", context=context):
+        for elt in xml_iter(block.fragment, "CT_P", context=context):
+            cls = type(elt)
+            if layout == "legacy":
+                if cls not in classes:
+                    classes[cls] = legacy_layout(cls)
+                cls = classes[cls]
+            nodes.append((cls, elt.fragment))
+
+    gc.collect()
+    before = peak_rss()
+    held = [cls(fragment) for cls, fragment in nodes]
+    after = peak_rss()
+    print(len(held), after - before)
+
+
+def main() -> None:
+    """Measure both layouts in subprocesses and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    parser.add_argument("--layout", choices=("legacy", "slots"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.layout:
+        measure(args.layout, args.paragraphs)
+        return
+
+    results: dict[str, int] = {}
+    for layout in ("legacy", "slots"):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, __file__, "--layout", layout, "--paragraphs", str(args.paragraphs)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        count, results[layout] = int(output[0]), int(output[1])
+        print(
+            f"{layout:>7}: {count} elements, {results[layout] / 2**20:7.1f} MiB  {results[layout] / count:6.0f} B/element"
+        )
+    print(f"{'saving':>7}: {1 - results['slots'] / results['legacy']:7.1%}")
+
+
+if __name__ == "__main__":
+    main()
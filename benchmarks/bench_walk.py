@@ -0,0 +1,76 @@
+"""Benchmark one ``walk_many`` traversal against one ``walk`` per extractor.
+
+Runs ``--extractors`` functions over the simplified JSON of a synthetic
+document, first with one ``walk`` each, then all together with
+``walk_many``.  Run from the repository root::
+
+    python benchmarks/bench_walk.py --paragraphs 5000 --extractors 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from bench_xml_iter import synthetic_body  # noqa: E402
+from docx import Document  # noqa: E402
+
+from simplify_docx import simplify, walk, walk_many  # noqa: E402
+
+TYPES: tuple[str, ...] = ("paragraph", "text", "hyperlink", "tab")
+
+
+def synthetic_document(paragraphs: int) -> object:
+    """Build a python-docx document with ``paragraphs`` run-heavy paragraphs."""
+    doc = Document()
+    doc.element.replace(doc.element.body, synthetic_body(paragraphs))
+    return doc
+
+
+def extractors(count: int) -> dict[str, list[Callable[[dict[str, object]], None]]]:
+    """Build ``count`` counting functions, spread over a few node types."""
+    visitors: dict[str, list[Callable[[dict[str, object]], None]]] = {}
+    for i in range(count):
+        visitors.setdefault(TYPES[i % len(TYPES)], []).append(partial(_count, [0]))
+    return visitors
+
+
+def _count(counter: list[int], _node: dict[str, object]) -> None:
+    """Count the nodes it is applied to."""
+    counter[0] += 1
+
+
+def main() -> None:
+    """Run the benchmark and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=5000)
+    parser.add_argument("--extractors", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = simplify(synthetic_document(args.paragraphs))
+    visitors = extractors(args.extractors)
+
+    def _separate() -> None:
+        for node_type, funs in visitors.items():
+            for fun in funs:
+                walk(data, fun, TYPE=node_type)
+
+    print(f"{args.paragraphs} paragraphs, {args.extractors} extractors")
+    results: dict[str, float] = {}
+    for label, fun in (("walk per extractor", _separate), ("walk_many", lambda: walk_many(data, visitors))):
+        best = min(timeit.repeat(fun, number=1, repeat=args.repeat))
+        results[label] = best
+        print(f"{label:>18}: {best * 1e3:8.1f} ms")
+    print(f"{'speedup':>18}: {results['walk per extractor'] / results['walk_many']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
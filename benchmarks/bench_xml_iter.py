@@ -0,0 +1,111 @@
+"""Micro-benchmark for the per-node dispatch cost of ``xml_iter``.
+
+Compares the single dispatch-table lookup against the previous sequence of
+membership tests (yield, nest, warn, ignore-as-list, skip) over a large
+synthetic body.  Run from the repository root::
+
+    python benchmarks/bench_xml_iter.py --paragraphs 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Generator, Mapping
+from pathlib import Path
+from warnings import warn
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from docx.oxml import parse_xml  # noqa: E402
+from docx.oxml.ns import nsdecls  # noqa: E402
+
+from simplify_docx import __default_options__  # noqa: E402
+from simplify_docx.iterators.generic import ElementHandlers, skip_range, xml_iter  # noqa: E402
+from simplify_docx.utils.context import ConversionContext  # noqa: E402
+from simplify_docx.utils.set_options import compile_plan  # noqa: E402
+
+PARAGRAPH = (
+    "<w:p><w:pPr/><w:bookmarkStart/>"
+    "<w:r><w:rPr/><w:t>Lorem ipsum </w:t></w:r><w:proofErr/>"
+    "<w:r><w:t>dolor</w:t><w:tab/><w:t>sit</w:t></w:r>"
+    "<w:hyperlink><w:r><w:t> amet</w:t></w:r></w:hyperlink>"
+    "<w:bookmarkEnd/></w:p>"
+)
+
+
+def synthetic_body(paragraphs: int) -> object:
+    """Build a ``w:body`` with ``paragraphs`` run-heavy paragraphs."""
+    return parse_xml(f"<w:body {nsdecls('w')}>{PARAGRAPH * paragraphs}<w:sectPr/></w:body>")
+
+
+def legacy_xml_iter(p: object, name: str, plan: Mapping[str, ElementHandlers]) -> Generator[object]:
+    """Re-implementation of ``xml_iter`` with sequential membership tests."""
+    handlers = plan[name]
+    tags_to_ignore = list(handlers.TAGS_TO_IGNORE)
+    current = p.getchildren()[0] if len(p) else None
+    while current is not None:
+        if handlers.TAGS_TO_YIELD and current.tag in handlers.TAGS_TO_YIELD:
+            yield handlers.TAGS_TO_YIELD[current.tag](current)
+            if handlers.TAGS_TO_NEST and current.tag in handlers.TAGS_TO_NEST:
+                yield from legacy_xml_iter(current, handlers.TAGS_TO_NEST[current.tag], plan)
+        elif handlers.TAGS_TO_NEST and current.tag in handlers.TAGS_TO_NEST:
+            yield from legacy_xml_iter(current, handlers.TAGS_TO_NEST[current.tag], plan)
+        elif handlers.TAGS_TO_WARN and current.tag in handlers.TAGS_TO_WARN:
+            warn(f"Skipping {handlers.TAGS_TO_WARN[current.tag]} tag: {current.tag}", stacklevel=2)
+        elif tags_to_ignore and current.tag in tags_to_ignore:
+            pass
+        elif handlers.TAGS_TO_SKIP and current.tag in handlers.TAGS_TO_SKIP:
+            data = handlers.TAGS_TO_SKIP[current.tag]
+            current = skip_range(current, data[0], data[1])
+            if current is None:
+                return
+        else:
+            warn(f"Skipping unexpected tag: {current.tag}", stacklevel=2)
+        current = current.getnext()
+
+
+def drain_dispatch(body: object, context: ConversionContext) -> int:
+    """Iterate a body and all of its paragraphs with ``xml_iter``."""
+    count = 0
+    for block in xml_iter(body, "CT_Body", context=context):
+        for _ in xml_iter(block.fragment, "CT_P", context=context):
+            count += 1
+    return count
+
+
+def drain_legacy(body: object, context: ConversionContext) -> int:
+    """Iterate a body and all of its paragraphs with ``legacy_xml_iter``."""
+    count = 0
+    for block in legacy_xml_iter(body, "CT_Body", context.plan):
+        for _ in legacy_xml_iter(block.fragment, "CT_P", context.plan):
+            count += 1
+    return count
+
+
+def main() -> None:
+    """Run the benchmark and print the per-node cost."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = synthetic_body(args.paragraphs)
+    nodes = sum(1 for _ in body.iter()) - 1
+    context = ConversionContext(__default_options__, compile_plan(__default_options__))
+    if drain_dispatch(body, context) != drain_legacy(body, context):
+        raise RuntimeError("legacy and dispatch iteration disagree")
+
+    print(f"{args.paragraphs} paragraphs, {nodes} XML nodes")
+    results: dict[str, float] = {}
+    for label, fun in (("sequential checks", drain_legacy), ("dispatch table", drain_dispatch)):
+        best = min(timeit.repeat(lambda fun=fun: fun(body, context), number=1, repeat=args.repeat))
+        results[label] = best
+        print(f"{label:>18}: {best * 1e3:8.1f} ms  {best / nodes * 1e9:7.1f} ns/node")
+    print(f"{'speedup':>18}: {results['sequential checks'] / results['dispatch table']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Throughput and memory benchmarks over synthetic documents.
+
+Generates one ``.docx`` per scenario (see ``synthetic.py``) and converts it
+in a fresh interpreter, recording documents/sec, XML nodes/sec and the peak
+RSS of that interpreter.  Results can be saved as a baseline and later
+runs compared against it, failing if any scenario regresses by more than a
+threshold.  Run from the repository root::
+
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --compare baseline.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from lxml import etree  # noqa: E402
+from synthetic import GENERATORS  # noqa: E402
+
+# scenario -> front end used to convert it; the altChunk scenario goes
+# through the zip reader, which loads embedded .docx packages itself
+FRONTENDS: dict[str, str] = {
+    "plain-body": "simplify",
+    "nested-tables": "simplify",
+    "numbered-lists": "simplify",
+    "form-fields": "simplify",
+    "alt-chunks": "simplify_file",
+}
+
+# ``ru_maxrss`` is reported in bytes on macOS and in kilobytes elsewhere
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def count_nodes(source: str | Path | io.BytesIO) -> int:
+    """Count the XML elements of the main document part, including embedded packages."""
+    with zipfile.ZipFile(source) as archive:
+        count = sum(1 for _ in etree.fromstring(archive.read("word/document.xml")).iter())
+        for name in archive.namelist():
+            if name.endswith(".docx"):
+                count += count_nodes(io.BytesIO(archive.read(name)))
+    return count
+
+
+def measure(scenario: str, path: Path, repeat: int) -> dict[str, float]:
+    """Load and convert ``path`` ``repeat`` times; return the best conversion time and the peak RSS."""
+    from docx import Document  # noqa: PLC0415
+
+    from simplify_docx import simplify  # noqa: PLC0415
+    from simplify_docx.reader import simplify_file  # noqa: PLC0415
+
+    best = float("inf")
+    for _ in range(repeat):
+        if FRONTENDS[scenario] == "simplify":
+            doc = Document(str(path))
+            start = time.perf_counter()
+            simplify(doc)
+        else:
+            start = time.perf_counter()
+            simplify_file(path)
+        best = min(best, time.perf_counter() - start)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"seconds": best, "peak_rss": peak * RSS_UNIT}
+
+
+def run_scenario(scenario: str, path: Path, repeat: int) -> dict[str, float]:
+    """Measure a scenario in a fresh interpreter and derive its rates."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, __file__, "--child", scenario, str(path), "--repeat", str(repeat)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output)
+    return {
+        "docs_per_sec": 1 / result["seconds"],
+        "nodes_per_sec": count_nodes(path) / result["seconds"],
+        "peak_mib": result["peak_rss"] / 2**20,
+    }
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float) -> bool:
+    """Print the change against the baseline and return True if nothing regressed."""
+    ok = True
+    print(f"\n{'scenario':<16} {'docs/sec':>10} {'peak MiB':>10}")
+    for scenario, result in results.items():
+        if scenario not in baseline:
+            print(f"{scenario:<16} {'(new)':>10}")
+            continue
+        speed = result["docs_per_sec"] / baseline[scenario]["docs_per_sec"] - 1
+        memory = result["peak_mib"] / baseline[scenario]["peak_mib"] - 1
+        regressed = speed < -threshold or memory > threshold
+        ok = ok and not regressed
+        print(f"{scenario:<16} {speed:>+10.1%} {memory:>+10.1%}{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main() -> int:
+    """Run the scenarios and optionally save or compare against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(GENERATORS), help="default: all")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the size of every document")
+    parser.add_argument("--repeat", type=int, default=5, help="conversions per scenario (best is kept)")
+    parser.add_argument("--save", type=Path, help="write the results to this baseline file")
+    parser.add_argument("--compare", type=Path, help="compare the results against this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--child", nargs=2, metavar=("SCENARIO", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        scenario, path = args.child
+        print(json.dumps(measure(scenario, Path(path), args.repeat)))
+        return 0
+
+    results: dict[str, dict[str, float]] = {}
+    print(f"{'scenario':<16} {'docs/sec':>10} {'nodes/sec':>12} {'peak MiB':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for scenario in args.scenario or GENERATORS:
+            generator, size = GENERATORS[scenario]
+            path = Path(workdir) / f"{scenario}.docx"
+            generator(path, max(1, round(size * args.scale)))
+            results[scenario] = result = run_scenario(scenario, path, args.repeat)
+            print(
+                f"{scenario:<16} {result['docs_per_sec']:>10.2f} {result['nodes_per_sec']:>12,.0f} "
+                f"{result['peak_mib']:>10.1f}"
+            )
+
+    if args.save:
+        args.save.write_text(json.dumps({"scale": args.scale, "results": results}, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline.get("scale") != args.scale:
+            print(f"warning: baseline was recorded at scale {baseline.get('scale')}", file=sys.stderr)
+        if not compare(results, baseline["results"], args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Generators for synthetic ``.docx`` files used by the benchmark runner.
+
+Each generator writes a document to ``path`` whose size is controlled by a
+single count, so that a scenario can be scaled up or down.
+"""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+LOREM = "Lorem ipsum dolor sit amet, \u201cconsectetur\u201d adipiscing elit \u2013 sed do eiusmod tempor"
+
+ALT_CHUNK_REL = (
+    '<Relationship Id="rIdChunk{index}" Target="chunk{index}.docx" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/aFChunk"/>'
+)
+ALT_CHUNK_CONTENT_TYPE = (
+    '<Override PartName="/word/chunk{index}.docx" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document"/>'
+)
+
+FORM_FIELDS = (
+    # check box
+    '<w:r><w:fldChar w:fldCharType="begin"><w:ffData><w:name w:val="Check{index}"/><w:enabled/>'
+    '<w:checkBox><w:sizeAuto/><w:default w:val="0"/></w:checkBox></w:ffData></w:fldChar></w:r>'
+    '<w:r><w:instrText xml:space="preserve"> FORMCHECKBOX </w:instrText></w:r>'
+    '<w:r><w:fldChar w:fldCharType="end"/></w:r>',
+    # drop down
+    '<w:r><w:fldChar w:fldCharType="begin"><w:ffData><w:name w:val="Drop{index}"/><w:enabled/>'
+    '<w:ddList><w:listEntry w:val="one"/><w:listEntry w:val="two"/></w:ddList></w:ffData></w:fldChar></w:r>'
+    '<w:r><w:instrText xml:space="preserve"> FORMDROPDOWN </w:instrText></w:r>'
+    '<w:r><w:fldChar w:fldCharType="end"/></w:r>',
+    # text input
+    '<w:r><w:fldChar w:fldCharType="begin"><w:ffData><w:name w:val="Text{index}"/><w:enabled/>'
+    "<w:textInput/></w:ffData></w:fldChar></w:r>"
+    '<w:r><w:instrText xml:space="preserve"> FORMTEXT </w:instrText></w:r>'
+    '<w:r><w:fldChar w:fldCharType="separate"/></w:r>'
+    "<w:r><w:t>value {index}</w:t></w:r>"
+    '<w:r><w:fldChar w:fldCharType="end"/></w:r>',
+)
+
+
+def plain_body(path: Path, paragraphs: int) -> None:
+    """Write a long body of multi-run paragraphs, with an occasional heading."""
+    doc = Document()
+    for index in range(paragraphs):
+        if index % 50 == 0:
+            doc.add_heading(f"Section {index // 50}", level=2)
+        paragraph = doc.add_paragraph(f"{index}. ")
+        for word in LOREM.split():
+            paragraph.add_run(f"{word} ").bold = len(word) > 6  # noqa: PLR2004
+        paragraph.add_run().add_tab()
+    doc.save(path)
+
+
+def nested_tables(path: Path, tables: int, depth: int = 8) -> None:
+    """Write tables nested ``depth`` deep, each level holding text and a 2x2 grid."""
+    doc = Document()
+    for index in range(tables):
+        table = doc.add_table(rows=2, cols=2)
+        for level in range(depth):
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = f"table {index} level {level}"
+            table = table.cell(1, 1).add_table(rows=2, cols=2)
+        doc.add_paragraph(f"After table {index}")
+    doc.save(path)
+
+
+def numbered_lists(path: Path, paragraphs: int, lists: int = 50) -> None:
+    """Write paragraphs with direct numbering across many lists and level overrides."""
+    doc = Document()
+    numbering = doc.part.numbering_part.element
+    levels = "".join(
+        f'<w:lvl w:ilvl="{ilvl}"><w:numFmt w:val="decimal"/><w:lvlText w:val="%{ilvl + 1}."/>'
+        f'<w:pPr><w:ind w:left="{720 * (ilvl + 1)}" w:hanging="360"/></w:pPr></w:lvl>'
+        for ilvl in range(9)
+    )
+    nums = "".join(
+        f'<w:num w:numId="{1000 + num}"><w:abstractNumId w:val="900"/>'
+        f'<w:lvlOverride w:ilvl="{num % 9}"><w:lvl w:ilvl="{num % 9}">'
+        f'<w:pPr><w:ind w:left="{100 * num}"/></w:pPr></w:lvl></w:lvlOverride></w:num>'
+        for num in range(lists)
+    )
+    definitions = parse_xml(
+        f'<w:numbering {nsdecls("w")}><w:abstractNum w:abstractNumId="900">{levels}</w:abstractNum>{nums}</w:numbering>'
+    )
+    for child in definitions:
+        numbering.append(child)
+
+    for index in range(paragraphs):
+        paragraph = doc.add_paragraph(f"Clause {index}: {LOREM}")._p
+        num_pr = paragraph.get_or_add_pPr().get_or_add_numPr()
+        num_pr.get_or_add_numId().val = 1000 + index % lists
+        num_pr.get_or_add_ilvl().val = index % 9
+    doc.save(path)
+
+
+def form_fields(path: Path, fields: int) -> None:
+    """Write paragraphs containing check box, drop down and text input form fields."""
+    doc = Document()
+    for index in range(fields):
+        paragraph = doc.add_paragraph(f"Field {index}: ")
+        for child in parse_xml(f"<w:p {nsdecls('w')}>{FORM_FIELDS[index % 3].format(index=index)}</w:p>"):
+            paragraph._p.append(child)
+    doc.save(path)
+
+
+def alt_chunks(path: Path, chunks: int) -> None:
+    """Write a body of altChunks, each holding an embedded ``.docx`` package."""
+    doc = Document()
+    doc.add_paragraph("Container")
+    doc.save(path)
+
+    with zipfile.ZipFile(path) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+
+    body = b""
+    rels = b""
+    content_types = b""
+    for index in range(chunks):
+        chunk = io.BytesIO()
+        plain_body(chunk, 20)
+        parts[f"word/chunk{index}.docx"] = chunk.getvalue()
+        body += f'<w:altChunk r:id="rIdChunk{index}"/>'.encode()
+        rels += ALT_CHUNK_REL.format(index=index).encode()
+        content_types += ALT_CHUNK_CONTENT_TYPE.format(index=index).encode()
+
+    parts["word/document.xml"] = parts["word/document.xml"].replace(b"<w:sectPr", body + b"<w:sectPr", 1)
+    parts["word/_rels/document.xml.rels"] = parts["word/_rels/document.xml.rels"].replace(
+        b"</Relationships>", rels + b"</Relationships>"
+    )
+    parts["[Content_Types].xml"] = parts["[Content_Types].xml"].replace(b"</Types>", content_types + b"</Types>")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+
+# scenario name -> (generator, size at scale 1)
+GENERATORS: dict[str, tuple[Callable[[Path, int], None], int]] = {
+    "plain-body": (plain_body, 2000),
+    "nested-tables": (nested_tables, 40),
+    "numbered-lists": (numbered_lists, 2000),
+    "form-fields": (form_fields, 1000),
+    "alt-chunks": (alt_chunks, 50),
+}
@@ -1,14 +1,27 @@
 """Coerce Docx Documents to JSON.
 
-Not thread safe! (but could be if build_iterators returned the built iterator
-definitions and passed them around...)
+``simplify()`` is re-entrant and thread safe: each call compiles (or reuses)
+the iterator plan for its options and passes it around in a private
+``ConversionContext``.  Only the legacy ``set_options()`` helper mutates the
+global iterator registries.
 """
 
-from .elements import document
+from collections.abc import Iterator
+
+from .batch import BatchResult as BatchResult
+from .batch import simplify_many as simplify_many
+from .cache import simplify_cached as simplify_cached
+from .columnar import ColumnarDocument as ColumnarDocument
+from .columnar import simplify_columnar as simplify_columnar
+from .elements import body, document
 from .types.fragment import documentPart
-from .utils.friendly_names import apply_friendly_names
-from .utils.set_options import set_options as __set_options__
+from .utils.context import ConversionContext
+from .utils.profile import Profile as Profile
+from .utils.profile import compile_profiled_plan, profiled
+from .utils.set_options import compile_plan
 from .utils.walk import walk as walk
+from .utils.walk import walk_many as walk_many
+from .writer import write_json as write_json
 
 __version__ = "0.1.0"
 
@@ -19,32 +32,79 @@ __version__ = "0.1.0"
 type Options = dict[str, object]
 
 
-def simplify(doc: documentPart, options: Options | None = None) -> dict[str, object]:
-    """Coerce Docx Documents to JSON."""
-    # SET OPTIONS
-    _options: Options
-    _options = dict(__default_options__, **options) if options else __default_options__
-    __set_options__(_options)
+def simplify(
+    doc: documentPart, options: Options | None = None, profile: Profile | None = None
+) -> dict[str, object]:
+    """Coerce Docx Documents to JSON.
+
+    Pass a ``Profile`` to record the time spent in each phase and in each
+    element class's ``to_json``; without one no instrumentation is installed.
+    """
+    if profile is not None:
+        return _profiled_simplify(doc, options, profile)
 
-    out = document(doc.element).to_json(doc, _options)
+    with _new_context(options) as context:
+        root = document(doc.element)
+        root.context = context
+        return root.to_json(doc, context)
 
-    if _options.get("friendly-name", True):
-        apply_friendly_names(out)
 
+def _profiled_simplify(doc: documentPart, options: Options | None, profile: Profile) -> dict[str, object]:
+    """Simplify a document while recording timings in ``profile``."""
+    with profile.phase("options"):
+        context = _new_context(options, profile)
+
+    with context, profile.phase("convert"):
+        root = profiled(document)(doc.element)
+        root.context = context
+        out = root.to_json(doc, context)
+
+    profile.finish()
     return out
 
 
+def iter_simplified_blocks(doc: documentPart, options: Options | None = None) -> Iterator[dict[str, object]]:
+    """Yield the JSON of each top level paragraph, table, etc. of the document body.
+
+    Blocks are yielded as soon as they are complete, so the document never
+    needs to be held as one JSON tree.  Each block is identical to the
+    corresponding item of ``simplify(doc, options)["VALUE"][0]["VALUE"]``.
+    """
+    with _new_context(options) as context:
+        root = document(doc.element)
+        root.context = context
+        for elt in root:
+            if not isinstance(elt, body):
+                continue
+            yield from elt.iter_json(doc, context)
+
+
+def _new_context(options: Options | None, profile: Profile | None = None) -> ConversionContext:
+    """Merge the options with the defaults and bind them to their iterator plan."""
+    _options: Options
+    _options = dict(__default_options__, **options) if options else __default_options__
+    if profile is None:
+        return ConversionContext(_options, compile_plan(_options))
+    return ConversionContext(_options, compile_profiled_plan(_options), profile)
+
+
 # --------------------------------------------------
 # Default Options
 # --------------------------------------------------
 __default_options__: dict[str, str | bool | int | float] = {
     # general
-    "friendly-names": True,
+    "friendly-name": True,
     # flattening special content
     "flatten-hyperlink": True,
     "flatten-smartTag": True,
     "flatten-customXml": True,
     "flatten-simpleField": True,
+    # nested documents (altChunks, subDocs)
+    "nested-part-workers": 0,
+    "nested-part-pool": "process",
+    # large tables
+    "table-row-workers": 0,
+    "table-row-threshold": 500,
     "merge-consecutive-text": True,
     "flatten-inner-spaces": False,
     # possibly meaningful style:
@@ -0,0 +1,95 @@
+"""Command line interface: ``python -m simplify_docx`` / ``simplify-docx``."""
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from .batch import expand_paths, simplify_many
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Simplify the given files and write the results as JSON."""
+    parser = argparse.ArgumentParser(prog="simplify-docx", description="Coerce .docx files to simplified JSON.")
+    parser.add_argument("paths", nargs="+", help=".docx files or directories containing them")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        help="write one <name>.json file per input here, keeping the layout of input directories "
+        "(default: NDJSON on stdout)",
+    )
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument(
+        "--unordered", action="store_true", help="emit results as they complete rather than in input order"
+    )
+    parser.add_argument(
+        "--option",
+        dest="options",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="set a simplify option, e.g. --option flatten-hyperlink=false (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    options = dict(_parse_option(option, parser) for option in args.options)
+    paths: Sequence[str] = args.paths
+    if args.output_dir is not None:
+        outputs = _output_names(args.paths, parser)
+        paths = list(outputs)
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    failures = 0
+    for item in simplify_many(paths, options or None, workers=args.workers, ordered=not args.unordered):
+        if not item.ok:
+            failures += 1
+            print(f"{item.path}: {item.error}", file=sys.stderr)
+            if args.output_dir is None:
+                print(json.dumps({"path": item.path, "error": item.error}))
+            continue
+
+        if args.output_dir is None:
+            print(json.dumps({"path": item.path, "result": item.result}))
+        else:
+            target = args.output_dir / outputs[item.path]
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with target.open("w", encoding="utf-8") as f:
+                json.dump(item.result, f)
+
+    return 1 if failures else 0
+
+
+def _output_names(paths: Sequence[str], parser: argparse.ArgumentParser) -> dict[str, Path]:
+    """Map each input file to its output file, relative to the output directory.
+
+    Files found in a directory keep their path relative to it, and files
+    given directly are named after their stem.  Two inputs which would be
+    written to the same file are an error.
+    """
+    outputs: dict[str, Path] = {}
+    sources: dict[Path, str] = {}
+    for path in paths:
+        root = Path(path)
+        for file in expand_paths(path):
+            name = (Path(file).relative_to(root) if root.is_dir() else Path(Path(file).name)).with_suffix(".json")
+            if sources.setdefault(name, file) != file:
+                parser.error(f"'{sources[name]}' and '{file}' would both be written to '{name}'")
+            outputs[file] = name
+    return outputs
+
+
+def _parse_option(option: str, parser: argparse.ArgumentParser) -> tuple[str, object]:
+    """Parse a NAME=VALUE option, decoding VALUE as JSON where possible."""
+    name, sep, value = option.partition("=")
+    if not sep:
+        parser.error(f"--option expects NAME=VALUE, got '{option}'")
+    try:
+        return name, json.loads(value)
+    except json.JSONDecodeError:
+        return name, value
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Convert many ``.docx`` files across a pool of worker processes."""
+
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import NamedTuple
+
+
+class BatchResult(NamedTuple):
+    """The outcome of converting a single file."""
+
+    path: str
+    result: dict[str, object] | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was converted without error."""
+        return self.error is None
+
+
+def simplify_many(
+    paths: str | os.PathLike | Iterable[str | os.PathLike],
+    options: dict[str, object] | None = None,
+    workers: int | None = None,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """Load and simplify many ``.docx`` files, yielding a ``BatchResult`` per file.
+
+    :param paths: A file, a directory (searched recursively for ``.docx``
+            files), or an iterable of either.
+    :param options: Options passed to ``simplify()``.
+    :param workers: Number of worker processes; defaults to the CPU count.
+            With ``workers <= 1`` files are converted in the current process.
+    :param ordered: If ``True`` results are yielded in input order, otherwise
+            as soon as each file is finished.
+
+    Errors raised while loading or converting a file are captured in
+    ``BatchResult.error`` rather than aborting the batch.
+    """
+    files = expand_paths(paths)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    if workers <= 1:
+        _init_worker(options)
+        for path in files:
+            yield _convert(path, options)
+        return
+
+    # keep a bounded number of files in flight
+    window = workers * 4
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(options,)) as pool:
+        pending: deque[Future] | set[Future] = deque() if ordered else set()
+        for path in files:
+            if len(pending) >= window:
+                yield from _drain(pending, ordered)
+            future = pool.submit(_convert, path, options)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+        while pending:
+            yield from _drain(pending, ordered)
+
+
+def expand_paths(paths: str | os.PathLike | Iterable[str | os.PathLike]) -> Iterator[str]:
+    """Expand directories into the ``.docx`` files they contain."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    for path in paths:
+        _path = Path(path)
+        if _path.is_dir():
+            for child in sorted(_path.rglob("*.docx")):
+                # skip Word's lock files
+                if not child.name.startswith("~$"):
+                    yield str(child)
+        else:
+            yield str(_path)
+
+
+def _drain(pending: deque[Future] | set[Future], ordered: bool) -> Iterator[BatchResult]:
+    """Wait for the next result, then yield it and any others already finished."""
+    if ordered:
+        yield pending.popleft().result()
+        while pending and pending[0].done():
+            yield pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.discard(future)
+        yield future.result()
+
+
+def _init_worker(options: dict[str, object] | None) -> None:
+    """Import python-docx and compile the iterator plan once per worker."""
+    import docx  # noqa: F401, PLC0415
+
+    from . import _new_context  # noqa: PLC0415
+
+    _new_context(options)
+
+
+def _convert(path: str, options: dict[str, object] | None) -> BatchResult:
+    """Load and simplify a single file, capturing any error."""
+    import docx  # noqa: PLC0415
+
+    from . import simplify  # noqa: PLC0415
+
+    try:
+        result = simplify(docx.Document(path), options)
+    except Exception as err:  # noqa: BLE001
+        return BatchResult(path, error=f"{err.__class__.__name__}: {err}")
+    return BatchResult(path, result=result)
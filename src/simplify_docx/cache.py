@@ -0,0 +1,242 @@
+"""Cache simplified documents by the content of their parts.
+
+``simplify_cached()`` and ``simplify_file_cached()`` key each result by a
+hash of the document (the main document part and every part it relates to,
+or the bytes of the ``.docx`` file), of the effective options and of the
+converter itself (see ``code_fingerprint``), so an unchanged document is
+returned without walking its XML again, and an upgrade never serves results
+produced by an older version.  Results are
+stored as serialized JSON, so every call returns a fresh tree which the
+caller is free to modify.
+
+Two backends are provided, both evicting the least recently used entries
+beyond a size limit:
+
+* ``MemoryCache``: an in-process LRU
+* ``DirectoryCache``: one file per entry in a directory, which may be
+  shared between processes
+
+Any object with ``get(key) -> bytes | None`` and ``set(key, value)``
+methods can be used instead.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import cache
+from pathlib import Path
+from typing import IO, Protocol
+
+import docx
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.part import XmlPart
+from docx.oxml.ns import qn
+
+from .types.fragment import documentPart
+from .utils.table_rows import NESTED_PART_TAGS
+from .writer import dumps
+
+# relationships whose (XML) targets are read by the conversion
+OUTPUT_PART_TYPES: frozenset[str] = frozenset({RT.STYLES, RT.NUMBERING})
+
+
+class ResultCache(Protocol):
+    """The interface of a cache backend."""
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under ``key``, if any."""
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store ``value`` under ``key``."""
+
+
+class MemoryCache:
+    """An in-memory LRU cache holding at most ``max_bytes`` of results."""
+
+    def __init__(self, max_bytes: int = 256 * 2**20) -> None:
+        """Create an empty cache."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under ``key`` and mark it as recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store ``value``, evicting the least recently used entries as needed."""
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+
+class DirectoryCache:
+    """A cache storing one ``<key>.json`` file per result in ``path``.
+
+    Entries are written atomically, so the directory may be shared by
+    several processes.  When ``max_bytes`` is given, the least recently used
+    files (by modification time, which is refreshed on every hit) are removed
+    once the directory grows beyond it.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_bytes: int | None = None) -> None:
+        """Use (and create, if needed) the directory ``path``."""
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under ``key`` and mark it as recently used."""
+        entry = self.path / f"{key}.json"
+        try:
+            value = entry.read_bytes()
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store ``value``, evicting the least recently used entries as needed."""
+        fd, temp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            Path(temp).replace(self.path / f"{key}.json")
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
+        if self.max_bytes is not None:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries beyond ``max_bytes``."""
+        entries = []
+        for entry in self.path.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry in sorted(entries, key=lambda x: x[0]):
+            if size <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            size -= entry_size
+
+
+def simplify_cached(
+    doc: documentPart, options: dict[str, object] | None = None, cache: ResultCache | None = None
+) -> dict[str, object]:
+    """Like ``simplify(doc, options)``, but reuse the result for an identical document.
+
+    Without a ``cache`` the process wide ``default_cache`` is used.
+    """
+    from . import simplify  # noqa: PLC0415
+
+    cache = default_cache if cache is None else cache
+    key = _key(document_digest(doc), options)
+    value = cache.get(key)
+    if value is None:
+        value = dumps(simplify(doc, options))
+        cache.set(key, value)
+    return json.loads(value)
+
+
+def simplify_file_cached(
+    source: str | os.PathLike | IO[bytes],
+    options: dict[str, object] | None = None,
+    cache: ResultCache | None = None,
+) -> dict[str, object]:
+    """Like ``simplify_file(source, options)``, but reuse the result for an identical file."""
+    from .reader import simplify_file  # noqa: PLC0415
+
+    cache = default_cache if cache is None else cache
+    if isinstance(source, (str, os.PathLike)):
+        with Path(source).open("rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+    else:
+        start = source.tell()
+        digest = hashlib.file_digest(source, "sha256").hexdigest()
+        source.seek(start)
+    key = _key(digest, options)
+    value = cache.get(key)
+    if value is None:
+        value = dumps(simplify_file(source, options))
+        cache.set(key, value)
+    return json.loads(value)
+
+
+def document_digest(doc: documentPart) -> str:
+    """Hash the parts of a document which ``simplify()`` reads.
+
+    These are the main document part, its styles and numbering, and the
+    nested documents (altChunks, subDocs, content parts) it refers to.  Other
+    binary parts, such as images, are identified by their name and size only,
+    and other XML parts (headers, settings, ...) are not read at all.
+    """
+    part = doc.part
+    digest = hashlib.sha256(part.blob)
+    nested = {element.get(qn("r:id")) for element in part.element.iter(*NESTED_PART_TAGS)}
+
+    entries: dict[str, bytes] = {}
+    for r_id, rel in part.rels.items():
+        if rel.is_external:
+            continue
+        target = rel.target_part
+        if r_id in nested or rel.reltype in OUTPUT_PART_TYPES:
+            entries[target.partname] = hashlib.sha256(target.blob).digest()
+        elif not isinstance(target, XmlPart):
+            entries.setdefault(target.partname, str(len(target.blob)).encode())
+    for partname, value in sorted(entries.items()):
+        digest.update(partname.encode())
+        digest.update(value)
+    return digest.hexdigest()
+
+
+@cache
+def code_fingerprint() -> str:
+    """Return a hash of the sources of this package and the python-docx version.
+
+    Any change to the converter changes the fingerprint, and with it every
+    cache key, even if ``__version__`` was not bumped.
+    """
+    root = Path(__file__).parent
+    digest = hashlib.sha256(docx.__version__.encode())
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _key(digest: str, options: dict[str, object] | None) -> str:
+    """Combine a document digest with the effective options and the converter's fingerprint."""
+    from . import __default_options__  # noqa: PLC0415
+
+    effective = dict(__default_options__, **options) if options else __default_options__
+    encoded = json.dumps([code_fingerprint(), effective], sort_keys=True, default=repr).encode()
+    return hashlib.sha256(digest.encode() + encoded).hexdigest()
+
+
+# the cache used when none is given
+default_cache: ResultCache = MemoryCache()
@@ -0,0 +1,193 @@
+"""A flat, columnar representation of simplified documents.
+
+``simplify_columnar()`` returns a ``ColumnarDocument``: the nodes of the
+tree in document (pre-)order as parallel arrays, instead of nested dicts.
+The top level blocks of the body are appended as soon as each is converted,
+so the document is never held as one JSON tree.  Node ``i`` has:
+
+* ``types[type_codes[i]]``: its ``TYPE``
+* ``parents[i]``: the index of its parent (``-1`` for the root)
+* ``depths[i]``: its depth (``0`` for the root)
+* ``value_kinds[i]``: how its ``VALUE`` is stored (see ``VALUE_KINDS``)
+* ``text[text_offsets[i]:text_offsets[i + 1]]``: its ``VALUE`` as UTF-8, if
+  it is a string (the range is empty otherwise)
+
+Any other ``VALUE`` is kept in ``values[i]``, and any key besides ``TYPE``
+and ``VALUE`` in ``attributes[i]``.  The arrays are ``array.array`` objects
+(``type_codes`` and ``depths`` are ``uint32``, ``value_kinds`` ``uint8``,
+and ``parents`` and ``text_offsets`` ``int64``), which support the buffer
+protocol, so they can be handed to NumPy or Arrow without copying, e.g.
+``numpy.frombuffer(columns.parents, dtype=numpy.int64)``.
+
+``ColumnarDocument.to_tree()`` converts back to the usual tree.
+"""
+
+from array import array
+from typing import NamedTuple
+
+from .elements import body, document
+from .types.fragment import documentPart
+from .utils.friendly_names import type_name
+
+# how the VALUE of a node is stored
+LIST = 0  # a list of nodes, which are its children
+NODE = 1  # a single node, which is its only child
+TEXT = 2  # a string, in ``text``
+OTHER = 3  # anything else, in ``values``
+MISSING = 4  # the node has no VALUE
+
+VALUE_KINDS: tuple[str, ...] = ("list", "node", "text", "other", "missing")
+
+
+class ColumnarDocument(NamedTuple):
+    """The nodes of a simplified document as parallel arrays."""
+
+    types: list[str]
+    type_codes: array
+    parents: array
+    depths: array
+    value_kinds: array
+    text: bytes
+    text_offsets: array
+    values: dict[int, object]
+    attributes: dict[int, dict[str, object]]
+
+    def text_at(self, i: int) -> str:
+        """Return the text of node ``i`` (empty unless its VALUE is a string)."""
+        return self.text[self.text_offsets[i] : self.text_offsets[i + 1]].decode()
+
+    @classmethod
+    def from_tree(cls, tree: dict[str, object]) -> "ColumnarDocument":
+        """Flatten a simplified document (or any element of one)."""
+        builder = _Builder()
+        builder.add_tree(tree, -1, 0)
+        return builder.finish()
+
+    def to_tree(self) -> dict[str, object]:
+        """Rebuild the simplified document, as returned by ``simplify()``.
+
+        Values other than strings and nodes (``values``) and the extra keys
+        (``attributes``) are shared with this object, not copied.
+        """
+        nodes: list[dict[str, object]] = []
+        for i, (code, parent, kind) in enumerate(
+            zip(self.type_codes, self.parents, self.value_kinds, strict=True)
+        ):
+            node: dict[str, object] = {"TYPE": self.types[code]}
+            if kind == LIST:
+                node["VALUE"] = []
+            elif kind == TEXT:
+                node["VALUE"] = self.text_at(i)
+            elif kind != MISSING:
+                # a single node is filled in by its child
+                node["VALUE"] = self.values.get(i)
+            if i in self.attributes:
+                node.update(self.attributes[i])
+            nodes.append(node)
+
+            if parent >= 0:
+                if self.value_kinds[parent] == NODE:
+                    nodes[parent]["VALUE"] = node
+                else:
+                    nodes[parent]["VALUE"].append(node)
+        return nodes[0]
+
+
+def simplify_columnar(doc: documentPart, options: dict[str, object] | None = None) -> ColumnarDocument:
+    """Coerce a python-docx document to a ``ColumnarDocument``.
+
+    ``simplify_columnar(doc, options).to_tree()`` is equal to
+    ``simplify(doc, options)``.
+    """
+    from . import _new_context  # noqa: PLC0415
+
+    builder = _Builder()
+    with _new_context(options) as context:
+        root = document(doc.element)
+        root.context = context
+        root_index = builder.add_node({"TYPE": type_name(root.__type__, context), "VALUE": []}, -1, 0)
+        for elt in root:
+            if isinstance(elt, body):
+                body_index = builder.add_node(
+                    {"TYPE": type_name(elt.__type__, context), "VALUE": []}, root_index, 1
+                )
+                for block in elt.iter_json(doc, context):
+                    builder.add_tree(block, body_index, 2)
+            else:
+                builder.add_tree(elt.to_json(doc, context), root_index, 1)
+        return builder.finish()
+
+
+class _Builder:
+    """Append nodes to the columns of a ``ColumnarDocument``."""
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.type_codes = array("I")
+        self.parents = array("q")
+        self.depths = array("I")
+        self.value_kinds = array("B")
+        self.text = bytearray()
+        self.text_offsets = array("q", [0])
+        self.values: dict[int, object] = {}
+        self.attributes: dict[int, dict[str, object]] = {}
+
+    def add_node(self, node: dict[str, object], parent: int, depth: int) -> int:
+        """Append a single node (but not its children); return its index."""
+        i = len(self.type_codes)
+        node_type = node["TYPE"]
+        code = self.codes.get(node_type)
+        if code is None:
+            code = self.codes[node_type] = len(self.codes)
+        self.type_codes.append(code)
+        self.parents.append(parent)
+        self.depths.append(depth)
+
+        extra = {key: value for key, value in node.items() if key not in {"TYPE", "VALUE"}}
+        if extra:
+            self.attributes[i] = extra
+
+        value = node.get("VALUE", _MISSING)
+        if isinstance(value, str):
+            self.value_kinds.append(TEXT)
+            self.text += value.encode()
+        elif isinstance(value, list) and all(isinstance(item, dict) and "TYPE" in item for item in value):
+            self.value_kinds.append(LIST)
+        elif isinstance(value, dict) and "TYPE" in value:
+            self.value_kinds.append(NODE)
+        elif value is _MISSING:
+            self.value_kinds.append(MISSING)
+        else:
+            self.value_kinds.append(OTHER)
+            self.values[i] = value
+        self.text_offsets.append(len(self.text))
+        return i
+
+    def add_tree(self, tree: dict[str, object], parent: int, depth: int) -> None:
+        """Append a node and all of its descendants, in document order."""
+        stack: list[tuple[dict[str, object], int, int]] = [(tree, parent, depth)]
+        while stack:
+            node, parent, depth = stack.pop()
+            i = self.add_node(node, parent, depth)
+            kind = self.value_kinds[i]
+            if kind == LIST:
+                stack.extend((child, i, depth + 1) for child in reversed(node["VALUE"]))
+            elif kind == NODE:
+                stack.append((node["VALUE"], i, depth + 1))
+
+    def finish(self) -> ColumnarDocument:
+        """Return the columns built so far."""
+        return ColumnarDocument(
+            types=list(self.codes),
+            type_codes=self.type_codes,
+            parents=self.parents,
+            depths=self.depths,
+            value_kinds=self.value_kinds,
+            text=bytes(self.text),
+            text_offsets=self.text_offsets,
+            values=self.values,
+            attributes=self.attributes,
+        )
+
+
+_MISSING = object()
@@ -1,12 +1,16 @@
 """base classes for the docx elements."""
 
 from collections.abc import Generator, Iterator, Sequence
+from typing import ClassVar
 
 from docx.oxml.ns import qn
 from docx.oxml.shared import CT_DecimalNumber, CT_OnOff, CT_String
 from docx.shared import Twips
+from more_itertools import peekable
 
 from ..types import xmlFragment
+from ..utils.context import ConversionContext
+from ..utils.friendly_names import type_name
 
 # --------------------------------------------------
 # Base Classes
@@ -18,38 +22,59 @@ class IncompatibleTypeError(Exception):
 
 
 class el:  # noqa: N801
-    """Abstract base class for docx element."""
+    """Abstract base class for docx element.
+
+    One element is created per XML child, so the element classes use
+    ``__slots__`` (subclasses should declare their own, even if empty) and
+    read their ``__props__`` from the XML only when ``props`` is accessed.
+    """
+
+    __slots__ = ("_props", "context", "fragment")
 
     __type__: str
-    parent: "el"
     fragment: xmlFragment
     __iter_name__: str | None = None
     __iter_xpath__: str | None = None
-    __props__: Sequence[str] | None
-    props: dict[str, object]
+    __props__: Sequence[str] | None = None
+    # (name, qualified name) of each of the ``__props__``
+    __prop_names__: tuple[tuple[str, str], ...] = ()
+    context: ConversionContext | None
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Precompute the qualified attribute names of the class's ``__props__``."""
+        super().__init_subclass__(**kwargs)
+        if "__props__" in cls.__dict__:
+            cls.__prop_names__ = tuple((prop, qn(f"w:{prop}")) for prop in cls.__props__ or ())
 
     def __init__(self, x: xmlFragment) -> None:
         """Initialize the element with its XML fragment."""
         self.fragment = x
-        __props__ = getattr(self, "__props__", None)
-        if __props__:
-            self.props = {}
-            for prop in __props__:
+        self.context = None
+        self._props: dict[str, object] | None = None
+
+    @property
+    def props(self) -> dict[str, object]:
+        """The values of the ``__props__``, read from the XML on first access."""
+        if self._props is None:
+            x = self.fragment
+            self._props = {}
+            for prop, qualified in self.__prop_names__:
                 value = getattr(x, prop, None)
                 if value is None and hasattr(x, "get"):
-                    value = x.get(qn(f"w:{prop}")) or x.get(prop)
-                self.props[prop] = value
+                    value = x.get(qualified) or x.get(prop)
+                self._props[prop] = value
+        return self._props
 
     def to_json(
         self,
         _doc: object,  # pylint: disable=unused-argument
-        _options: dict[str, object],  # pylint: disable=unused-argument
+        options: dict[str, object],
         _super_iter: Iterator | None = None,
     ) -> dict[str, object]:
         """Coerce an object to JSON."""
-        out = {"TYPE": self.__type__}
+        out = {"TYPE": type_name(self.__type__, options)}
 
-        if hasattr(self, "__props__"):
+        if self.__prop_names__:
             for key, prop in self.props.items():
                 if prop is None:
                     continue
@@ -64,7 +89,9 @@ class el:  # noqa: N801
         node: xmlFragment = (
             self.fragment if self.__iter_xpath__ is None else self.fragment.xpath(self.__iter_xpath__)
         )
-        yield from xml_iter(node, self.__iter_name__ if self.__iter_name__ else self.__type__)
+        yield from xml_iter(
+            node, self.__iter_name__ if self.__iter_name__ else self.__type__, context=self.context
+        )
 
     def simplify(self, _options: dict[str, object]) -> "el":
         """Join the next element to the current one."""
@@ -89,17 +116,68 @@ def get_val(x: object) -> object:
 
 
 class container(el):  # noqa: N801
-    """Represents an object that can contain other objects."""
+    """Represents an object that can contain other objects.
+
+    Containers which do not override ``to_json`` are converted by
+    ``convert_containers``; subclasses customize the conversion via
+    ``open_json`` and ``close_json`` instead.
+    """
+
+    __slots__ = ()
+
+    # True for containers of block level elements (the body and table cells)
+    __blocks__: ClassVar[bool] = False
 
     def to_json(
-        self, doc: object, options: dict[str, object], super_iter: Iterator | None = None
+        self, doc: object, options: dict[str, object], _super_iter: Iterator | None = None
     ) -> dict[str, object]:
         """Coerce a container object to JSON."""
-        out: dict[str, object] = super().to_json(doc, options, super_iter)
-        out.update(
-            {
-                "TYPE": self.__type__,
-                "VALUE": [elt.to_json(doc, options) for elt in self],
-            }
-        )
+        return convert_containers(self, doc, options)
+
+    def open_json(self, doc: object, options: dict[str, object]) -> tuple[dict[str, object], Iterator[el]]:
+        """Begin the JSON of the container: return it (without a ``VALUE``) and the children to convert."""
+        out = super().to_json(doc, options)
+        children = iter(self)
+        return out, peekable(children) if self.__blocks__ else children
+
+    def close_json(self, out: dict[str, object], _doc: object, _options: dict[str, object]) -> dict[str, object]:
+        """Complete the JSON of the container, once its ``VALUE`` has been converted."""
         return out
+
+
+def convert_containers(root: container, doc: object, options: dict[str, object]) -> dict[str, object]:
+    """Convert a container, and the containers nested in it, without recursion.
+
+    Children which are themselves containers converted this way (e.g. the
+    tables nested in table cells) are opened on an explicit stack, so the
+    depth of nesting is not limited by Python's recursion limit.  Other
+    children are converted by their own ``to_json``.  As in ``iter_blocks``,
+    the children of block containers are passed the iterator of their
+    siblings (so a paragraph may consume the following ones) and empty
+    paragraphs may be dropped.
+    """
+    paragraph_type = type_name("CT_P", options)
+    ignore_empty = options.get("ignore-empty-paragraphs", False)
+
+    stack: list[tuple[container, list[dict[str, object]], Iterator[el], dict[str, object]]] = []
+    node = root
+    out, children = root.open_json(doc, options)
+    values: list[dict[str, object]] = out.setdefault("VALUE", [])
+    while True:
+        for child in children:
+            if type(child).to_json is container.to_json:
+                stack.append((node, values, children, out))
+                node = child
+                out, children = child.open_json(doc, options)
+                values = out.setdefault("VALUE", [])
+                break
+            data = child.to_json(doc, options, children) if node.__blocks__ else child.to_json(doc, options)
+            if not (node.__blocks__ and ignore_empty and data["TYPE"] == paragraph_type and not data["VALUE"]):
+                values.append(data)
+        else:
+            # THE CURRENT CONTAINER IS COMPLETE
+            data = node.close_json(out, doc, options)
+            if not stack:
+                return data
+            node, values, children, out = stack.pop()
+            values.append(data)
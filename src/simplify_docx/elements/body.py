@@ -1,37 +1,42 @@
 """The body element."""
 
-from collections.abc import Iterator
+from collections.abc import Generator, Iterable
 
 from more_itertools import peekable
 
-from .base import container
+from ..utils.friendly_names import type_name
+from .base import container, el
 
 
 class body(container):  # noqa: N801
     """A document body element."""
 
+    __slots__ = ()
+
     __type__ = "CT_Body"
+    __blocks__ = True
+
+    def iter_json(self, doc: object, options: dict[str, object]) -> Generator[dict[str, object]]:
+        """Yield the JSON of each block level element as soon as it is complete."""
+        yield from iter_blocks(self, doc, options)
+
+
+def iter_blocks(blocks: Iterable[el], doc: object, options: dict[str, object]) -> Generator[dict[str, object]]:
+    """Convert the block level children of a body or table cell one at a time.
+
+    The children are iterated via a ``peekable`` so that a paragraph ending in
+    an un-closed form field can greedily consume the following paragraph(s).
+    """
+    paragraph_type = type_name("CT_P", options)
+    iter_me = peekable(blocks)
+    for elt in iter_me:
+        json_data = elt.to_json(doc, options, iter_me)
+
+        if (
+            json_data["TYPE"] == paragraph_type
+            and options.get("ignore-empty-paragraphs", False)
+            and not json_data["VALUE"]
+        ):
+            continue
 
-    def to_json(
-        self,
-        doc: object,
-        options: dict[str, object] | None = None,
-        _super_iter: Iterator | None = None,
-    ) -> dict[str, object]:
-        """Coerce a container object to JSON."""
-        contents = []
-        iter_me = peekable(self)
-        for elt in iter_me:
-            json_data = elt.to_json(doc, options, iter_me)
-
-            if (
-                json_data["TYPE"] == "CT_P"
-                and options.get("ignore-empty-paragraphs", False)
-                and not json_data["VALUE"]
-            ):
-                continue
-
-            contents.append(json_data)
-
-        out: dict[str, object] = {"TYPE": self.__type__, "VALUE": contents}
-        return out
+        yield json_data
@@ -1,19 +1,29 @@
 """The body element."""
 
 from collections.abc import Iterator
+from warnings import warn
 
+from docx.oxml.ns import qn
+
+from ..utils.context import ConversionContext
+from ..utils.friendly_names import type_name
+from ..utils.nested_parts import nested_document, submit_nested_parts
 from .base import container
 
 
 class document(container):  # noqa: N801
     """A document body element."""
 
+    __slots__ = ()
+
     __type__ = "CT_Document"
 
 
 class CT_Rel(container):  # noqa: N801
     """A document body element."""
 
+    __slots__ = ()
+
     __type__ = "CT_Rel"
     __name__ = "CT_Rel"
 
@@ -23,31 +33,62 @@ class CT_Rel(container):  # noqa: N801
         options: dict[str, object] | None = None,
         _super_iter: Iterator | None = None,
     ) -> dict[str, object]:
-        """Coerce a container object to JSON."""
-        chunk_id = self.fragment.rId
+        """Coerce a container object to JSON.
+
+        Each related part is converted once per conversion: a part referenced
+        repeatedly yields a copy of the same JSON each time, and a part which
+        (indirectly) contains itself is not converted again.  With the
+        ``nested-part-workers`` option the nested documents are converted in a
+        pool of workers (see ``utils.nested_parts``).
+        """
+        chunk_id = getattr(self.fragment, "rId", None) or self.fragment.get(qn("r:id"))
         chunk_part = doc.part.related_parts[chunk_id]
-        chunk_doc = chunk_part.element
-        chunk_doc.element.body.getchildren()
 
-        return {
-            "TYPE": self.__name__,
-            "VALUE": document(chunk_part.element.element).to_json(chunk_doc, options),
-        }
+        def convert() -> dict[str, object]:
+            if self.context is not None and options.get("nested-part-workers", 0):
+                future = self.context.index(submit_nested_parts, doc, self.context).get(chunk_id)
+                # failures are left to the serial path, which reports them in place
+                if future is not None and future.exception() is None:
+                    return future.result()
+
+            return convert_nested(nested_document(chunk_part), options, self.context)
+
+        value = self.context.nested(chunk_part, convert) if self.context is not None else convert()
+        if value is None:
+            warn(f"Related part '{chunk_id}' contains itself and was not converted again", stacklevel=2)
+        return {"TYPE": type_name(self.__name__, options), "VALUE": value}
+
+
+def convert_nested(
+    chunk_doc: object, options: dict[str, object], context: ConversionContext | None
+) -> dict[str, object]:
+    """Convert the document of a related part; also used by the nested-part workers."""
+    chunk_doc.element.body.getchildren()
+
+    nested = document(chunk_doc.element)
+    nested.context = context
+    return nested.to_json(chunk_doc, options)
 
 
 class subDoc(CT_Rel):  # noqa: N801
     """A nested sub-document."""
 
+    __slots__ = ()
+
     __name__ = "subDoc"
 
 
 class contentPart(CT_Rel):  # noqa: N801
     """A content part."""
 
+    __slots__ = ()
+
     __name__ = "contentPart"
 
 
 class altChunk(CT_Rel):  # noqa: N801
     """An alternate format chunk."""
 
+    __slots__ = ()
+
     __type__ = "CT_AltChunk"
@@ -5,6 +5,7 @@ from typing import ClassVar
 from warnings import warn
 
 from ..types import xmlFragment
+from ..utils.friendly_names import raw_names, type_name
 from . import el
 from .base import get_val
 
@@ -12,6 +13,8 @@ from .base import get_val
 class checkBox(el):  # noqa: N801
     """The ffData checkBox attribute."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_FFCheckBox"
     __props__: ClassVar[Sequence[str]] = ["default", "checked"]
 
@@ -19,6 +22,8 @@ class checkBox(el):  # noqa: N801
 class ddList(el):  # noqa: N801
     """The ffData ddList attribute."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_FFDDList"
     __props__: ClassVar[Sequence[str]] = ["default", "result", "listEntry_lst"]
 
@@ -26,6 +31,8 @@ class ddList(el):  # noqa: N801
 class textInput(el):  # noqa: N801
     """The ffData textInput attribute."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_FFTextInput"
     __props__: ClassVar[Sequence[str]] = ["default", "type_", "format_"]
 
@@ -33,6 +40,8 @@ class textInput(el):  # noqa: N801
 class ffData(el):  # noqa: N801
     """The ffData element."""
 
+    __slots__ = ("check_box", "dd_list", "text_input")
+
     __props__: ClassVar[Sequence[str]] = [
         "name",
         "label",
@@ -90,9 +99,12 @@ class ffData(el):  # noqa: N801
 class fldChar(el):  # noqa: N801
     """Form Field Data."""
 
-    __type__: ClassVar[str] = "fldChar"
+    __slots__ = ("__type__", "ff_data", "field_codes", "field_results", "status")
+
+    __type__: str
     __props__: ClassVar[Sequence[str]] = ["fldCharType", "fldLock", "dirty"]
 
+    status: str
     field_codes: Sequence[el]
     field_results: Sequence[el]
     ff_data: ffData | None
@@ -137,7 +149,7 @@ class fldChar(el):  # noqa: N801
             value = None if checked is None else checked.val
 
             if options.get("checkbox-as-text", False):
-                out.update({"TYPE": "CT_Text", "VALUE": f"[{self.__type__}:{value}]"})
+                out.update({"TYPE": type_name("CT_Text", options), "VALUE": f"[{self.__type__}:{value}]"})
                 return out
 
             if options.get("simplify-checkbox", True):
@@ -164,7 +176,7 @@ class fldChar(el):  # noqa: N801
                     value = values[result.val].val
 
             if options.get("dropdown-as-text", False):
-                out.update({"TYPE": "CT_Text", "VALUE": f"[{self.__type__}:{value}]"})
+                out.update({"TYPE": type_name("CT_Text", options), "VALUE": f"[{self.__type__}:{value}]"})
                 return out
 
             if options.get("simplify-dropdown", True):
@@ -188,7 +200,7 @@ class fldChar(el):  # noqa: N801
                     warn("Textinput has more than one element; ignoring all but the first element", stacklevel=2)
                 out.update(
                     {
-                        "TYPE": "CT_Text",
+                        "TYPE": type_name("CT_Text", options),
                         "VALUE": "[%s:%s]" % (contents[0]["VALUE"] if contents else ""),
                     }
                 )
@@ -210,15 +222,17 @@ class fldChar(el):  # noqa: N801
                 out.pop("fldCharType", None)
                 return out
 
-        resolved_contents = [elt.to_json(doc, options) for elt in self.field_results]
-        contents = merge_run_contents(resolved_contents, options)
-        codes = [elt.to_json(doc, options) for elt in self.field_codes]
+        # the parts outside VALUE keep their raw names
+        raw = raw_names(options)
+        resolved_contents = [elt.to_json(doc, raw) for elt in self.field_results]
+        contents = merge_run_contents(resolved_contents, raw)
+        codes = [elt.to_json(doc, raw) for elt in self.field_codes]
 
         out.update(
             {
-                "TYPE": self.__type__,
+                "TYPE": type_name(self.__type__, options),
                 "VALUE": value,
-                "ffData": self.ff_data.to_json(doc, options),
+                "ffData": self.ff_data.to_json(doc, raw),
                 "fieldCodes": codes,
                 "fieldResults": contents,
             }
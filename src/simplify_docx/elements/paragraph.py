@@ -6,28 +6,59 @@ from warnings import warn
 
 from docx.oxml.ns import qn
 
-from ..utils.paragrapy_style import get_paragraph_ind
+from ..types import xmlFragment
+from ..utils.friendly_names import raw_names, type_name
+from ..utils.paragrapy_style import get_paragraph_ind, lookup_style
 from . import container, el
 from .form import fldChar
+from .run_contents import normalize_text, text
 
 
 class EG_PContent(container):  # noqa: N801
     """Base class for elements which with  EG_PContent."""
 
-    def to_json(  # noqa: PLR0912
+    __slots__ = ()
+
+    # strip the white space at the start and end of the contents (per the
+    # remove-leading-white-space and remove-trailing-white-space options)
+    __strip__: ClassVar[bool] = False
+
+    def to_json(  # noqa: PLR0912, PLR0915
         self,
         doc: object,
         options: dict[str, object],
         super_iter: Iterator | None = None,
     ) -> dict[str, object]:
-        """Coerce a paragraph-content element to JSON."""
+        """Coerce a paragraph-content element to JSON.
+
+        Text nodes arrive as bare XML (see ``iter_contents``) and consecutive
+        ones are collected into a single text item, unless they are part of
+        a field.
+        """
         fld_char: fldChar | None = None
         bare_contents: list[dict[str, object]] = []
+        texts: list[str] = []
+        merge = options.get("merge-consecutive-text", True)
 
-        run_iterator = iter(self)
+        run_iterator = self.iter_contents()
         while True:
             # ITERATE OVER THE PARAGRAPH CONTENTS
-            for elt in run_iterator:
+            for node in run_iterator:
+                if isinstance(node, el):
+                    elt = node
+                elif fld_char is not None:
+                    elt = text(node)
+                else:
+                    texts.append(node.text or "")
+                    if not merge:
+                        bare_contents.append(_text_span(texts, options))
+                        texts.clear()
+                    continue
+
+                if texts:
+                    bare_contents.append(_text_span(texts, options))
+                    texts.clear()
+
                 if fld_char is not None:
                     finished: bool = fld_char.update(elt)
                     if finished:
@@ -48,6 +79,10 @@ class EG_PContent(container):  # noqa: N801
 
                 bare_contents.append(elt.to_json(doc, options))
 
+            if texts:
+                bare_contents.append(_text_span(texts, options))
+                texts.clear()
+
             if fld_char is not None:
                 # THE PARAGRAPH ENDED IN AN INCOMPLETE FORM-FIELD
                 if options.get("greedy-text-input", True):
@@ -57,7 +92,7 @@ class EG_PContent(container):  # noqa: N801
                         break
                     if isinstance(_next, paragraph):
                         # TODO: insert a line break into the text run...
-                        run_iterator = iter(super_iter.__next__())
+                        run_iterator = super_iter.__next__().iter_contents()
                     else:
                         warn(
                             f"Paragraph ended with an un-closed form-field followed by a {_next.__class__.__name__} element: this may cause parsing to fail",
@@ -73,40 +108,98 @@ class EG_PContent(container):  # noqa: N801
             else:
                 break
 
-        contents = merge_run_contents(bare_contents, options)
-        return {"TYPE": self.__type__, "VALUE": contents}
+        contents = merge_run_contents(bare_contents, options, strip=self.__strip__)
+        return {"TYPE": type_name(self.__type__, options), "VALUE": contents}
+
+    def iter_contents(self) -> Iterator[el | xmlFragment]:
+        """Iterate over the contents like ``iter(self)``, but yield text nodes as bare XML."""
+        from ..iterators import xml_iter  # noqa: PLC0415
+
+        node: xmlFragment = (
+            self.fragment if self.__iter_xpath__ is None else self.fragment.xpath(self.__iter_xpath__)
+        )
+        return xml_iter(node, self.__iter_name__ or self.__type__, context=self.context, raw=_RAW_TEXT)
 
 
-def merge_run_contents(x: Sequence[dict[str, object]], options: dict[str, object]) -> list[dict[str, object]]:
-    """Merge a series of run contents as appropriate."""
+# element classes whose nodes ``EG_PContent.to_json`` converts directly
+_RAW_TEXT: frozenset[type[el]] = frozenset({text})
+
+
+def _text_span(values: Sequence[str], options: dict[str, object]) -> dict[str, object]:
+    """Coerce the contents of consecutive text nodes to a single text item."""
+    if options.get("flatten-inner-spaces", False):
+        # inner spaces are flattened within each text node, not across them
+        value = "".join(normalize_text(value, options) for value in values)
+    else:
+        value = normalize_text("".join(values), options)
+    return {"TYPE": type_name("CT_Text", options), "VALUE": value}
+
+
+def merge_run_contents(
+    x: Sequence[dict[str, object]], options: dict[str, object], strip: bool = False
+) -> list[dict[str, object]]:
+    """Merge a series of run contents as appropriate.
+
+    With ``strip``, leading and trailing white space is also removed from the
+    merged contents (dropping text items left empty), as requested by the
+    ``remove-leading-white-space`` and ``remove-trailing-white-space`` options.
+    """
+    text_type = type_name("CT_Text", options)
+    ignore_empty = options.get("ignore-empty-text", True)
+    merge = options.get("merge-consecutive-text", True)
+
     out: list[dict[str, object]] = []
-    prev_data: dict[str, object] | None = None
+    # the values of the text items merged into ``out[-1]``
+    merged: list[str] = []
     for data in x:
-        if options.get("ignore-empty-text", True) and data["TYPE"] == "CT_Text" and not data["VALUE"]:
+        is_text = data["TYPE"] == text_type
+        if ignore_empty and is_text and not data["VALUE"]:
             continue
 
-        if not prev_data:
-            prev_data = data
-            out.append(data)
+        if merged and is_text:
+            merged.append(data["VALUE"])
             continue
 
-        if (
-            prev_data["TYPE"] == "CT_Text"
-            and data["TYPE"] == "CT_Text"
-            and options.get("merge-consecutive-text", True)
-        ):
-            prev_data["VALUE"] += data["VALUE"]
+        if len(merged) > 1:
+            out[-1]["VALUE"] = "".join(merged)
+        merged = [data["VALUE"]] if is_text and merge else []
+        out.append(data)
 
-        else:
-            prev_data = data
-            out.append(data)
+    if len(merged) > 1:
+        out[-1]["VALUE"] = "".join(merged)
 
+    if strip:
+        _strip_white_space(out, text_type, options)
     return out
 
 
+def _strip_white_space(contents: list[dict[str, object]], text_type: str, options: dict[str, object]) -> None:
+    """Strip the leading and trailing white space of merged run contents, in place."""
+    start = 0
+    if options.get("remove-leading-white-space", True):
+        while start < len(contents) and contents[start]["TYPE"] == text_type:
+            contents[start]["VALUE"] = contents[start]["VALUE"].lstrip()
+            if contents[start]["VALUE"]:
+                break
+            start += 1
+
+    end = len(contents)
+    if options.get("remove-trailing-white-space", True):
+        while end > start and contents[end - 1]["TYPE"] == text_type:
+            contents[end - 1]["VALUE"] = contents[end - 1]["VALUE"].rstrip()
+            if contents[end - 1]["VALUE"]:
+                break
+            end -= 1
+
+    del contents[end:]
+    del contents[:start]
+
+
 class numPr(el):  # noqa: N801
     """The paragraph numbering property."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "numPr"
     __props__: ClassVar[Sequence[str]] = ["ilvl", "numId"]
 
@@ -114,6 +207,8 @@ class numPr(el):  # noqa: N801
 class indentation(el):  # noqa: N801
     """``<w:ind>`` element, specifying paragraph indentation."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_Ind"
     __props__: ClassVar[Sequence[str]] = ["left", "right", "firstLine", "hanging"]
 
@@ -121,8 +216,11 @@ class indentation(el):  # noqa: N801
 class paragraph(EG_PContent):  # noqa: N801
     """Represents a simple paragraph."""
 
+    __slots__ = ()
+
     __name__: ClassVar[str] = "CT_P"
     __type__: ClassVar[str] = "CT_P"
+    __strip__: ClassVar[bool] = True
 
     def to_json(
         self,
@@ -133,32 +231,10 @@ class paragraph(EG_PContent):  # noqa: N801
         """Coerce a container object to JSON."""
         out: dict[str, object] = super().to_json(doc, options, super_iter)
 
-        if options.get("remove-leading-white-space", True):
-            children: list[dict[str, object]] = out["VALUE"]
-            while children:
-                if children[0]["TYPE"] != "CT_Text":
-                    break
-                first = children.pop(0)
-                first["VALUE"] = first["VALUE"].lstrip()
-                if first["VALUE"]:
-                    children.insert(0, first)
-                    break
-
-        if options.get("remove-trailing-white-space", True):
-            children = out["VALUE"]
-            while children:
-                if children[-1]["TYPE"] != "CT_Text":
-                    break
-                last = children.pop()
-                last["VALUE"] = last["VALUE"].rstrip()
-                if last["VALUE"]:
-                    children.append(last)
-                    break
-
         if options.get("include-paragraph-indent", True):
-            _indent = get_paragraph_ind(self.fragment, doc)
+            _indent = get_paragraph_ind(self.fragment, doc, options)
             if _indent is not None:
-                out["style"] = {"indent": indentation(_indent).to_json(doc, options)}
+                out["style"] = {"indent": indentation(_indent).to_json(doc, raw_names(options))}
 
         if getattr(self.fragment, "pPr", None) is not None and getattr(self.fragment.pPr, "pStyle", None) is not None:
             p_style = self.fragment.pPr.pStyle
@@ -168,26 +244,12 @@ class paragraph(EG_PContent):  # noqa: N801
             if style_val:
                 out["style"] = out.get("style", {})
                 out["style"]["pStyle"] = style_val
-                style_elem = doc.styles.element.find(
-                    f"w:style[@w:styleId='{style_val}']",
-                    doc.styles.element.nsmap,
-                )
-                if style_elem is not None:
-                    name_elem = style_elem.find(qn("w:name"))
-                    if name_elem is not None:
-                        name_val = name_elem.get(qn("w:val"))
-                        if name_val:
-                            out["style"]["pStyleName"] = name_val
-                    ppr = style_elem.find(qn("w:pPr"))
-                    if ppr is not None:
-                        outline = ppr.find(qn("w:outlineLvl"))
-                        if outline is not None:
-                            outline_val = outline.get(qn("w:val"))
-                            if outline_val is not None:
-                                try:
-                                    out["style"]["outlineLvl"] = int(outline_val) + 1
-                                except ValueError:
-                                    pass
+                style_info = lookup_style(doc, style_val, options)
+                if style_info is not None:
+                    if style_info.name:
+                        out["style"]["pStyleName"] = style_info.name
+                    if style_info.outline_level is not None:
+                        out["style"]["outlineLvl"] = style_info.outline_level + 1
 
         if (
             options.get("include-paragraph-numbering", True)
@@ -195,7 +257,7 @@ class paragraph(EG_PContent):  # noqa: N801
             and self.fragment.pPr.numPr is not None
         ):
             out["style"] = out.get("style", {})
-            out["style"]["numPr"] = numPr(self.fragment.pPr.numPr).to_json(doc, options)
+            out["style"]["numPr"] = numPr(self.fragment.pPr.numPr).to_json(doc, raw_names(options))
 
         return out
 
@@ -203,6 +265,8 @@ class paragraph(EG_PContent):  # noqa: N801
 class hyperlink(EG_PContent):  # noqa: N801
     """The hyperlink element."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_Hyperlink"
     __props__: ClassVar[Sequence[str]] = ["anchor", "docLocatoin", "history", "id", "tgtFrame", "tooltip"]
 
@@ -210,6 +274,8 @@ class hyperlink(EG_PContent):  # noqa: N801
 class fldSimple(EG_PContent):  # noqa: N801
     """The SimpleField element."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_SimpleField"
     __props__: ClassVar[Sequence[str]] = ["instr", "fldLock", "dirty"]
 
@@ -217,6 +283,8 @@ class fldSimple(EG_PContent):  # noqa: N801
 class customXml(container):  # noqa: N801
     """The customXml element."""
 
+    __slots__ = ()
+
     __name__: ClassVar[str] = "CustomXmlRun"
     __type__: ClassVar[str] = "CT_CustomXmlRun"
     __props__: ClassVar[Sequence[str]] = ["element"]
@@ -225,6 +293,8 @@ class customXml(container):  # noqa: N801
 class smartTag(container):  # noqa: N801
     """The smartTag element."""
 
+    __slots__ = ()
+
     __name__: ClassVar[str] = "CT_SmartTagRun"
     __type__: ClassVar[str] = "EG_PContent"
     __props__: ClassVar[Sequence[str]] = ["element", "uri"]
@@ -2,19 +2,45 @@
 
 import re
 from collections.abc import Iterator
+from functools import lru_cache
 from typing import ClassVar
 
 from docx.oxml.ns import qn
 
 from ..types import xmlFragment
+from ..utils.friendly_names import type_name
 from . import el  # , IncompatibleTypeError
 
 RE_SPACES = re.compile("  +", re.IGNORECASE)
 
+# character replacements made by the text normalization options; where two
+# options map the same character the earlier one in this list takes precedence
+_TEXT_REPLACEMENTS: tuple[tuple[str, str, str], ...] = (
+    ("dumb-quotes", "\u2018\u2019\u201a\u201b", "'"),
+    ("dumb-quotes", "\u201c\u201d", '"'),
+    ("dumb-spaces", "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u201b", " "),
+    ("dumb-hyphens", "\u2010\u2011\u2012\u2013\u2014\u2015\u00a0", "-"),
+    ("ignore-joiners", "\u200c\u200d", ""),
+    ("ignore-left-to-right-mark", "\u200e", ""),
+    ("ignore-right-to-left-mark", "\u200f", ""),
+)
+
+# the text normalization options and their defaults
+_TEXT_OPTIONS: tuple[tuple[str, bool], ...] = (
+    ("dumb-quotes", True),
+    ("dumb-spaces", True),
+    ("dumb-hyphens", True),
+    ("ignore-joiners", True),
+    ("ignore-left-to-right-mark", False),
+    ("ignore-right-to-left-mark", False),
+)
+
 
 class empty(el):  # noqa: N801
     """Generic for CT_Empty elements."""
 
+    __slots__ = ("__type__",)
+
     __type__: str
 
     def __init__(self, x: xmlFragment) -> None:
@@ -30,9 +56,9 @@ class empty(el):  # noqa: N801
     ) -> dict[str, object]:
         """Coerce an object to JSON."""
         if options.get("empty-as-text", False):
-            return {"TYPE": "CT_Text", "VALUE": f"[w:{self.__type__}]"}
+            return {"TYPE": type_name("CT_Text", options), "VALUE": f"[w:{self.__type__}]"}
 
-        return {"TYPE": "CT_Empty", "VALUE": f"[w:{self.__type__}]"}
+        return {"TYPE": type_name("CT_Empty", options), "VALUE": f"[w:{self.__type__}]"}
 
 
 # settings to be imported at a later time
@@ -43,9 +69,38 @@ default_text_options = {
 }
 
 
+@lru_cache(maxsize=64)
+def _translation_table(enabled: tuple[bool, ...]) -> dict[int, str]:
+    """Compile the text normalization options into a ``str.translate`` table.
+
+    ``enabled`` holds the value of each of the ``_TEXT_OPTIONS``, in order.
+    """
+    flags = {option: bool(on) for (option, _), on in zip(_TEXT_OPTIONS, enabled, strict=True)}
+    table: dict[int, str] = {}
+    for option, chars, replacement in _TEXT_REPLACEMENTS:
+        if flags[option]:
+            for char in chars:
+                table.setdefault(ord(char), replacement)
+    return table
+
+
+def normalize_text(value: str, options: dict[str, object]) -> str:
+    """Apply the text normalization options to the contents of a text element."""
+    table = _translation_table(tuple(options.get(option, default) for option, default in _TEXT_OPTIONS))
+    if table:
+        value = value.translate(table)
+
+    if options.get("flatten-inner-spaces", False):
+        value = RE_SPACES.sub(" ", value)
+
+    return value
+
+
 class text(el):  # noqa: N801
     """A Text element."""
 
+    __slots__ = ("__type__", "value")
+
     __type__: str
     value: str
 
@@ -65,53 +120,7 @@ class text(el):  # noqa: N801
         _super_iter: Iterator | None = None,
     ) -> dict[str, object]:
         """Coerce an object to JSON."""
-        _value = self.value
-        if options.get("dumb-quotes", True):
-            _value = (
-                _value.replace("\u2018", "'").replace("\u2019", "'").replace("\u201a", "'").replace("\u201b", "'")
-            )
-            _value = _value.replace("\u201c", '"').replace("\u201d", '"')
-
-        if options.get("dumb-spaces", True):
-            _value = (
-                _value.replace("\u2000", " ")
-                .replace("\u2001", " ")
-                .replace("\u2002", " ")
-                .replace("\u2003", " ")
-                .replace("\u2004", " ")
-                .replace("\u2005", " ")
-                .replace("\u2006", " ")
-                .replace("\u2007", " ")
-                .replace("\u2008", " ")
-                .replace("\u2009", " ")
-                .replace("\u200a", " ")
-                .replace("\u201b", " ")
-            )
-
-        if options.get("dumb-hyphens", True):
-            _value = (
-                _value.replace("\u2010", "-")
-                .replace("\u2011", "-")
-                .replace("\u2012", "-")
-                .replace("\u2013", "-")
-                .replace("\u2014", "-")
-                .replace("\u2015", "-")
-                .replace("\u00a0", "-")
-            )
-
-        if options.get("ignore-joiners", True):
-            _value = _value.replace("\u200c", "").replace("\u200d", "")
-
-        if options.get("flatten-inner-spaces", True):
-            _value = RE_SPACES(" ", _value)
-
-        if options.get("ignore-left-to-right-mark", False):
-            _value = _value.replace("\u200e", "")
-
-        if options.get("ignore-right-to-left-mark", False):
-            _value = _value.replace("\u200f", "")
-
-        return {"TYPE": "CT_Text", "VALUE": _value}
+        return {"TYPE": type_name("CT_Text", options), "VALUE": normalize_text(self.value, options)}
 
 
 class SymbolChar(el):
@@ -120,6 +129,8 @@ class SymbolChar(el):
     The font matters for rendering even though the element is text-like.
     """
 
+    __slots__ = ("char", "font")
+
     __type__: ClassVar[str] = "SymbolChar"
     char: str
     font: str
@@ -138,9 +149,9 @@ class SymbolChar(el):
     ) -> dict[str, object]:
         """Coerce an object to JSON."""
         if options.get("symbol-as-text", True):
-            return {"TYPE": "CT_Text", "VALUE": self.char}
+            return {"TYPE": type_name("CT_Text", options), "VALUE": self.char}
 
-        return {"TYPE": self.__type__, "VALUE": {"char": self.char, "font": self.font}}
+        return {"TYPE": type_name(self.__type__, options), "VALUE": {"char": self.char, "font": self.font}}
 
 
 simple_text_element_text = {
@@ -166,6 +177,8 @@ tag_to_type_map: dict[str, str] = {
 class simpleTextElement(el):  # noqa: N801
     """A simple text element represented by a CT_Empty."""
 
+    __slots__ = ("__type__",)
+
     def __init__(self, x: xmlFragment) -> None:
         """Initialize the simple text element from XML."""
         super().__init__(x)
@@ -179,6 +192,6 @@ class simpleTextElement(el):  # noqa: N801
     ) -> dict[str, object]:
         """Coerce a simple text element to JSON."""
         if options.get("special-characters-as-text", True):
-            return {"TYPE": "CT_Text", "VALUE": simple_text_element_text[self.__type__]}
+            return {"TYPE": type_name("CT_Text", options), "VALUE": simple_text_element_text[self.__type__]}
 
-        return {"TYPE": self.__type__}
+        return {"TYPE": type_name(self.__type__, options)}
@@ -4,45 +4,27 @@ from collections.abc import Iterator
 from typing import ClassVar
 
 from docx.oxml.ns import qn
-from more_itertools import peekable
 
-from . import container
+from ..utils.friendly_names import type_name
+from ..utils.table_rows import can_convert_in_worker, convert_rows_in_pool
+from . import container, el
 
 
 class tc(container):  # noqa: N801
     """A table cell."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_Tc"
     __friendly__: ClassVar[str] = "table-cell"
-
-    def to_json(
-        self,
-        doc: object,
-        options: dict[str, object] | None = None,
-        _super_iter: Iterator | None = None,
-    ) -> dict[str, object]:
-        """Coerce a container object to JSON."""
-        contents = []
-        iter_me = peekable(self)
-        for elt in iter_me:
-            json_data = elt.to_json(doc, options, iter_me)
-
-            if (
-                json_data["TYPE"] == "CT_P"
-                and options.get("ignore-empty-paragraphs", False)
-                and not json_data["VALUE"]
-            ):
-                continue
-
-            contents.append(json_data)
-
-        out: dict[str, object] = {"TYPE": self.__type__, "VALUE": contents}
-        return out
+    __blocks__: ClassVar[bool] = True
 
 
 class tr(container):  # noqa: N801
     """A table row."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_Row"
     __friendly__: ClassVar[str] = "table-row"
 
@@ -50,18 +32,36 @@ class tr(container):  # noqa: N801
 class table(container):  # noqa: N801
     """A Table object."""
 
+    __slots__ = ()
+
     __type__: ClassVar[str] = "CT_Tbl"
     __friendly__: ClassVar[str] = "table"
 
-    def to_json(
-        self,
-        doc: object,
-        options: dict[str, object] | None = None,
-        super_iter: Iterator | None = None,
-    ) -> dict[str, object]:
-        """Coerce a table element to JSON."""
-        out = super().to_json(doc, options, super_iter)
-
+    def open_json(self, doc: object, options: dict[str, object]) -> tuple[dict[str, object], Iterator[el]]:
+        """Begin the JSON of the table, converting its rows in worker processes if there are enough of them.
+
+        Other tables are converted like any container, so that the tables
+        nested in their cells are opened on the stack of ``convert_containers``.
+        """
+        if options.get("table-row-workers", 0):
+            threshold = max(options.get("table-row-threshold", 500), 1)
+            # the rows (bare, or wrapped in a customXml or sdt) are counted first, as
+            # most tables are far below the threshold
+            if len(self.fragment.xpath("w:tr | */w:tr | */*/w:tr")) >= threshold:
+                contents = list(self)
+                pooled = [
+                    index
+                    for index, elt in enumerate(contents)
+                    if isinstance(elt, tr) and can_convert_in_worker(elt.fragment)
+                ]
+                if len(pooled) >= threshold:
+                    out = {"TYPE": type_name(self.__type__, options)}
+                    out["VALUE"] = self._contents_json(contents, pooled, doc, options)
+                    return out, iter(())
+        return super().open_json(doc, options)
+
+    def close_json(self, out: dict[str, object], _doc: object, options: dict[str, object]) -> dict[str, object]:
+        """Add the table caption and description."""
         _caption = self.fragment.tblPr.find(qn("w:tblCaption"))
         if _caption is not None:
             if (not _caption.val) and options.get("ignore-empty-table-caption", True):
@@ -76,3 +76,16 @@ class table(container):  # noqa: N801
             else:
                 out["tblDescription"] = _desc.val
         return out
+
+    def _contents_json(
+        self, contents: list[el], pooled: list[int], doc: object, options: dict[str, object]
+    ) -> list[dict[str, object]]:
+        """Convert the rows at the ``pooled`` indexes in worker processes, and the rest of the table here."""
+        out: list[dict[str, object] | None] = [None] * len(contents)
+        rows = convert_rows_in_pool([contents[index].fragment for index in pooled], doc, options)
+        for index, row in zip(pooled, rows, strict=True):
+            out[index] = row
+        for index, elt in enumerate(contents):
+            if out[index] is None:
+                out[index] = elt.to_json(doc, options)
+        return out
@@ -15,6 +15,8 @@ register_iterator(
         qn("w:commentRangeEnd"),
         qn("w:moveToRangeStart"),
         qn("w:moveToRangeEnd"),
+        # the end of a range which started in another container
+        qn("w:moveFromRangeEnd"),
     ],
     tags_to_warn={
         qn("w:customXmlInsRangeStart"): "Ignoring Revision Tags",
@@ -26,7 +28,7 @@ register_iterator(
         qn("w:customXmlMoveToRangeStart"): "Ignoring Revision Tags",
         qn("w:customXmlMoveToRangeEnd"): "Ignoring Revision Tags",
     },
-    tags_to_skip={qn("w:moveFromRangeStart"): ("id", qn("w:MoveFromRangeEnd"))},
+    tags_to_skip={qn("w:moveFromRangeStart"): (qn("w:id"), qn("w:moveFromRangeEnd"))},
 )
 
 # RUN LEVEL LEMENTS
@@ -1,19 +1,29 @@
 """Generic XML iterators."""
 # pylint: disable=too-many-arguments, too-many-branches
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Hashable, Iterable, Iterator, Mapping, Sequence
+from types import MappingProxyType
 from typing import NamedTuple, NewType
 from warnings import warn
 
 from ..elements.base import el
 from ..types import xmlFragment
-from ..utils.tag import get_tag
+from ..utils.context import ConversionContext
 from ..utils.warnings import UnexpectedElementWarning
 
 FragmentIterator = NewType("FragmentIterator", Callable[[xmlFragment, str | None], Generator[xmlFragment]])
 
 # CONSTANTS
 
+# actions in the per-iterator dispatch tables
+_YIELD = 0
+_NEST = 1
+_YIELD_AND_NEST = 2
+_IGNORE = 3
+_WARN = 4
+_SKIP = 5
+_UNEXPECTED = (6, None)
+
 
 class ElementHandlers(NamedTuple):
     """A convenience class."""
@@ -24,12 +34,14 @@ class ElementHandlers(NamedTuple):
     TAGS_TO_WARN: dict[str, str] | None
     TAGS_TO_SKIP: dict[str, tuple[str, str]] | None
     extends: Sequence[str] | None
+    DISPATCH: Mapping[str, tuple[int, object]] | None
 
 
-ElementHandlers.__new__.__defaults__ = (None,) * 6  # https://stackoverflow.com/questions/11351032/
+ElementHandlers.__new__.__defaults__ = (None,) * 7  # https://stackoverflow.com/questions/11351032/
 
 __definitions__: dict[str, ElementHandlers] = {}
 __built__: dict[str, ElementHandlers] = {}
+__registry_version__: int = 0
 
 
 def register_iterator(  # noqa: PLR0913
@@ -46,26 +58,33 @@ def register_iterator(  # noqa: PLR0913
 
     This configuration also ignores orientation elements like bookmarks, comments, and permissions.
     """
+    global __registry_version__  # noqa: PLW0603
     if check_name and name in __definitions__:
         raise ValueError(f"iterator named '{name}' already registered")
+    __registry_version__ += 1
 
     __definitions__[name] = ElementHandlers(
         tags_to_yield, tags_to_nest, tags_to_ignore, tags_to_warn, tags_to_skip, extends=extends
     )
 
 
-def build_iterators() -> None:
-    """Build the iterators for the current iteration."""
-    _resovled: list[str] = []
+def resolve_iterators(definitions: Mapping[str, ElementHandlers]) -> dict[str, ElementHandlers]:
+    """Resolve the ``extends`` graph of a set of iterator definitions."""
+    built: dict[str, ElementHandlers] = {}
 
     def _resolve(x: str) -> None:
-        if x in _resovled:
+        if x in built:
             return
 
-        xdef = __definitions__[x]
+        xdef = definitions[x]
         if not xdef.extends:
-            __built__[x] = xdef
-            _resovled.append(x)
+            built[x] = _compile_handlers(
+                xdef.TAGS_TO_YIELD or {},
+                xdef.TAGS_TO_NEST or {},
+                xdef.TAGS_TO_IGNORE or (),
+                xdef.TAGS_TO_WARN or {},
+                xdef.TAGS_TO_SKIP or {},
+            )
             return
 
         tags_to_yield = dict(xdef.TAGS_TO_YIELD) if xdef.TAGS_TO_YIELD else {}
@@ -81,7 +100,7 @@ def build_iterators() -> None:
                 msg = f"Iterator for '{x}' depends on undefined group '{dependency}'"
                 raise RuntimeError(msg) from err
 
-            ddef = __built__[dependency]
+            ddef = built[dependency]
             if ddef.TAGS_TO_YIELD:
                 tags_to_yield.update(ddef.TAGS_TO_YIELD)
             if ddef.TAGS_TO_NEST:
@@ -93,82 +112,313 @@ def build_iterators() -> None:
             if ddef.TAGS_TO_SKIP:
                 tags_to_skip.update(ddef.TAGS_TO_SKIP)
 
-        __built__[x] = ElementHandlers(
-            TAGS_TO_YIELD=tags_to_yield,
-            TAGS_TO_NEST=tags_to_nest,
-            TAGS_TO_IGNORE=tags_to_ignore,
-            TAGS_TO_WARN=tags_to_warn,
-            TAGS_TO_SKIP=tags_to_skip,
+        built[x] = _compile_handlers(tags_to_yield, tags_to_nest, tags_to_ignore, tags_to_warn, tags_to_skip)
+
+    for name in definitions:
+        _resolve(name)
+    return built
+
+
+def _compile_handlers(
+    tags_to_yield: dict[str, type[el]],
+    tags_to_nest: dict[str, str],
+    tags_to_ignore: Sequence[str],
+    tags_to_warn: dict[str, str],
+    tags_to_skip: dict[str, tuple[str, str]],
+) -> ElementHandlers:
+    """Build resolved handlers with a single tag -> (action, argument) table.
+
+    The table encodes the precedence of the individual handler groups (yield,
+    nest, warn, ignore, skip) so that ``xml_iter`` needs one lookup per node.
+    """
+    dispatch: dict[str, tuple[int, object]] = {}
+    for tag, data in tags_to_skip.items():
+        dispatch[tag] = (_SKIP, data)
+    for tag in tags_to_ignore:
+        dispatch[tag] = (_IGNORE, None)
+    for tag, message in tags_to_warn.items():
+        dispatch[tag] = (_WARN, message)
+    for tag, name in tags_to_nest.items():
+        dispatch[tag] = (_NEST, name)
+    for tag, cls in tags_to_yield.items():
+        if tag in tags_to_nest:
+            dispatch[tag] = (_YIELD_AND_NEST, (cls, tags_to_nest[tag]))
+        else:
+            dispatch[tag] = (_YIELD, cls)
+
+    return ElementHandlers(
+        TAGS_TO_YIELD=tags_to_yield,
+        TAGS_TO_NEST=tags_to_nest,
+        TAGS_TO_IGNORE=frozenset(tags_to_ignore),
+        TAGS_TO_WARN=tags_to_warn,
+        TAGS_TO_SKIP=tags_to_skip,
+        DISPATCH=MappingProxyType(dispatch),
+    )
+
+
+def build_iterators() -> None:
+    """Build the iterators for the current iteration."""
+    __built__.update(resolve_iterators(__definitions__))
+
+
+class IteratorPlan(Mapping[str, ElementHandlers]):
+    """An immutable, fully resolved set of iterator handlers.
+
+    Plans are compiled once per distinct options fingerprint (see
+    ``utils.set_options.compile_plan``) and reach ``xml_iter`` through the
+    ``ConversionContext``, in place of the global ``__built__`` registry.
+    """
+
+    __slots__ = ("_handlers", "fingerprint")
+
+    def __init__(self, handlers: Mapping[str, ElementHandlers], fingerprint: Hashable = None) -> None:
+        """Freeze the resolved handlers."""
+        self._handlers = MappingProxyType(dict(handlers))
+        self.fingerprint = fingerprint
+
+    def __getitem__(self, name: str) -> ElementHandlers:
+        """Return the handlers for the named iterator."""
+        return self._handlers[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the iterator names."""
+        return iter(self._handlers)
+
+    def __len__(self) -> int:
+        """Return the number of iterators in the plan."""
+        return len(self._handlers)
+
+    def __repr__(self) -> str:
+        """Represent the plan by its fingerprint."""
+        return f"IteratorPlan({self.fingerprint!r})"
+
+    def replace_classes(self, fun: Callable[[type[el]], type[el]], fingerprint: Hashable = None) -> "IteratorPlan":
+        """Return a copy of the plan which yields ``fun(cls)`` in place of each element class ``cls``."""
+        return IteratorPlan(
+            {
+                name: _compile_handlers(
+                    {tag: fun(cls) for tag, cls in handlers.TAGS_TO_YIELD.items()},
+                    handlers.TAGS_TO_NEST,
+                    handlers.TAGS_TO_IGNORE,
+                    handlers.TAGS_TO_WARN,
+                    handlers.TAGS_TO_SKIP,
+                )
+                for name, handlers in self._handlers.items()
+            },
+            fingerprint,
         )
 
-        _resovled.append(x)
 
-    for name in __definitions__:
-        _resolve(name)
+def registry_version() -> int:
+    """Return a counter which changes whenever an iterator is registered."""
+    return __registry_version__
 
 
-def xml_iter(p: xmlFragment, name: str, msg: str | None = None) -> Generator[el]:  # noqa: PLR0912
-    """Iterate over an XML node yielding an appropriate element (el)."""
-    handlers = __built__[name]
+def default_plan() -> Mapping[str, ElementHandlers]:
+    """Return the handlers used by ``xml_iter`` when it is not given a context.
+
+    This is the global registry once it has been built (e.g. by the legacy
+    ``set_options()``), and the plan for the default options otherwise.
+    """
+    if __built__:
+        return __built__
+    from .. import __default_options__  # noqa: PLC0415
+    from ..utils.set_options import compile_plan  # noqa: PLC0415
+
+    return compile_plan(__default_options__)
+
+
+def xml_iter(  # noqa: PLR0912, PLR0915
+    p: xmlFragment,
+    name: str,
+    msg: str | None = None,
+    context: ConversionContext | None = None,
+    raw: frozenset[type[el]] = frozenset(),
+) -> Generator[el | xmlFragment]:
+    """Iterate over an XML node yielding an appropriate element (el).
+
+    Handlers are looked up in the plan of ``context`` when given, and in
+    ``default_plan()`` otherwise.  Yielded elements
+    carry the context so that their own children are iterated the same way.
+
+    Nodes which would be yielded as one of the ``raw`` element classes are
+    yielded as bare XML instead, letting the caller skip creating elements it
+    handles directly.
+
+    Nested groups (``TAGS_TO_NEST``) are iterated with an explicit stack
+    rather than recursively, so any depth of nesting is supported and each
+    element is yielded straight to the caller.
+    """
+    plan = default_plan() if context is None else context.plan
+    handlers = plan[name]
 
     # INIT PHASE
     children = p.getchildren()
     if not children:
         return
 
-    current: xmlFragment | None = p.getchildren()[0]
+    current: xmlFragment | None = children[0]
+    parent = p
+    # the ends of the skipped ranges of the current group (see ``index_ranges``)
+    ranges: dict[str, dict[xmlFragment, xmlFragment]] | None = None
+
+    # the nesting node, handlers, message and ranges of each enclosing group
+    stack: list[tuple[xmlFragment, ElementHandlers, str | None, dict | None]] = []
 
     # ITERATION PHASE
-    while current is not None:
-        if msg is not None and current.tag not in handlers.TAGS_TO_IGNORE:
-            print(msg + ("" if current.prefix is None else (current.prefix + ":")) + current.tag)
-
-        if handlers.TAGS_TO_YIELD and current.tag in handlers.TAGS_TO_YIELD:
-            # Yield all math tags
-            yield handlers.TAGS_TO_YIELD[current.tag](current)
-
-            if handlers.TAGS_TO_NEST and current.tag in handlers.TAGS_TO_NEST:
-                _msg = None if msg is None else ("  " + msg)
-                for elt in xml_iter(current, handlers.TAGS_TO_NEST[current.tag], _msg):
-                    yield elt
-
-        elif handlers.TAGS_TO_NEST and current.tag in handlers.TAGS_TO_NEST:
-            _msg = None if msg is None else ("  " + msg)
-            for elt in xml_iter(current, handlers.TAGS_TO_NEST[current.tag], _msg):
+    dispatch = handlers.DISPATCH
+    while True:
+        if current is None:
+            # END OF A GROUP: CONTINUE AFTER THE NODE WHICH NESTED IT
+            if not stack:
+                return
+            nesting = parent
+            parent, handlers, msg, ranges = stack.pop()
+            dispatch = handlers.DISPATCH
+            current = nesting.getnext()
+            continue
+
+        tag = current.tag
+        if msg is not None and tag not in handlers.TAGS_TO_IGNORE:
+            print(msg + ("" if current.prefix is None else (current.prefix + ":")) + tag)
+
+        action, arg = dispatch.get(tag, _UNEXPECTED)
+
+        if action == _YIELD:
+            if arg in raw:
+                yield current
+            else:
+                elt = arg(current)
+                if context is not None:
+                    elt.context = context
                 yield elt
 
-        elif handlers.TAGS_TO_WARN and current.tag in handlers.TAGS_TO_WARN:
-            # Skip these unhandled tags with a warning
-            warn(f"Skipping {handlers.TAGS_TO_WARN[current.tag]} tag: {current.tag}", stacklevel=2)
-
-        elif handlers.TAGS_TO_IGNORE and current.tag in handlers.TAGS_TO_IGNORE:
+        elif action == _NEST:
+            nested = current.getchildren()
+            if nested:
+                stack.append((parent, handlers, msg, ranges))
+                parent, ranges = current, None
+                handlers = plan[arg]
+                dispatch = handlers.DISPATCH
+                msg = None if msg is None else ("  " + msg)
+                current = nested[0]
+                continue
+
+        elif action == _IGNORE:
             # ignore paragraph properties, deleted content and meta tags
             # like bookmarks, permissions, comments, etc.
             pass
 
-        elif handlers.TAGS_TO_SKIP and current.tag in handlers.TAGS_TO_SKIP:
+        elif action == _YIELD_AND_NEST:
+            elt = arg[0](current)
+            if context is not None:
+                elt.context = context
+            yield elt
+
+            nested = current.getchildren()
+            if nested:
+                stack.append((parent, handlers, msg, ranges))
+                parent, ranges = current, None
+                handlers = plan[arg[1]]
+                dispatch = handlers.DISPATCH
+                msg = None if msg is None else ("  " + msg)
+                current = nested[0]
+                continue
+
+        elif action == _WARN:
+            # Skip these unhandled tags with a warning
+            warn(f"Skipping {arg} tag: {tag}", stacklevel=2)
+
+        elif action == _SKIP:
             # Skip over content that has been moved elsewhere
-            data = handlers.TAGS_TO_SKIP[current.tag]
-            current = skip_range(current, data[0], data[1])
+            if ranges is None:
+                ranges = {}
+            if tag not in ranges:
+                ranges[tag] = index_ranges(parent, tag, *arg)
+            current = ranges[tag].get(current)
             if current is None:
-                return
+                continue
 
         else:
-            warn(f"Skipping unexpected tag: {current.tag}", UnexpectedElementWarning, stacklevel=2)
+            warn(f"Skipping unexpected tag: {tag}", UnexpectedElementWarning, stacklevel=2)
 
         current = current.getnext()
 
-    return
+
+def iter_stream(
+    nodes: Iterable[xmlFragment], name: str, context: ConversionContext | None = None
+) -> Generator[el]:
+    """Iterate over sibling XML nodes as they become available, like ``xml_iter``.
+
+    Used when the siblings following the current node may not have been
+    parsed yet (see ``reader``): nested groups are iterated with ``xml_iter``
+    but skipped ranges are dropped node by node instead of via ``skip_range``.
+    """
+    handlers = (default_plan() if context is None else context.plan)[name]
+    dispatch = handlers.DISPATCH
+    skipping: tuple[str, str, str] | None = None
+
+    for current in nodes:
+        if skipping is not None:
+            if _ends_range(current, *skipping):
+                skipping = None
+            continue
+
+        action, arg = dispatch.get(current.tag, _UNEXPECTED)
+
+        if action in {_YIELD, _YIELD_AND_NEST}:
+            elt = (arg if action == _YIELD else arg[0])(current)
+            if context is not None:
+                elt.context = context
+            yield elt
+
+        if action in {_NEST, _YIELD_AND_NEST}:
+            yield from xml_iter(current, arg if action == _NEST else arg[1], context=context)
+
+        elif action == _WARN:
+            warn(f"Skipping {arg} tag: {current.tag}", stacklevel=2)
+
+        elif action == _SKIP:
+            skipping = (arg[0], arg[1], current.get(arg[0]))
+
+        elif action == _UNEXPECTED[0]:
+            warn(f"Skipping unexpected tag: {current.tag}", UnexpectedElementWarning, stacklevel=2)
+
+
+def index_ranges(
+    parent: xmlFragment, start_tag: str, id_attr: str, waitfor: str
+) -> dict[xmlFragment, xmlFragment]:
+    """Map each range start among the children of ``parent`` to the end of its range.
+
+    Like ``skip_range``, a range ends at the next ``waitfor`` sibling with the
+    same id; starts without an end are left out.  Building the index once per
+    group makes each skip a lookup rather than a scan of the siblings.
+    """
+    out: dict[xmlFragment, xmlFragment] = {}
+    # id -> the starts waiting for their end
+    pending: dict[str | None, list[xmlFragment]] = {}
+    for child in parent.iterchildren(start_tag, waitfor):
+        if child.tag == start_tag:
+            pending.setdefault(child.get(id_attr), []).append(child)
+        else:
+            for start in pending.pop(child.get(id_attr), ()):
+                out[start] = child
+    return out
 
 
 def skip_range(x: xmlFragment, id_attr: str, waitfor: str) -> xmlFragment | None:
     """Return the element at the end of the range."""
-    _id: str = x.attrib[id_attr]
+    _id: str | None = x.get(id_attr)
     current: xmlFragment | None = x.getnext()
 
     while True:
         if current is None:
             return current
-        if get_tag(current).tag == waitfor and current.attrib[id_attr] == _id:
+        if _ends_range(current, id_attr, waitfor, _id):
             return current
         current = current.getnext()
+
+
+def _ends_range(x: xmlFragment, id_attr: str, waitfor: str, _id: str) -> bool:
+    """Test if the element is the end of the range with the given id."""
+    return x.tag == waitfor and x.get(id_attr) == _id
@@ -0,0 +1,243 @@
+"""Simplify ``.docx`` files straight from the zip archive.
+
+This is an alternate front end to ``simplify()`` which does not build a
+``python-docx`` ``Document``.  The main document part is streamed with an
+``lxml`` pull parser (using python-docx's element classes, so the same
+element and iterator machinery applies); each top level block of the body is
+converted as soon as it has been parsed and its XML is released afterwards.
+Only the (small) styles and numbering parts are parsed up front.
+"""
+
+import os
+import posixpath
+import zipfile
+from collections.abc import Generator, Iterator, Mapping
+from io import BytesIO
+from typing import IO
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml.parser import element_class_lookup, parse_xml
+from lxml import etree
+
+from .types import xmlFragment
+
+# size of the chunks fed to the pull parser
+CHUNK_SIZE = 1 << 16
+
+_REL_TAG = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+
+class _Styles:
+    """Stand-in for ``docx.styles.styles.Styles``."""
+
+    def __init__(self, element: xmlFragment) -> None:
+        self.element = element
+
+
+class _NestedPart:
+    """Stand-in for a related part holding a nested document."""
+
+    def __init__(self, document: "ZipDocument", blob: bytes) -> None:
+        self.element = document
+        self.blob = blob
+
+
+class _Relationship:
+    """Stand-in for ``docx.opc.rel._Relationship``."""
+
+    def __init__(self, r_id: str, reltype: str, is_external: bool, related_parts: "_RelatedParts") -> None:
+        self.rId = r_id
+        self.reltype = reltype
+        self.is_external = is_external
+        self._related_parts = related_parts
+
+    @property
+    def target_part(self) -> _NestedPart:
+        """The (nested document) part targeted by the relationship."""
+        return self._related_parts[self.rId]
+
+
+class _RelatedParts(Mapping[str, _NestedPart]):
+    """Related parts of the main document, loaded on demand.
+
+    Like python-docx, relationships with the same target share one part.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, rels: dict[str, tuple[str, str, bool]]) -> None:
+        self._archive = archive
+        self._rels = rels
+        self._loaded: dict[str, _NestedPart] = {}
+
+    def __getitem__(self, r_id: str) -> _NestedPart:
+        _type, target, external = self._rels[r_id]
+        if external:
+            raise KeyError(f"relationship '{r_id}' targets the external resource '{target}'")
+        if target not in self._loaded:
+            data = self._archive.read(target)
+            if not zipfile.is_zipfile(BytesIO(data)):
+                raise ValueError(f"related part '{target}' is not a .docx package")
+            self._loaded[target] = _NestedPart(ZipDocument.load(BytesIO(data)), data)
+        return self._loaded[target]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rels)
+
+    def __len__(self) -> int:
+        return len(self._rels)
+
+
+class _DocumentPart:
+    """Stand-in for ``docx.parts.document.DocumentPart``."""
+
+    def __init__(
+        self, numbering: xmlFragment, related_parts: _RelatedParts, rels: dict[str, tuple[str, str, bool]]
+    ) -> None:
+        self.numbering_part = _Styles(numbering)
+        self.related_parts = related_parts
+        self.rels = {
+            r_id: _Relationship(r_id, _type, external, related_parts)
+            for r_id, (_type, _, external) in rels.items()
+        }
+
+
+class ZipDocument:
+    """The parts of a ``.docx`` package needed by the element classes.
+
+    Provides the attributes of a ``python-docx`` ``Document`` which are used
+    during conversion (``element``, ``styles`` and ``part``).  The main
+    document element is only parsed (in full) when ``element`` is accessed;
+    ``iter_file_blocks`` streams it instead.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile) -> None:
+        """Read the package relationships, styles and numbering parts."""
+        self.archive = archive
+        package_rels = _read_rels(archive, "")
+        self.main_part = next(target for _type, target, _ in package_rels.values() if _type == RT.OFFICE_DOCUMENT)
+        rels = _read_rels(archive, self.main_part)
+        by_type = {_type: target for _type, target, external in rels.values() if not external}
+
+        self.styles = _Styles(_read_part(archive, by_type.get(RT.STYLES), "styles"))
+        self.part = _DocumentPart(
+            _read_part(archive, by_type.get(RT.NUMBERING), "numbering"), _RelatedParts(archive, rels), rels
+        )
+        self._element: xmlFragment | None = None
+
+    @classmethod
+    def load(cls, source: str | os.PathLike | IO[bytes]) -> "ZipDocument":
+        """Open a ``.docx`` file (or file-like object)."""
+        return cls(zipfile.ZipFile(source))
+
+    @property
+    def element(self) -> xmlFragment:
+        """The fully parsed ``w:document`` element."""
+        if self._element is None:
+            self._element = parse_xml(self.archive.read(self.main_part))
+        return self._element
+
+    def iter_body(self) -> "_BodyStream":
+        """Stream the top level children of the document body."""
+        return _BodyStream(self.archive, self.main_part)
+
+
+class _BodyStream:
+    """Yields each child of ``w:body`` once it has been completely parsed."""
+
+    def __init__(self, archive: zipfile.ZipFile, part_name: str) -> None:
+        self._archive = archive
+        self._part_name = part_name
+        self._yielded: list[xmlFragment] = []
+
+    def __iter__(self) -> Generator[xmlFragment]:
+        parser = etree.XMLPullParser(events=("start", "end"), remove_blank_text=True, resolve_entities=False)
+        parser.set_element_class_lookup(element_class_lookup)
+        body_tag = qn("w:body")
+        depth = 0
+        in_body = False
+        with self._archive.open(self._part_name) as stream:
+            while chunk := stream.read(CHUNK_SIZE):
+                parser.feed(chunk)
+                for event, node in parser.read_events():
+                    if event == "start":
+                        depth += 1
+                        if depth == 2 and node.tag == body_tag:  # noqa: PLR2004
+                            in_body = True
+                        continue
+                    depth -= 1
+                    if in_body and depth == 2:  # noqa: PLR2004
+                        self._yielded.append(node)
+                        yield node
+                    elif depth == 1:
+                        in_body = False
+        parser.close()
+
+    def release(self) -> None:
+        """Free every yielded node except the most recent one.
+
+        The most recent node may still be held by a look-ahead; all earlier
+        nodes have been fully converted.
+        """
+        for node in self._yielded[:-1]:
+            node.clear()
+            parent = node.getparent()
+            if parent is not None:
+                parent.remove(node)
+        del self._yielded[:-1]
+
+
+def iter_file_blocks(
+    source: str | os.PathLike | IO[bytes], options: dict[str, object] | None = None
+) -> Iterator[dict[str, object]]:
+    """Yield the JSON of each top level block of a ``.docx`` file's body.
+
+    Equivalent to ``iter_simplified_blocks(docx.Document(source), options)``,
+    but streams the main document part directly out of the zip archive.
+    """
+    from . import _new_context  # noqa: PLC0415
+    from .elements.body import iter_blocks  # noqa: PLC0415
+    from .iterators.generic import iter_stream  # noqa: PLC0415
+
+    with _new_context(options) as context, zipfile.ZipFile(source) as archive:
+        doc = ZipDocument(archive)
+        nodes = doc.iter_body()
+        for block in iter_blocks(iter_stream(nodes, "CT_Body", context), doc, context):
+            nodes.release()
+            yield block
+
+
+def simplify_file(
+    source: str | os.PathLike | IO[bytes], options: dict[str, object] | None = None
+) -> dict[str, object]:
+    """Coerce a ``.docx`` file to JSON without loading it with python-docx.
+
+    Equivalent to ``simplify(docx.Document(source), options)``.
+    """
+    from .utils.friendly_names import type_name  # noqa: PLC0415
+
+    names = {"friendly-name": (options or {}).get("friendly-name", True)}
+    body = {"TYPE": type_name("CT_Body", names), "VALUE": list(iter_file_blocks(source, options))}
+    return {"TYPE": type_name("CT_Document", names), "VALUE": [body]}
+
+
+def _read_part(archive: zipfile.ZipFile, name: str | None, root: str) -> xmlFragment:
+    """Parse a (small) part, or return an empty root element if it is missing."""
+    if name is None or name not in archive.namelist():
+        return parse_xml(f"<w:{root} {nsdecls('w')}/>")
+    return parse_xml(archive.read(name))
+
+
+def _read_rels(archive: zipfile.ZipFile, part_name: str) -> dict[str, tuple[str, str, bool]]:
+    """Read the relationships of a part as ``rId -> (type, target, external)``."""
+    directory, name = posixpath.split(part_name)
+    rels_name = posixpath.join(directory, "_rels", f"{name}.rels")
+    if rels_name not in archive.namelist():
+        return {}
+    out: dict[str, tuple[str, str, bool]] = {}
+    for rel in etree.fromstring(archive.read(rels_name)).iter(_REL_TAG):
+        external = rel.get("TargetMode") == "External"
+        target = rel.get("Target")
+        if not external:
+            target = posixpath.normpath(posixpath.join(directory, target)).lstrip("/")
+        out[rel.get("Id")] = (rel.get("Type"), target, external)
+    return out
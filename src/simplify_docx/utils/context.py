@@ -0,0 +1,132 @@
+"""The state carried through a single conversion."""
+
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import Executor
+from copy import deepcopy
+from types import TracebackType
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from .profile import Profile
+
+T = TypeVar("T")
+
+
+class ConversionContext(dict):
+    """The effective options of one conversion, plus its compiled iterator plan.
+
+    A context is created for every call to ``simplify()`` and passed to each
+    ``to_json`` in place of the bare options dict (so ``options.get(...)``
+    keeps working), and is carried by every element yielded from
+    ``xml_iter``.  Nothing in it is shared between conversions, which makes
+    concurrent calls with different options safe.
+
+    Used as a context manager, the worker pools created for the conversion
+    (see ``pool``) are shut down on exit.
+    """
+
+    __slots__ = ("_indexes", "_nested", "_pools", "_raw_names", "plan", "profile")
+
+    plan: Mapping[str, object]
+
+    def __init__(
+        self, options: Mapping[str, object], plan: Mapping[str, object], profile: "Profile | None" = None
+    ) -> None:
+        """Bind the options to the iterator plan compiled for them."""
+        super().__init__(options)
+        self.plan = plan
+        self.profile = profile
+        self._indexes: dict[tuple[Callable, int], tuple[object, object]] = {}
+        self._nested: dict[int, tuple[object, object]] = {}
+        self._pools: dict[Hashable, Executor] = {}
+        self._raw_names: ConversionContext | None = None
+
+    def __enter__(self) -> "ConversionContext":
+        """Return this context."""
+        return self
+
+    def __exit__(
+        self, _type: type[BaseException] | None, _value: BaseException | None, _traceback: TracebackType | None
+    ) -> None:
+        """Shut down the pools of this conversion."""
+        self.close()
+
+    def raw_names(self) -> "ConversionContext":
+        """Return this context with friendly names turned off.
+
+        The derived context shares the plan, profile, indexes and pools of
+        this conversion, and is created once.
+        """
+        if not self.get("friendly-name", False):
+            return self
+        if self._raw_names is None:
+            raw = ConversionContext(dict(self, **{"friendly-name": False}), self.plan, self.profile)
+            raw._indexes = self._indexes
+            raw._pools = self._pools
+            self._raw_names = raw
+        return self._raw_names
+
+    def index(self, factory: Callable[..., T], doc: object, *args: object) -> T:
+        """Return ``factory(doc, *args)``, built once per document for this conversion."""
+        key = (factory, id(doc))
+        try:
+            return self._indexes[key][1]
+        except KeyError:
+            if self.profile is None:
+                value = factory(doc, *args)
+            else:
+                with self.profile.phase(factory.__name__):
+                    value = factory(doc, *args)
+            # keep a reference to the document so that its id is not reused
+            self._indexes[key] = (doc, value)
+            return value
+
+    def pool(self, key: Hashable, factory: Callable[[], Executor]) -> Executor:
+        """Return ``factory()``, created once per ``key`` for this conversion."""
+        try:
+            return self._pools[key]
+        except KeyError:
+            pool = self._pools[key] = factory()
+            return pool
+
+    def close(self) -> None:
+        """Shut down the pools of this conversion, waiting for their workers to exit."""
+        while self._pools:
+            _, pool = self._pools.popitem()
+            pool.shutdown(wait=True)
+
+    def nested(self, part: object, convert: Callable[[], T]) -> T | None:
+        """Return ``convert()``, called once per related part for this conversion.
+
+        Repeated requests for a part return a deep copy of its value, so the
+        output never holds the same object twice.  Returns ``None`` if
+        ``part`` is already being converted, i.e. if it (indirectly) contains
+        itself.
+        """
+        key = id(part)
+        if key in self._nested:
+            value = self._nested[key][1]
+            return None if value is _IN_PROGRESS else deepcopy(value)
+        self._nested[key] = (part, _IN_PROGRESS)
+        try:
+            value = convert()
+        except BaseException:
+            del self._nested[key]
+            raise
+        self._nested[key] = (part, value)
+        return value
+
+
+def worker_options(options: Mapping[str, object], overrides: Mapping[str, object]) -> dict[str, object]:
+    """Return the options to send to a worker: ``options`` updated with ``overrides``.
+
+    Executors supplied by the caller stay behind, as they cannot be pickled
+    (and the workers convert serially anyway).
+    """
+    out = {key: value for key, value in options.items() if not isinstance(value, Executor)}
+    out.update(overrides)
+    return out
+
+
+# marks a nested part whose conversion has not finished yet
+_IN_PROGRESS = object()
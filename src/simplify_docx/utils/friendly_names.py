@@ -1,10 +1,43 @@
 """Utilities for applying friendly names."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+
+from .context import ConversionContext
+
+
+def type_name(name: str, options: Mapping[str, object]) -> str:
+    """Get the ``TYPE`` emitted for an element type.
+
+    Elements name themselves as they are coerced to JSON, so no second pass
+    over the output is needed (see ``raw_names`` for the parts which keep
+    their raw names).  When ``to_json`` is called directly (rather
+    than via ``simplify()``) friendly names are off unless requested.
+    """
+    if options.get("friendly-name", False):
+        return __friendly_names__.get(name, name)
+    return name
+
+
+def raw_names(options: Mapping[str, object]) -> Mapping[str, object]:
+    """Get the options for converting the parts of an element outside its ``VALUE``.
+
+    Friendly names only apply to the ``VALUE`` children of the document (the
+    nodes ``apply_friendly_names`` reaches): payloads such as a paragraph's
+    ``style`` or a form field's ``ffData`` keep their raw ``TYPE``.
+    """
+    if not options.get("friendly-name", False):
+        return options
+    if isinstance(options, ConversionContext):
+        return options.raw_names()
+    return dict(options, **{"friendly-name": False})
 
 
 def apply_friendly_names(x: dict[str, object]) -> None:
-    """Apply friendly names to a simplified document tree."""
+    """Apply friendly names to a simplified document tree.
+
+    ``simplify()`` emits friendly names directly; this is for trees produced
+    with ``{"friendly-name": False}``.
+    """
     _walk(x, _apply_friendly_names)
 
 
@@ -39,14 +72,16 @@ def _apply_friendly_names(x: dict[str, object]) -> None:
 
 
 def _walk(x: dict[str, object], fun: Callable[[dict[str, object]], None]) -> None:
-    fun(x)
-    val = x.get("VALUE")
-    if not val:
-        return
-    if isinstance(val, dict) and val.get("TYPE", None):
-        # child is an element
-        _walk(val, fun)
-    if isinstance(val, list) and val[0].get("TYPE", None):
-        # child is a list of elements
-        for child in val:
-            _walk(child, fun)
+    stack = [x]
+    while stack:
+        node = stack.pop()
+        fun(node)
+        val = node.get("VALUE")
+        if not val:
+            continue
+        if isinstance(val, dict) and val.get("TYPE", None):
+            # child is an element
+            stack.append(val)
+        if isinstance(val, list) and val[0].get("TYPE", None):
+            # child is a list of elements
+            stack.extend(reversed(val))
@@ -0,0 +1,101 @@
+"""Convert the nested documents of a document in a pool of workers.
+
+With the ``nested-part-workers`` option set, every altChunk and subDoc
+holding a ``.docx`` package is submitted to a thread or process pool (see
+``nested-part-pool``) as soon as the first of them is reached, and each
+``CT_Rel.to_json`` then waits for its own part, so the results are spliced
+back in document order.
+"""
+
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from .context import ConversionContext, worker_options
+
+# relationships whose targets may hold a nested .docx package
+NESTED_PART_TYPES: frozenset[str] = frozenset(
+    {RT.A_F_CHUNK, "http://schemas.openxmlformats.org/officeDocument/2006/relationships/subDocument"}
+)
+
+POOLS: dict[str, Callable[..., Executor]] = {
+    "process": ProcessPoolExecutor,
+    "thread": ThreadPoolExecutor,
+}
+
+
+def submit_nested_parts(doc: object, context: ConversionContext) -> dict[str, Future]:
+    """Submit each nested ``.docx`` package of ``doc`` for conversion; return the futures by rId.
+
+    Relationships sharing a target share a future.  Parts which are not
+    ``.docx`` packages are left to the serial path (which reports them).  If
+    ``nested-part-pool`` is an ``Executor`` it is used as is; otherwise the
+    pool is created once per conversion and shut down when it ends.
+    """
+    pool_option = context.get("nested-part-pool", "process")
+    if not isinstance(pool_option, Executor) and pool_option not in POOLS:
+        raise ValueError(
+            f"Unknown nested-part-pool '{pool_option}'; expected one of {sorted(POOLS)} or an Executor"
+        )
+    # nested documents are converted serially within the workers
+    options = worker_options(context, {"nested-part-workers": 0})
+
+    pool: Executor | None = None
+    by_part: dict[int, Future] = {}
+    futures: dict[str, Future] = {}
+    for r_id, rel in doc.part.rels.items():
+        if rel.is_external or rel.reltype not in NESTED_PART_TYPES:
+            continue
+        try:
+            part = rel.target_part
+        except (KeyError, ValueError):
+            continue
+        if id(part) not in by_part:
+            if not zipfile.is_zipfile(BytesIO(part.blob)):
+                continue
+            if pool is None:
+                pool = _pool(pool_option, context)
+            by_part[id(part)] = pool.submit(convert_package, part.blob, options)
+        futures[r_id] = by_part[id(part)]
+    return futures
+
+
+def nested_document(part: object) -> object:
+    """Return the document held by a related part.
+
+    Parts read by the zip reader provide it as their ``element``; for an
+    opaque python-docx ``Part`` the ``.docx`` package in its blob is loaded.
+    """
+    if hasattr(part, "element"):
+        return part.element
+    return load_package(part.blob)
+
+
+def load_package(blob: bytes) -> object:
+    """Load a nested ``.docx`` package with python-docx."""
+    import docx  # noqa: PLC0415
+
+    if not zipfile.is_zipfile(BytesIO(blob)):
+        raise ValueError("related part is not a .docx package")
+    return docx.Document(BytesIO(blob))
+
+
+def convert_package(blob: bytes, options: dict[str, object]) -> dict[str, object]:
+    """Convert a nested ``.docx`` package (in a worker), as the serial path does."""
+    from .. import _new_context  # noqa: PLC0415
+    from ..elements.document import convert_nested  # noqa: PLC0415
+
+    with _new_context(options) as context:
+        return convert_nested(load_package(blob), context, context)
+
+
+def _pool(pool_option: str | Executor, context: ConversionContext) -> Executor:
+    """Return the caller's executor, or the nested-part pool of this conversion."""
+    if isinstance(pool_option, Executor):
+        return pool_option
+    factory = partial(POOLS[pool_option], max_workers=context["nested-part-workers"])
+    return context.pool(("nested-parts", pool_option), factory)
@@ -1,32 +1,201 @@
 """Helpers for extracting paragraph indention levels."""
 
+from contextlib import suppress
+from typing import NamedTuple
 
-def get_p_style(p: object, doc: object) -> object | None:
+from docx.oxml.ns import qn
+
+from ..types import xmlFragment
+from .context import ConversionContext
+
+
+class StyleInfo(NamedTuple):
+    """The parts of a ``w:style`` definition used by the paragraph elements."""
+
+    element: xmlFragment
+    name: str | None
+    outline_level: int | None
+    ind: xmlFragment | None
+
+
+class StyleIndex:
+    """Paragraph styles of a document, indexed by ``styleId``.
+
+    Built with a single pass over the styles part, replacing an XPath search
+    of every style per styled paragraph.
+    """
+
+    def __init__(self, doc: object) -> None:
+        """Index the styles of the document."""
+        self.styles: dict[str, StyleInfo] = {}
+        for style in doc.styles.element.iterchildren(qn("w:style")):
+            style_id = style.get(qn("w:styleId"))
+            if style_id is None or style_id in self.styles:
+                continue
+            self.styles[style_id] = _style_info(style)
+
+    def get(self, style_id: str) -> StyleInfo | None:
+        """Look up a style by its ``styleId``."""
+        return self.styles.get(style_id)
+
+
+def _style_info(style: xmlFragment) -> StyleInfo:
+    """Read the parts of a ``w:style`` definition used by the paragraph elements."""
+    name_elem = style.find(qn("w:name"))
+    name = None if name_elem is None else name_elem.get(qn("w:val")) or None
+
+    outline_level = ind = None
+    ppr = style.find(qn("w:pPr"))
+    if ppr is not None:
+        ind = ppr.find(qn("w:ind"))
+        outline = ppr.find(qn("w:outlineLvl"))
+        if outline is not None:
+            with suppress(TypeError, ValueError):
+                outline_level = int(outline.get(qn("w:val")))
+
+    return StyleInfo(style, name, outline_level, ind)
+
+
+def style_index(doc: object, options: dict[str, object] | None = None) -> StyleIndex:
+    """Get the style index of a document, built once per conversion."""
+    if isinstance(options, ConversionContext):
+        return options.index(StyleIndex, doc)
+    return StyleIndex(doc)
+
+
+def find_style(doc: object, style_id: str) -> StyleInfo | None:
+    """Look up a single style by its ``styleId``, without indexing the styles."""
+    for style in doc.styles.element.iterchildren(qn("w:style")):
+        if style.get(qn("w:styleId")) == style_id:
+            return _style_info(style)
+    return None
+
+
+def lookup_style(doc: object, style_id: str, options: dict[str, object] | None = None) -> StyleInfo | None:
+    """Look up a style in the conversion's index, or directly without a ``ConversionContext``."""
+    if isinstance(options, ConversionContext):
+        return options.index(StyleIndex, doc).get(style_id)
+    return find_style(doc, style_id)
+
+
+def get_p_style(p: object, doc: object, styles: StyleIndex | None = None) -> object | None:
     """Get the referenced style element for a paragraph with a p.pPr.pStyle."""
     if getattr(p, "pPr", None) is not None and p.pPr.pStyle is not None:
-        return doc.styles.element.find(f"w:style[@w:styleId='{p.pPr.pStyle.val}']", doc.styles.element.nsmap)
+        style_id = p.pPr.pStyle.val
+        info = find_style(doc, style_id) if styles is None else styles.get(style_id)
+        return None if info is None else info.element
     return None
 
 
-def get_num_style(p: object, doc: object) -> object | None:
-    """Get the paragraph's numbering style."""
-    if getattr(p, "pPr", None) is not None and p.pPr.numPr is not None and p.pPr.numPr.numId is not None:
-        # the numbering style doc
-        np = doc.part.numbering_part
-        # the map between numbering id and the numbering style
-        num = np.element.find(f"w:num[@w:numId='{p.pPr.numPr.numId.val}']", np.element.nsmap)
-        if num is None or getattr(num, "abstractNumId", None) is None:
-            return None
-        _path = f"w:abstractNum[@w:abstractNumId='{num.abstractNumId.val}']"
-        # the numbering styles themselves
-        abstract_numbering = np.element.find(_path, np.element.nsmap)
-        if abstract_numbering is None:
-            return None
-        return abstract_numbering.find(f"w:lvl[@w:ilvl='{p.pPr.numPr.ilvl.val}']", np.element.nsmap)
+class NumberingIndex:
+    """Numbering levels of a document, indexed by ``(numId, ilvl)``.
+
+    Each ``w:num`` is resolved against its ``w:abstractNum`` once, with any
+    ``w:lvlOverride/w:lvl`` replacing the abstract definition of that level.
+    """
+
+    def __init__(self, doc: object) -> None:
+        """Index the numbering part of the document."""
+        numbering = doc.part.numbering_part.element
+
+        abstract: dict[str, dict[str, xmlFragment]] = {}
+        for abstract_num in numbering.iterchildren(qn("w:abstractNum")):
+            abstract.setdefault(abstract_num.get(qn("w:abstractNumId")), _levels(abstract_num))
+
+        self.levels: dict[tuple[str, str], xmlFragment] = {}
+        seen: set[str] = set()
+        for num in numbering.iterchildren(qn("w:num")):
+            num_id = num.get(qn("w:numId"))
+            abstract_num_id = num.find(qn("w:abstractNumId"))
+            if abstract_num_id is None or num_id in seen:
+                continue
+            seen.add(num_id)
+            levels = dict(abstract.get(abstract_num_id.get(qn("w:val")), {}))
+            for override in num.iterchildren(qn("w:lvlOverride")):
+                levels.update(_levels(override))
+            for ilvl, lvl in levels.items():
+                self.levels[num_id, ilvl] = lvl
+
+    def get(self, num_id: str, ilvl: str = "0") -> xmlFragment | None:
+        """Look up the ``w:lvl`` definition of a numbering level."""
+        return self.levels.get((num_id, ilvl))
+
+    def ind(self, num_id: str, ilvl: str = "0") -> xmlFragment | None:
+        """Look up the indentation (``w:pPr/w:ind``) of a numbering level."""
+        return _level_ind(self.levels.get((num_id, ilvl)))
+
+
+def _level_ind(lvl: xmlFragment | None) -> xmlFragment | None:
+    """Get the indentation (``w:pPr/w:ind``) of a ``w:lvl`` definition."""
+    if lvl is None:
+        return None
+    ppr = lvl.find(qn("w:pPr"))
+    return None if ppr is None else ppr.find(qn("w:ind"))
+
+
+def _levels(parent: xmlFragment) -> dict[str, xmlFragment]:
+    """Map ``w:ilvl`` to each ``w:lvl`` child (first occurrence wins)."""
+    out: dict[str, xmlFragment] = {}
+    for lvl in parent.iterchildren(qn("w:lvl")):
+        out.setdefault(lvl.get(qn("w:ilvl")), lvl)
+    return out
+
+
+def numbering_index(doc: object, options: dict[str, object] | None = None) -> NumberingIndex:
+    """Get the numbering index of a document, built once per conversion."""
+    if isinstance(options, ConversionContext):
+        return options.index(NumberingIndex, doc)
+    return NumberingIndex(doc)
+
+
+def find_num_level(doc: object, num_id: str, ilvl: str = "0") -> xmlFragment | None:
+    """Look up a single numbering level, resolved as by ``NumberingIndex``, without indexing the numbering."""
+    numbering = doc.part.numbering_part.element
+    for num in numbering.iterchildren(qn("w:num")):
+        abstract_num_id = num.find(qn("w:abstractNumId"))
+        if num.get(qn("w:numId")) == num_id and abstract_num_id is not None:
+            break
+    else:
+        return None
+
+    # the last override of the level wins
+    for override in reversed(list(num.iterchildren(qn("w:lvlOverride")))):
+        lvl = _levels(override).get(ilvl)
+        if lvl is not None:
+            return lvl
+
+    for abstract_num in numbering.iterchildren(qn("w:abstractNum")):
+        if abstract_num.get(qn("w:abstractNumId")) == abstract_num_id.get(qn("w:val")):
+            return _levels(abstract_num).get(ilvl)
     return None
 
 
-def get_paragraph_ind(p: object, doc: object) -> object | None:
+def lookup_num_level(
+    doc: object, num_id: str, ilvl: str = "0", options: dict[str, object] | None = None
+) -> xmlFragment | None:
+    """Look up a numbering level in the conversion's index, or directly without a ``ConversionContext``."""
+    if isinstance(options, ConversionContext):
+        return options.index(NumberingIndex, doc).get(num_id, ilvl)
+    return find_num_level(doc, num_id, ilvl)
+
+
+def _num_key(p: object) -> tuple[str, str] | None:
+    """Get the ``(numId, ilvl)`` of a paragraph's direct numbering properties."""
+    if getattr(p, "pPr", None) is None or p.pPr.numPr is None or p.pPr.numPr.numId is None:
+        return None
+    ilvl = p.pPr.numPr.ilvl
+    return str(p.pPr.numPr.numId.val), "0" if ilvl is None else str(ilvl.val)
+
+
+def get_num_style(p: object, doc: object, numbering: NumberingIndex | None = None) -> object | None:
+    """Get the paragraph's numbering style."""
+    key = _num_key(p)
+    if key is None:
+        return None
+    return find_num_level(doc, *key) if numbering is None else numbering.get(*key)
+
+
+def get_paragraph_ind(p: object, doc: object, options: dict[str, object] | None = None) -> object | None:
     """Get the style according to the hierarchy listed in section 17.3.1.27.
 
     "pStyle (Referenced Paragraph Style)".
@@ -42,16 +211,14 @@ def get_paragraph_ind(p: object, doc: object) -> object | None:
     if getattr(p, "pPr", None) is not None and p.pPr.ind is not None:
         return p.pPr.ind
 
-    num_style = get_num_style(p, doc)
-    if (
-        num_style is not None
-        and getattr(num_style, "pPr", None) is not None
-        and num_style.pPr is not None
-        and num_style.pPr.ind is not None
-    ):
-        return num_style.pPr.ind
-
-    p_style = get_p_style(p, doc)
-    if p_style is not None and p_style.pPr is not None and p_style.pPr.ind is not None:
-        return p_style.pPr.ind
+    key = _num_key(p)
+    if key is not None:
+        num_ind = _level_ind(lookup_num_level(doc, *key, options=options))
+        if num_ind is not None:
+            return num_ind
+
+    if getattr(p, "pPr", None) is not None and p.pPr.pStyle is not None:
+        info = lookup_style(doc, p.pPr.pStyle.val, options)
+        if info is not None:
+            return info.ind
     return None
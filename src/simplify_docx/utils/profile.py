@@ -0,0 +1,127 @@
+"""Optional timing instrumentation for ``simplify()``."""
+
+from collections import Counter, defaultdict
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from functools import cache, lru_cache
+from time import perf_counter
+
+from ..elements.base import el
+from ..elements.run_contents import text
+from ..iterators.generic import IteratorPlan, registry_version
+from .set_options import PLAN_OPTIONS, _compile_plan
+
+
+class Profile:
+    """Wall time per phase, and per element class, of one or more conversions.
+
+    Pass an instance to ``simplify(doc, options, profile=...)``.  Phases are:
+
+    * ``options``: merging the options and compiling the iterator plan
+    * ``convert``: coercing the document to JSON, which includes every
+      element's ``to_json`` (and the friendly names, which are emitted there)
+    * ``StyleIndex`` / ``NumberingIndex``: building the style and numbering
+      indexes (the paragraph style resolution)
+
+    For every element class yielded by the iterators (and the document root),
+    ``elements`` holds the number of ``to_json`` calls and the time spent in
+    them, both including (``inclusive``) and excluding (``exclusive``) nested
+    elements.  Form fields are assembled by ``fldChar.to_json``.  Text nodes
+    are converted in bulk by their paragraph, so their time is part of the
+    paragraph's.
+
+    If ``sink`` is given it is called with the profile at the end of each
+    conversion.  Without a profile no instrumentation is installed.
+    """
+
+    def __init__(self, sink: Callable[["Profile"], None] | None = None) -> None:
+        """Start an empty profile."""
+        self.sink = sink
+        self.phases: dict[str, float] = defaultdict(float)
+        self.counts: Counter[str] = Counter()
+        self.inclusive: dict[str, float] = defaultdict(float)
+        self.exclusive: dict[str, float] = defaultdict(float)
+        # time spent in nested to_json calls, one entry per active call
+        self._nested: list[float] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None]:
+        """Time a phase of the conversion."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += perf_counter() - start
+
+    def finish(self) -> None:
+        """Hand the profile to the sink, if any."""
+        if self.sink is not None:
+            self.sink(self)
+
+    def report(self) -> dict[str, object]:
+        """Summarize the profile as a JSON-able dict."""
+        return {
+            "phases": dict(self.phases),
+            "elements": {
+                name: {
+                    "count": self.counts[name],
+                    "inclusive": self.inclusive[name],
+                    "exclusive": self.exclusive[name],
+                }
+                for name in sorted(self.counts, key=self.exclusive.__getitem__, reverse=True)
+            },
+        }
+
+    def __str__(self) -> str:
+        """Format the profile as a table."""
+        lines = [f"{'phase':<28} {'seconds':>10}"]
+        lines.extend(f"{name:<28} {seconds:>10.4f}" for name, seconds in self.phases.items())
+        lines.append(f"\n{'element':<28} {'count':>8} {'inclusive':>10} {'exclusive':>10}")
+        for name, data in self.report()["elements"].items():
+            lines.append(f"{name:<28} {data['count']:>8} {data['inclusive']:>10.4f} {data['exclusive']:>10.4f}")
+        return "\n".join(lines)
+
+
+def profiled(cls: type[el]) -> type[el]:
+    """Return a subclass of ``cls`` whose ``to_json`` is timed (``text`` is left alone)."""
+    if cls is text:
+        return cls
+    return _instrumented(cls)
+
+
+@cache
+def _instrumented(cls: type[el]) -> type[el]:
+    """Subclass ``cls`` with a timed ``to_json``."""
+    name = cls.__qualname__
+    to_json = cls.to_json
+
+    def timed_to_json(
+        self: el, doc: object, options: dict[str, object], super_iter: Iterator | None = None
+    ) -> dict[str, object]:
+        profile: Profile = options.profile
+        profile._nested.append(0.0)
+        start = perf_counter()
+        try:
+            return to_json(self, doc, options, super_iter)
+        finally:
+            elapsed = perf_counter() - start
+            nested = profile._nested.pop()
+            if profile._nested:
+                profile._nested[-1] += elapsed
+            profile.counts[name] += 1
+            profile.inclusive[name] += elapsed
+            profile.exclusive[name] += elapsed - nested
+
+    return type(name, (cls,), {"__slots__": (), "__module__": cls.__module__, "to_json": timed_to_json})
+
+
+def compile_profiled_plan(options: dict[str, object]) -> IteratorPlan:
+    """Return the (cached) iterator plan for the options, yielding ``profiled`` classes."""
+    fingerprint = tuple(bool(options[key]) for key in PLAN_OPTIONS)
+    return _profiled_plan(fingerprint, registry_version())
+
+
+@lru_cache(maxsize=32)
+def _profiled_plan(fingerprint: tuple[bool, ...], version: int) -> IteratorPlan:
+    """Instrument the plan compiled for an options fingerprint."""
+    return _compile_plan(fingerprint, version).replace_classes(profiled, ("profiled", *fingerprint))
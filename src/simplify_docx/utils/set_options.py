@@ -1,19 +1,62 @@
 """Utilities for setting options that change how the document is traversed."""
 
+from collections.abc import Mapping
+from functools import lru_cache
+
 from docx.oxml.ns import qn
 
 from ..elements import customXml, el, empty, fldSimple, hyperlink, subDoc
-from ..iterators.generic import build_iterators, register_iterator
+from ..iterators import generic
+from ..iterators.generic import (
+    ElementHandlers,
+    IteratorPlan,
+    build_iterators,
+    registry_version,
+    resolve_iterators,
+)
+
+# The options which change the shape of the iterator definitions
+PLAN_OPTIONS: tuple[str, ...] = (
+    "flatten-simpleField",
+    "flatten-hyperlink",
+    "flatten-smartTag",
+    "flatten-customXml",
+)
+
+
+def set_options(options: Mapping[str, str | bool | int | float]) -> None:
+    """Register iterators depending on the selected options.
+
+    This mutates the global iterator registry; ``simplify()`` uses
+    :func:`compile_plan` instead.
+    """
+    generic.__definitions__.update(_option_definitions(options))
+    build_iterators()
 
 
-def set_options(options: dict[str, str | bool | int | float]) -> None:
-    """Register iterators depending on the selected options."""
-    _set_eg_p_contents(options)
-    _set_eg_content_run_contents(options)
-    build_iterators()
+def compile_plan(options: Mapping[str, str | bool | int | float]) -> IteratorPlan:
+    """Return the (cached) iterator plan for the selected options."""
+    fingerprint = tuple(bool(options[key]) for key in PLAN_OPTIONS)
+    return _compile_plan(fingerprint, registry_version())
+
+
+@lru_cache(maxsize=32)
+def _compile_plan(fingerprint: tuple[bool, ...], _version: int) -> IteratorPlan:
+    """Resolve the registered iterators against one options fingerprint."""
+    definitions = dict(generic.__definitions__)
+    definitions.update(_option_definitions(dict(zip(PLAN_OPTIONS, fingerprint, strict=True))))
+    return IteratorPlan(resolve_iterators(definitions), fingerprint)
+
+
+def _option_definitions(options: Mapping[str, str | bool | int | float]) -> dict[str, ElementHandlers]:
+    """Build the option dependent iterator definitions."""
+    return {
+        "EG_PContent": _eg_p_contents(options),
+        "EG_ContentRunContents": _eg_content_run_contents(options),
+    }
 
 
-def _set_eg_p_contents(options: dict[str, str | bool | int | float]) -> None:
+def _eg_p_contents(options: Mapping[str, str | bool | int | float]) -> ElementHandlers:
     """group:"EG_PContent"."""
     tags_to_yield: dict[str, type[el]] = {qn("w:subDoc"): subDoc}
 
@@ -32,17 +75,15 @@ def _set_eg_p_contents(options: dict[str, str | bool | int | float]) -> None:
         tags_to_yield[qn("w:hyperlink")] = hyperlink
 
     # -----------------------------------------------
-    register_iterator(
-        "EG_PContent",
-        tags_to_yield=tags_to_yield,
-        tags_to_nest=tags_to_nest,
-        tags_to_ignore=[qn("w:customXmlPr"), qn("w:smartTagPr")],
+    return ElementHandlers(
+        TAGS_TO_YIELD=tags_to_yield,
+        TAGS_TO_NEST=tags_to_nest,
+        TAGS_TO_IGNORE=[qn("w:customXmlPr"), qn("w:smartTagPr")],
         extends=["EG_RunLevelElts"],
-        check_name=False,
     )
 
 
-def _set_eg_content_run_contents(options: dict[str, str | bool | int | float]) -> None:
+def _eg_content_run_contents(options: Mapping[str, str | bool | int | float]) -> ElementHandlers:
     """group: EG_ContentRunContent."""
     tags_to_yield: dict[str, type[el]] = {qn("w:sdt"): empty}
 
@@ -61,14 +102,12 @@ def _set_eg_content_run_contents(options: dict[str, str | bool | int | float]) -
         tags_to_yield[qn("w:customXml")] = customXml
 
     # -----------------------------------------------
-    register_iterator(
-        "EG_ContentRunContents",
-        tags_to_yield=tags_to_yield,
-        tags_to_nest=tags_to_nest,
-        tags_to_warn={
+    return ElementHandlers(
+        TAGS_TO_YIELD=tags_to_yield,
+        TAGS_TO_NEST=tags_to_nest,
+        TAGS_TO_WARN={
             qn("w:dir"): "Ignoring text-direction tags",
             qn("w:bdo"): "Ignoring text-direction tags",
         },
         extends=["EG_RunLevelElts"],
-        check_name=False,
     )
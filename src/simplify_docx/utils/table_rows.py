@@ -0,0 +1,110 @@
+"""Convert the rows of large tables in a pool of worker processes.
+
+With the ``table-row-workers`` option set, a table with at least
+``table-row-threshold`` rows has its rows serialized and split into
+contiguous batches, which are converted by worker processes and reassembled
+in order.  Each worker is given the document's styles and numbering, which
+is all a row needs; rows holding nested documents (altChunks, subDocs,
+content parts) need the document's related parts and stay in the main
+process.  The pool is started once per document and conversion, and shut
+down when the conversion ends.
+"""
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml.parser import parse_xml
+from lxml import etree
+
+from ..types import xmlFragment
+from .context import ConversionContext, worker_options
+
+# elements which are converted from a related part of the document
+NESTED_PART_TAGS: tuple[str, ...] = (qn("w:altChunk"), qn("w:subDoc"), qn("w:contentPart"))
+
+# batches per worker, so that uneven batches balance out
+BATCHES_PER_WORKER = 4
+
+# the document and context of a worker process, set by ``_init_worker``
+_worker: tuple[object, dict[str, object]] | None = None
+
+
+def can_convert_in_worker(row: xmlFragment) -> bool:
+    """Return True if the row does not refer to a related part of the document."""
+    return next(row.iter(*NESTED_PART_TAGS), None) is None
+
+
+def convert_rows_in_pool(rows: Sequence[xmlFragment], doc: object, options: dict[str, object]) -> list[dict]:
+    """Convert ``rows`` (``w:tr`` elements) in worker processes; return their JSON in order."""
+    workers: int = options["table-row-workers"]
+    size = -(-len(rows) // (workers * BATCHES_PER_WORKER))
+    batches = [[etree.tostring(row) for row in rows[start : start + size]] for start in range(0, len(rows), size)]
+
+    if isinstance(options, ConversionContext):
+        pool = options.pool(("table-rows", doc.part), partial(_row_pool, doc, options))
+        return list(chain.from_iterable(pool.map(_convert_batch, batches)))
+    with _row_pool(doc, options) as pool:
+        return list(chain.from_iterable(pool.map(_convert_batch, batches)))
+
+
+def _row_pool(doc: object, options: dict[str, object]) -> ProcessPoolExecutor:
+    """Start a pool of workers holding the styles and numbering of ``doc``."""
+    styles = etree.tostring(doc.styles.element)
+    # python-docx adds a numbering part when one is requested, so only ask if there is one
+    has_numbering = any(rel.reltype == RT.NUMBERING for rel in doc.part.rels.values())
+    numbering = etree.tostring(doc.part.numbering_part.element) if has_numbering else None
+    # tables nested in the rows are converted serially within the workers
+    initargs = (styles, numbering, worker_options(options, {"table-row-workers": 0}))
+    return ProcessPoolExecutor(
+        max_workers=options["table-row-workers"], initializer=_init_worker, initargs=initargs
+    )
+
+
+class _Part:
+    """Stand-in for a part (or the styles) of a document."""
+
+    def __init__(self, element: xmlFragment) -> None:
+        self.element = element
+
+
+class _DocumentPart:
+    """Stand-in for the main document part, without related parts."""
+
+    def __init__(self, numbering: xmlFragment) -> None:
+        self.numbering_part = _Part(numbering)
+        self.related_parts: dict[str, object] = {}
+        self.rels: dict[str, object] = {}
+
+
+class _RowDocument:
+    """Stand-in for the document of the rows converted by a worker."""
+
+    def __init__(self, styles: xmlFragment, numbering: xmlFragment) -> None:
+        self.styles = _Part(styles)
+        self.part = _DocumentPart(numbering)
+
+
+def _init_worker(styles: bytes, numbering: bytes | None, options: dict[str, object]) -> None:
+    """Rebuild the parts of the document needed by the rows."""
+    global _worker  # noqa: PLW0603
+    from .. import _new_context  # noqa: PLC0415
+
+    numbering_element = parse_xml(numbering or f"<w:numbering {nsdecls('w')}/>")
+    _worker = (_RowDocument(parse_xml(styles), numbering_element), _new_context(options))
+
+
+def _convert_batch(rows: list[bytes]) -> list[dict]:
+    """Convert a batch of serialized rows."""
+    from ..elements.table import tr  # noqa: PLC0415
+
+    doc, context = _worker
+    out = []
+    for xml in rows:
+        row = tr(parse_xml(xml))
+        row.context = context
+        out.append(row.to_json(doc, context))
+    return out
@@ -3,6 +3,7 @@
 import re
 from collections import namedtuple
 from collections.abc import Sequence
+from functools import lru_cache
 
 from ..types import xmlFragment
 
@@ -12,6 +13,9 @@ from ..types import xmlFragment
 
 Tag: tuple[str | None, str | None, str, str] = namedtuple("tag", ("namespace", "ns", "tag", "nstag"))
 
+# the number of (tag, namespace map) pairs remembered by ``get_tag``
+TAG_CACHE_SIZE = 4096
+
 
 # -------------------------------------------------------
 # ATTRIBUTE HANDLING
@@ -28,19 +32,59 @@ def get_attrs(el: xmlFragment, attrs: Sequence[str]) -> dict[str, str]:
 
 
 def get_tag(element: xmlFragment, nsdict: dict[str, str] | None = None) -> Tag:
-    """Extract parts of the tag (this is essentially the reverse of `qn()`)."""
-    ns_names: dict[str, str]
-    ns_names = NS_NAMES if nsdict is None else dict(zip(nsdict.values(), nsdict.keys(), strict=False))
-    match = _re_tag.match(element.tag)
+    """Extract parts of the tag (this is essentially the reverse of `qn()`).
+
+    Results are cached by tag string (and namespace map), as documents only
+    use a small vocabulary of tags.
+    """
+    if nsdict is None:
+        return _split_tag(element.tag, None)
+    return _split_tag(element.tag, _namespace_names(nsdict))
+
+
+class _NamespaceNames:
+    """The prefixes of the namespaces of a namespace map (hashed by identity)."""
+
+    __slots__ = ("names", "nsdict")
+
+    def __init__(self, ns_items: tuple[tuple[str, str], ...]) -> None:
+        self.nsdict: dict[str, str] = dict(ns_items)
+        self.names: dict[str, str] = {namespace: ns for ns, namespace in ns_items}
+
+
+# the namespace map most recently passed to ``get_tag``
+_last_names: _NamespaceNames | None = None
+
+
+def _namespace_names(nsdict: dict[str, str]) -> _NamespaceNames:
+    """Return the (shared) reverse of ``nsdict``."""
+    global _last_names  # noqa: PLW0603
+    names = _last_names
+    if names is None or names.nsdict != nsdict:
+        names = _last_names = _intern_namespace_names(tuple(nsdict.items()))
+    return names
+
+
+@lru_cache(maxsize=32)
+def _intern_namespace_names(ns_items: tuple[tuple[str, str], ...]) -> _NamespaceNames:
+    """Return one ``_NamespaceNames`` per distinct namespace map."""
+    return _NamespaceNames(ns_items)
+
+
+@lru_cache(maxsize=TAG_CACHE_SIZE)
+def _split_tag(tag_name: str, ns_names: _NamespaceNames | None) -> Tag:
+    """Split a Clark-notation tag, naming its namespace with ``ns_names`` (default: ``NS_SCHEMA``)."""
+    names = NS_NAMES if ns_names is None else ns_names.names
+    match = _re_tag.match(tag_name)
     if match is None:
-        return Tag(None, None, element.tag, element.tag)
+        return Tag(None, None, tag_name, tag_name)
     groups: Sequence[str] = match.groups()
     namespace: str = groups[0]
     tag: str = groups[1]
-    if namespace in ns_names:
-        ns: str = ns_names[namespace]
+    if namespace in names:
+        ns: str = names[namespace]
         return Tag(namespace, ns, tag, f"{ns}:{tag}")
-    return Tag(namespace, None, tag, element.tag)
+    return Tag(namespace, None, tag, tag_name)
 
 
 # -------------------------------------------------------
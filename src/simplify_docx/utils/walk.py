@@ -1,7 +1,8 @@
-"""A utility function for walking a simplified document."""
+"""Utility functions for walking a simplified document."""
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from inspect import signature
+from itertools import repeat
 
 
 def walk(  # noqa: PLR0912
@@ -40,12 +41,7 @@ def walk(  # noqa: PLR0912
         msg = f"Unexpected keyword arguments: {', '.join(sorted(kwargs))}"
         raise TypeError(msg)
 
-    _sig = signature(fun)
-    _params = _sig.parameters
-
-    has_multiple_parameters = len(_params) > 1 or any(
-        param.kind in (param.VAR_KEYWORD, param.VAR_POSITIONAL) for param in _params.values()
-    )
+    has_multiple_parameters = _takes_parent(fun)
 
     stack = [(document, None)]
     while True:
@@ -99,3 +95,89 @@ def walk(  # noqa: PLR0912
                 del nxt
 
         del current, index
+
+
+def walk_many(
+    document: dict[str, object],
+    visitors: Mapping[str | None, Callable[..., object] | Iterable[Callable[..., object]]],
+    no_iter: Sequence[str] | None = None,
+) -> list[object]:
+    """Apply several functions to a document tree in a single traversal.
+
+    :param document: Simplified Docx element to walk
+    :type document:object
+    :param visitors: A mapping from node ``TYPE``s to the function (or
+            functions) to apply at the nodes of that type.  Functions under
+            the key ``None`` are applied at every node.  Functions are called
+            like the ``fun`` of ``walk()``, with the current element and, if
+            they take more than one parameter, the containing element (the
+            ``VALUE`` list, or the containing element itself if the current
+            element is its ``VALUE``) and the position in that list (or
+            ``None``).
+    :type visitors: Mapping[str | None, Callable | Iterable[Callable]]
+    :param no_iter: Optional. A list of element ``TYPE``s into which the walker
+            should refrain from walking into.
+    :type no_iter: Sequence[str]
+
+    :return: For each function, in the order they were given, the first
+            value other than ``None`` that it returned, or ``None``.  A
+            function which returns a value is not called again, and the walk
+            stops once every function has returned a value.  A function given
+            more than once is a separate visitor (with its own result) each
+            time.
+    :return type: list[object]
+    """
+    # (position, function, takes a parent) triples to apply, by node type
+    dispatch: dict[str | None, list[tuple[int, Callable[..., object], bool]]] = {}
+    results: list[object] = []
+    # whether each function takes a parent, by id, for functions given more than once
+    takes_parent: dict[int, bool] = {}
+    for node_type, funs in visitors.items():
+        for fun in [funs] if callable(funs) else funs:
+            if id(fun) not in takes_parent:
+                takes_parent[id(fun)] = _takes_parent(fun)
+            dispatch.setdefault(node_type, []).append((len(results), fun, takes_parent[id(fun)]))
+            results.append(None)
+    remaining = len(results)
+    no_iter = frozenset(no_iter or ())
+
+    stack: list[tuple[dict[str, object], object, int | None]] = [(document, None, None)]
+    while stack and remaining:
+        current, parent, index = stack.pop()
+        current_type = current.get("TYPE", None)
+
+        for callbacks in (dispatch.get(current_type) if current_type is not None else None, dispatch.get(None)):
+            if not callbacks:
+                continue
+            for position, fun, takes_parent in callbacks:
+                if results[position] is not None:
+                    continue
+                out = fun(current, parent, index) if takes_parent else fun(current)
+                if out is not None:
+                    results[position] = out
+                    remaining -= 1
+                    _retire(position, dispatch)
+
+        val = current.get("VALUE", None)
+        if isinstance(val, dict) and current_type:
+            # CHILD IS AN ELEMENT TO BE WALKED
+            stack.append((val, current, None))
+        elif isinstance(val, list) and val and val[0].get("TYPE", None) and current_type not in no_iter:
+            # CHILDREN ARE A LIST OF ELEMENTS, PUSHED IN REVERSE TO BE VISITED IN ORDER
+            stack.extend(zip(reversed(val), repeat(val), range(len(val) - 1, -1, -1), strict=False))
+
+    return results
+
+
+def _retire(position: int, dispatch: dict[str | None, list[tuple[int, Callable[..., object], bool]]]) -> None:
+    """Stop applying the visitor at ``position``; the lists are replaced, as they may be being iterated over."""
+    for node_type, callbacks in dispatch.items():
+        dispatch[node_type] = [callback for callback in callbacks if callback[0] != position]
+
+
+def _takes_parent(fun: Callable[..., object]) -> bool:
+    """Return True if ``fun`` is to be passed the parent and position of each element."""
+    params = signature(fun).parameters
+    return len(params) > 1 or any(
+        param.kind in (param.VAR_KEYWORD, param.VAR_POSITIONAL) for param in params.values()
+    )
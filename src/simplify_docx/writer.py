@@ -0,0 +1,113 @@
+"""Write the simplified JSON of a document straight to a binary stream.
+
+``write_json()`` and ``write_file_json()`` serialize each top level block of
+the body as soon as it is converted, so the document is never held as one
+JSON tree and never walked a second time by ``json.dumps``.  The output
+decodes to exactly ``simplify(doc, options)`` (or, with ``ndjson=True``, to
+one line per item of ``iter_simplified_blocks(doc, options)``).
+
+The JSON is compact and UTF-8 encoded.  ``orjson`` is used when it is
+installed, and the standard library ``json`` module otherwise.
+"""
+
+import json
+import os
+from collections.abc import Iterable
+from typing import IO
+
+from .elements import body, document
+from .types.fragment import documentPart
+from .utils.friendly_names import type_name
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(value: object) -> bytes:
+    """Serialize ``value`` as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def write_json(
+    doc: documentPart, stream: IO[bytes], options: dict[str, object] | None = None, *, ndjson: bool = False
+) -> None:
+    """Write the JSON of a python-docx document to ``stream``.
+
+    With ``ndjson=True`` each top level block of the body is written on its
+    own line instead.
+    """
+    from . import _new_context  # noqa: PLC0415
+
+    with _new_context(options) as context:
+        root = document(doc.element)
+        root.context = context
+        if ndjson:
+            for elt in root:
+                if isinstance(elt, body):
+                    _write_lines(stream, elt.iter_json(doc, context))
+            return
+
+        _write_head(stream, type_name(root.__type__, context))
+        separator = b""
+        for elt in root:
+            stream.write(separator)
+            separator = b","
+            if isinstance(elt, body):
+                _write_head(stream, type_name(elt.__type__, context))
+                _write_items(stream, elt.iter_json(doc, context))
+                stream.write(b"]}")
+            else:
+                stream.write(dumps(elt.to_json(doc, context)))
+        stream.write(b"]}")
+
+
+def write_file_json(
+    source: str | os.PathLike | IO[bytes],
+    stream: IO[bytes],
+    options: dict[str, object] | None = None,
+    *,
+    ndjson: bool = False,
+) -> None:
+    """Write the JSON of a ``.docx`` file to ``stream``, reading it with the zip reader.
+
+    Equivalent to ``write_json(docx.Document(source), stream, options, ndjson=ndjson)``.
+    """
+    from .reader import iter_file_blocks  # noqa: PLC0415
+
+    blocks = iter_file_blocks(source, options)
+    if ndjson:
+        _write_lines(stream, blocks)
+        return
+
+    names = {"friendly-name": (options or {}).get("friendly-name", True)}
+    _write_head(stream, type_name("CT_Document", names))
+    _write_head(stream, type_name("CT_Body", names))
+    _write_items(stream, blocks)
+    stream.write(b"]}]}")
+
+
+def _write_head(stream: IO[bytes], type_: str) -> None:
+    """Open a ``{"TYPE": ..., "VALUE": [`` object."""
+    stream.write(b'{"TYPE":')
+    stream.write(dumps(type_))
+    stream.write(b',"VALUE":[')
+
+
+def _write_items(stream: IO[bytes], items: Iterable[object]) -> None:
+    """Write the comma separated items of a JSON array."""
+    separator = b""
+    for item in items:
+        stream.write(separator)
+        stream.write(dumps(item))
+        separator = b","
+
+
+def _write_lines(stream: IO[bytes], items: Iterable[object]) -> None:
+    """Write one JSON document per line."""
+    for item in items:
+        stream.write(dumps(item))
+        stream.write(b"\n")
@@ -0,0 +1,97 @@
+"""Tests for the batch conversion API and command line interface."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from simplify_docx import simplify
+from simplify_docx.__main__ import main
+from simplify_docx.batch import simplify_many
+
+
+def _write_documents(directory: Path) -> list[Path]:
+    """Write a few small documents (and one broken file) to ``directory``."""
+    paths = []
+    for index in range(3):
+        doc = Document()
+        doc.add_paragraph(f"Document {index}")
+        path = directory / f"doc{index}.docx"
+        doc.save(path)
+        paths.append(path)
+    broken = directory / "broken.docx"
+    broken.write_bytes(b"not a zip file")
+    return [*paths[:2], broken, paths[2]]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_simplify_many_preserves_order_and_captures_errors(tmp_path: Path, workers: int) -> None:
+    """Results come back in input order and failures do not abort the batch."""
+    paths = _write_documents(tmp_path)
+
+    results = list(simplify_many(paths, workers=workers))
+
+    assert [result.path for result in results] == [str(path) for path in paths]
+    assert [result.ok for result in results] == [True, True, False, True]
+    assert results[2].result is None
+    assert results[2].error
+    assert results[0].result == simplify(Document(str(paths[0])))
+
+
+def test_simplify_many_unordered_expands_directories(tmp_path: Path) -> None:
+    """Directories are expanded and unordered results cover every file."""
+    paths = _write_documents(tmp_path)
+
+    results = list(simplify_many(tmp_path, {"friendly-name": False}, workers=2, ordered=False))
+
+    assert sorted(result.path for result in results) == sorted(str(path) for path in paths)
+    assert all(result.result["TYPE"] == "CT_Document" for result in results if result.ok)
+
+
+def test_cli_writes_json_files(tmp_path: Path) -> None:
+    """The CLI writes one JSON file per input and reports failures."""
+    source = tmp_path / "in"
+    source.mkdir()
+    _write_documents(source)
+    out = tmp_path / "out"
+
+    status = main([str(source), "-o", str(out), "-w", "1", "--option", "friendly-name=false"])
+
+    assert status == 1
+    assert sorted(path.name for path in out.iterdir()) == ["doc0.json", "doc1.json", "doc2.json"]
+    assert json.loads((out / "doc0.json").read_text())["TYPE"] == "CT_Document"
+
+
+def test_cli_keeps_the_layout_of_input_directories(tmp_path: Path) -> None:
+    """Files with the same name in different subdirectories do not overwrite each other."""
+    source = tmp_path / "in"
+    for name in ("a", "b"):
+        (source / name).mkdir(parents=True)
+        doc = Document()
+        doc.add_paragraph(f"Report {name}")
+        doc.save(source / name / "report.docx")
+    out = tmp_path / "out"
+
+    assert main([str(source), "-o", str(out), "-w", "1"]) == 0
+    for name in ("a", "b"):
+        assert json.loads((out / name / "report.json").read_text()) == simplify(
+            Document(str(source / name / "report.docx"))
+        )
+
+
+def test_cli_rejects_colliding_output_names(tmp_path: Path) -> None:
+    """Inputs which would be written to the same file are rejected before converting anything."""
+    paths = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        doc = Document()
+        doc.save(tmp_path / name / "report.docx")
+        paths.append(str(tmp_path / name / "report.docx"))
+    out = tmp_path / "out"
+
+    with pytest.raises(SystemExit):
+        main([*paths, "-o", str(out), "-w", "1"])
+    assert not out.exists()
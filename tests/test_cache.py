@@ -0,0 +1,140 @@
+"""Tests for the content-hash result cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from simplify_docx import cache as cache_module
+from simplify_docx import simplify, simplify_cached
+from simplify_docx.cache import DirectoryCache, MemoryCache, document_digest, simplify_file_cached
+from simplify_docx.reader import simplify_file
+
+
+class CountingCache(MemoryCache):
+    """A memory cache which counts the results stored."""
+
+    def __init__(self, max_bytes: int = 2**20) -> None:
+        """Create an empty cache."""
+        super().__init__(max_bytes)
+        self.stored = 0
+
+    def set(self, key: str, value: bytes) -> None:
+        """Count and store a result."""
+        self.stored += 1
+        super().set(key, value)
+
+
+def _build_document(path: Path, text: str = "Hello world") -> Path:
+    """Save a simple document."""
+    doc = Document()
+    doc.add_heading("Title", level=1)
+    doc.add_paragraph(text)
+    doc.save(path)
+    return path
+
+
+def test_simplify_cached_reuses_results(tmp_path: Path) -> None:
+    """Identical documents and options hit the cache; changes miss it."""
+    path = _build_document(tmp_path / "doc.docx")
+    cache = CountingCache()
+
+    first = simplify_cached(Document(str(path)), cache=cache)
+    second = simplify_cached(Document(str(path)), cache=cache)
+    assert first == second == simplify(Document(str(path)))
+    assert first is not second
+    assert cache.stored == 1
+
+    simplify_cached(Document(str(path)), {"friendly-name": False}, cache=cache)
+    changed = Document(str(path))
+    changed.add_paragraph("More")
+    simplify_cached(changed, cache=cache)
+    changed.styles["Heading 1"].font.bold = False
+    simplify_cached(changed, cache=cache)
+    assert cache.stored == 4  # noqa: PLR2004
+
+
+def test_simplify_file_cached(tmp_path: Path) -> None:
+    """Files are keyed by their bytes."""
+    path = _build_document(tmp_path / "doc.docx")
+    cache = CountingCache()
+
+    assert simplify_file_cached(path, cache=cache) == simplify_file(path)
+    with path.open("rb") as f:
+        assert simplify_file_cached(f, cache=cache) == simplify_file(path)
+    assert cache.stored == 1
+
+
+def test_results_of_another_converter_are_not_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The cache key changes with the converter's sources, not just with __version__."""
+    path = _build_document(tmp_path / "doc.docx")
+    cache = CountingCache()
+
+    simplify_file_cached(path, cache=cache)
+    monkeypatch.setattr(cache_module, "code_fingerprint", lambda: "changed")
+    simplify_file_cached(path, cache=cache)
+
+    assert cache.stored == 2  # noqa: PLR2004
+
+
+def test_document_digest_covers_the_parts_simplify_reads() -> None:
+    """Nested documents and styles are hashed, images only by name and size, headers not at all."""
+    doc = Document()
+    doc.add_paragraph("Hello")
+    image = Part(PackURI("/word/media/image1.png"), "image/png", b"1234", doc.part.package)
+    doc.part.relate_to(image, RT.IMAGE)
+    chunk = Part(PackURI("/word/chunk.docx"), "application/octet-stream", b"chunk", doc.part.package)
+    r_id = doc.part.relate_to(chunk, RT.A_F_CHUNK)
+    doc.element.body.insert(0, parse_xml(f'<w:altChunk {nsdecls("w", "r")} r:id="{r_id}"/>'))
+    header = doc.sections[0].header
+    header.is_linked_to_previous = False
+    digest = document_digest(doc)
+
+    image._blob = b"5678"
+    header.add_paragraph("Header")
+    assert document_digest(doc) == digest
+
+    image._blob = b"123456"
+    assert document_digest(doc) != digest
+    digest = document_digest(doc)
+
+    chunk._blob = b"other"
+    assert document_digest(doc) != digest
+    digest = document_digest(doc)
+
+    doc.styles["Normal"].font.bold = True
+    assert document_digest(doc) != digest
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    """Entries beyond the size limit are evicted oldest first."""
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == cache.get("c") == b"1234"
+    assert cache.size == 8  # noqa: PLR2004
+
+
+def test_directory_cache(tmp_path: Path) -> None:
+    """Entries persist across instances and are evicted beyond the size limit."""
+    cache = DirectoryCache(tmp_path / "cache", max_bytes=10)
+    cache.set("a", b"1234")
+    assert DirectoryCache(tmp_path / "cache").get("a") == b"1234"
+    assert cache.get("missing") is None
+    os.utime(tmp_path / "cache" / "a.json", (0, 0))
+
+    cache.set("b", b"12345678")
+    assert cache.get("a") is None
+    assert cache.get("b") == b"12345678"
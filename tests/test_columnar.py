@@ -0,0 +1,73 @@
+"""Tests for the columnar output format."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from docx import Document
+
+from simplify_docx import ColumnarDocument, simplify, simplify_columnar
+from simplify_docx.columnar import LIST, MISSING, NODE, OTHER, TEXT
+
+OPTIONS = ({}, {"friendly-name": False, "ignore-empty-paragraphs": True})
+
+
+def _build_document(path: Path) -> Path:
+    """Save a document with headings, non-ASCII text, an empty paragraph and a table."""
+    doc = Document()
+    doc.add_heading("Title", level=1)
+    doc.add_paragraph("  Intro éü  ")
+    doc.add_paragraph("")
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 1).text = "Cell"
+    doc.save(path)
+    return path
+
+
+def test_simplify_columnar_round_trips_to_simplify(tmp_path: Path) -> None:
+    """The columns convert back to the output of simplify()."""
+    path = _build_document(tmp_path / "doc.docx")
+
+    for options in OPTIONS:
+        expected = simplify(Document(str(path)), options)
+        columns = simplify_columnar(Document(str(path)), options)
+
+        assert columns.to_tree() == expected
+        assert ColumnarDocument.from_tree(expected).to_tree() == expected
+
+
+def test_simplify_columnar_columns(tmp_path: Path) -> None:
+    """Parents, depths and text offsets describe the tree in document order."""
+    columns = simplify_columnar(Document(str(_build_document(tmp_path / "doc.docx"))))
+
+    types = [columns.types[code] for code in columns.type_codes]
+    assert types[:3] == ["document", "body", "paragraph"]
+    assert columns.parents[:3].tolist() == [-1, 0, 1]
+    assert columns.depths[:3].tolist() == [0, 1, 2]
+    for i, parent in enumerate(columns.parents[1:], start=1):
+        assert parent < i
+        assert columns.depths[i] == columns.depths[parent] + 1
+
+    texts = [columns.text_at(i) for i in range(len(types)) if columns.value_kinds[i] == TEXT]
+    assert texts == ["Title", "Intro éü", "Cell"]
+    assert columns.text_offsets[-1] == len(columns.text)
+    assert memoryview(columns.parents).format == "q"
+
+
+def test_columnar_document_keeps_other_values_and_attributes() -> None:
+    """Values other than text and nodes, and extra keys, survive the round trip."""
+    tree = {
+        "TYPE": "document",
+        "VALUE": [
+            {"TYPE": "symbol", "VALUE": {"char": "F0B7", "font": "Symbol"}},
+            {"TYPE": "checkBox", "VALUE": True, "name": "agree"},
+            {"TYPE": "altChunk", "VALUE": {"TYPE": "document", "VALUE": []}},
+            {"TYPE": "empty"},
+        ],
+    }
+
+    columns = ColumnarDocument.from_tree(tree)
+
+    assert columns.value_kinds.tolist() == [LIST, OTHER, OTHER, NODE, LIST, MISSING]
+    assert columns.attributes == {2: {"name": "agree"}}
+    assert columns.to_tree() == tree
@@ -9,7 +9,7 @@ import pytest
 from lxml import etree
 
 from simplify_docx.iterators import generic
-from simplify_docx.iterators.generic import build_iterators, register_iterator, xml_iter
+from simplify_docx.iterators.generic import build_iterators, index_ranges, register_iterator, skip_range, xml_iter
 from simplify_docx.utils.warnings import UnexpectedElementWarning
 
 
@@ -69,3 +69,51 @@ def test_xml_iter_skips_range_and_continues() -> None:
         tags = [elt.tag for elt in xml_iter(root, "skip_iter")]
 
     assert tags == ["keep"]
+
+
+def test_index_ranges_matches_skip_range() -> None:
+    """Each start is indexed to the end skip_range would find; unmatched starts are left out."""
+    root = etree.Element("root")
+    starts = [
+        etree.SubElement(root, "skipStart", attrib={"id": "1"}),
+        etree.SubElement(root, "skipStart", attrib={"id": "2"}),
+        etree.SubElement(root, "skipStart", attrib={"id": "1"}),
+    ]
+    etree.SubElement(root, "skipEnd", attrib={"id": "1"})
+    etree.SubElement(root, "skipEnd", attrib={"id": "3"})
+    starts.append(etree.SubElement(root, "skipStart", attrib={"id": "1"}))
+    etree.SubElement(root, "skipEnd", attrib={"id": "1"})
+
+    ranges = index_ranges(root, "skipStart", "id", "skipEnd")
+
+    assert {start: ranges.get(start) for start in starts} == {
+        start: skip_range(start, "id", "skipEnd") for start in starts
+    }
+    assert ranges.get(starts[1]) is None
+    assert ranges[starts[0]] is ranges[starts[2]] is not ranges[starts[3]]
+
+
+def test_build_iterators_compiles_single_dispatch_table() -> None:
+    """Resolved handlers carry one tag -> action table honoring precedence."""
+    root = etree.Element("root")
+    both = etree.SubElement(root, "both")
+    etree.SubElement(both, "inner")
+    etree.SubElement(root, "ignored")
+    etree.SubElement(root, "keep")
+
+    with _clean_iterators():
+        register_iterator("inner_iter", tags_to_yield={"inner": DummyElement})
+        register_iterator(
+            "dispatch_iter",
+            tags_to_yield={"both": DummyElement, "keep": DummyElement},
+            tags_to_nest={"both": "inner_iter"},
+            tags_to_ignore=["ignored", "keep"],
+        )
+        build_iterators()
+
+        handlers = generic.__built__["dispatch_iter"]
+        tags = [elt.tag for elt in xml_iter(root, "dispatch_iter")]
+
+    assert isinstance(handlers.TAGS_TO_IGNORE, frozenset)
+    assert set(handlers.DISPATCH) == {"both", "ignored", "keep"}
+    assert tags == ["both", "inner", "keep"]
@@ -10,6 +10,7 @@ from docx.oxml.ns import qn
 from lxml import etree  # ty:ignore[unresolved-import]
 
 from simplify_docx.elements.base import el
+from simplify_docx.elements.form import fldChar
 from simplify_docx.iterators import generic
 from simplify_docx.iterators.generic import build_iterators, register_iterator, skip_range, xml_iter
 from simplify_docx.utils.tag import get_attrs, get_tag
@@ -108,3 +109,14 @@ def test_el_reads_namespaced_attributes_from_lxml() -> None:
     dummy = DummyProps(element)
 
     assert dummy.props["fldCharType"] == "begin"
+
+
+def test_el_reads_props_lazily() -> None:
+    """Properties are read from the XML on first access, using precomputed names."""
+    element = etree.Element(qn("w:fldChar"))
+    dummy = DummyProps(element)
+    element.set(qn("w:fldCharType"), "end")
+
+    assert DummyProps.__prop_names__ == (("fldCharType", qn("w:fldCharType")),)
+    assert dummy.props == {"fldCharType": "end"}
+    assert not hasattr(fldChar(element), "__dict__")
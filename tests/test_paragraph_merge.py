@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from simplify_docx.elements.paragraph import merge_run_contents
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from simplify_docx import _new_context
+from simplify_docx.elements.paragraph import merge_run_contents, paragraph
 
 
 def test_merge_run_contents_merges_consecutive_text() -> None:
@@ -43,3 +47,56 @@ def test_merge_run_contents_drops_empty_text_when_enabled() -> None:
     options = {"merge-consecutive-text": True, "ignore-empty-text": True}
 
     assert merge_run_contents(items, options) == [{"TYPE": "CT_Text", "VALUE": "Content"}]
+
+
+def _to_json(xml: str, options: dict[str, object]) -> list[dict[str, object]]:
+    """Convert paragraph XML and return its contents."""
+    context = _new_context({"friendly-name": False, "include-paragraph-indent": False, **options})
+    element = paragraph(parse_xml(f"<w:p {nsdecls('w')}>{xml}</w:p>"))
+    element.context = context
+    return element.to_json(None, context)["VALUE"]
+
+
+def test_paragraph_text_runs_are_merged_directly() -> None:
+    """Consecutive text nodes become one text item, split by other contents."""
+    xml = (
+        "<w:r><w:t>One </w:t></w:r><w:r><w:t xml:space='preserve'>two  </w:t><w:t>“three”</w:t></w:r>"
+        "<w:r><w:sym w:char='F020'/><w:t>four</w:t></w:r>"
+    )
+
+    assert _to_json(xml, {"symbol-as-text": False}) == [
+        {"TYPE": "CT_Text", "VALUE": 'One two  "three"'},
+        {"TYPE": "SymbolChar", "VALUE": {"char": "F020", "font": None}},
+        {"TYPE": "CT_Text", "VALUE": "four"},
+    ]
+    assert _to_json(xml, {"merge-consecutive-text": False})[:3] == [
+        {"TYPE": "CT_Text", "VALUE": "One "},
+        {"TYPE": "CT_Text", "VALUE": "two  "},
+        {"TYPE": "CT_Text", "VALUE": '"three"'},
+    ]
+
+
+def test_merge_run_contents_strips_white_space() -> None:
+    """With strip, white space only text items are dropped from both ends."""
+    items = [
+        {"TYPE": "CT_Text", "VALUE": " "},
+        {"TYPE": "CT_Text", "VALUE": "  "},
+        {"TYPE": "CT_Text", "VALUE": " Hello "},
+        {"TYPE": "CT_Empty", "VALUE": "[w:br]"},
+        {"TYPE": "CT_Text", "VALUE": " World "},
+        {"TYPE": "CT_Text", "VALUE": " "},
+    ]
+
+    options = {"merge-consecutive-text": False, "ignore-empty-text": True}
+
+    assert merge_run_contents([dict(item) for item in items], options, strip=True) == [
+        {"TYPE": "CT_Text", "VALUE": "Hello "},
+        {"TYPE": "CT_Empty", "VALUE": "[w:br]"},
+        {"TYPE": "CT_Text", "VALUE": " World"},
+    ]
+    assert merge_run_contents(
+        [dict(item) for item in items], {**options, "remove-trailing-white-space": False}, strip=True
+    )[-1] == {
+        "TYPE": "CT_Text",
+        "VALUE": " ",
+    }
@@ -0,0 +1,139 @@
+"""Tests for the paragraph style index."""
+
+from __future__ import annotations
+
+import pytest
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from simplify_docx import _new_context, simplify
+from simplify_docx.utils import paragrapy_style
+from simplify_docx.utils.paragrapy_style import (
+    NumberingIndex,
+    StyleIndex,
+    find_num_level,
+    find_style,
+    get_num_style,
+    get_p_style,
+    get_paragraph_ind,
+    style_index,
+)
+
+
+def test_style_index_reads_name_and_outline_level() -> None:
+    """Style names and outline levels are indexed by styleId."""
+    doc = Document()
+    styles = StyleIndex(doc)
+
+    heading = styles.get("Heading2")
+    assert heading is not None
+    assert heading.name == "heading 2"
+    assert heading.outline_level == 1
+    assert styles.get("Normal").outline_level is None
+    assert styles.get("NoSuchStyle") is None
+
+    paragraph = doc.add_paragraph("Heading", style="Heading 2")._p
+    assert get_p_style(paragraph, doc, styles) is heading.element
+
+
+def test_style_index_is_built_once_per_conversion() -> None:
+    """The index is cached on the conversion context, keyed by document."""
+    doc = Document()
+    context = _new_context(None)
+
+    assert style_index(doc, context) is style_index(doc, context)
+    assert style_index(Document(), context) is not style_index(doc, context)
+    assert style_index(doc, {}) is not style_index(doc, {})
+
+
+def test_simplify_reports_heading_style_and_outline_level() -> None:
+    """Paragraph styles resolve through the index."""
+    doc = Document()
+    doc.add_heading("Title", level=3)
+
+    paragraph = simplify(doc, {"include-paragraph-indent": False})["VALUE"][0]["VALUE"][0]
+
+    assert paragraph["style"]["pStyleName"] == "heading 3"
+    assert paragraph["style"]["outlineLvl"] == 3  # noqa: PLR2004
+
+
+NUMBERING = (
+    "<w:numbering {ns}>"
+    '<w:abstractNum w:abstractNumId="7">'
+    '<w:lvl w:ilvl="0"><w:pPr><w:ind w:left="720" w:hanging="360"/></w:pPr></w:lvl>'
+    '<w:lvl w:ilvl="1"><w:pPr><w:ind w:left="1440" w:hanging="360"/></w:pPr></w:lvl>'
+    "</w:abstractNum>"
+    '<w:num w:numId="1"><w:abstractNumId w:val="7"/></w:num>'
+    '<w:num w:numId="2"><w:abstractNumId w:val="7"/>'
+    '<w:lvlOverride w:ilvl="1"><w:lvl w:ilvl="1"><w:pPr><w:ind w:left="2880"/></w:pPr></w:lvl></w:lvlOverride>'
+    "</w:num>"
+    "</w:numbering>"
+)
+
+
+def _numbered_document() -> Document:
+    """Create a document with a numbering part using a level override."""
+    doc = Document()
+    numbering = doc.part.numbering_part.element
+    for child in list(numbering):
+        numbering.remove(child)
+    for child in parse_xml(NUMBERING.format(ns=nsdecls("w"))):
+        numbering.append(child)
+    return doc
+
+
+def _numbered_paragraph(doc: Document, num_id: int, ilvl: int) -> object:
+    """Append a paragraph with direct numbering properties."""
+    paragraph = doc.add_paragraph(f"Item {num_id}.{ilvl}")._p
+    num_pr = paragraph.get_or_add_pPr().get_or_add_numPr()
+    num_pr.get_or_add_numId().val = num_id
+    num_pr.get_or_add_ilvl().val = ilvl
+    return paragraph
+
+
+def test_numbering_index_resolves_level_overrides() -> None:
+    """Levels resolve through the abstract numbering and any lvlOverride."""
+    doc = _numbered_document()
+    numbering = NumberingIndex(doc)
+
+    assert numbering.ind("1", "1").get(qn("w:left")) == "1440"
+    assert numbering.ind("2", "0").get(qn("w:left")) == "720"
+    assert numbering.ind("2", "1").get(qn("w:left")) == "2880"
+    assert numbering.get("3") is None
+    assert get_num_style(_numbered_paragraph(doc, 2, 1), doc, numbering) is numbering.get("2", "1")
+
+
+def test_simplify_reports_numbering_indent() -> None:
+    """Numbered paragraphs without direct indentation use the level's indent."""
+    doc = _numbered_document()
+    _numbered_paragraph(doc, 1, 1)
+    _numbered_paragraph(doc, 2, 1)
+
+    body = simplify(doc, {"friendly-name": False})["VALUE"][0]["VALUE"]
+
+    assert [p["style"]["indent"]["left"] for p in body] == [1440, 2880]
+
+
+def test_lookups_without_an_index_do_not_build_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without an index or a conversion context, single styles and levels are looked up directly."""
+    doc = _numbered_document()
+    styles = StyleIndex(doc)
+    numbering = NumberingIndex(doc)
+    heading = doc.add_paragraph("Heading", style="Heading 2")._p
+    item = _numbered_paragraph(doc, 2, 1)
+
+    def _fail(*_args: object) -> None:
+        raise AssertionError("index built")
+
+    monkeypatch.setattr(StyleIndex, "__init__", _fail)
+    monkeypatch.setattr(NumberingIndex, "__init__", _fail)
+    monkeypatch.setattr(paragrapy_style, "numbering_index", _fail)
+
+    for style_id in ("Heading2", "Normal", "NoSuchStyle"):
+        assert find_style(doc, style_id) == styles.get(style_id)
+    for key in (("1", "0"), ("1", "1"), ("2", "0"), ("2", "1"), ("2", "5"), ("3", "0")):
+        assert find_num_level(doc, *key) is numbering.get(*key)
+    assert get_p_style(heading, doc) is styles.get("Heading2").element
+    assert get_num_style(item, doc) is numbering.get("2", "1")
+    assert get_paragraph_ind(item, doc).get(qn("w:left")) == "2880"
@@ -0,0 +1,41 @@
+"""Tests for the optional profiling hooks."""
+
+from __future__ import annotations
+
+from docx import Document
+
+from simplify_docx import Profile, simplify
+
+
+def _build_document() -> Document:
+    """Create a document with paragraphs, a heading and a table."""
+    doc = Document()
+    doc.add_heading("Title", level=1)
+    doc.add_paragraph("Hello world")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Cell"
+    return doc
+
+
+def test_profile_records_phases_and_elements() -> None:
+    """Phases and per-element counts (cell paragraphs included) reach the sink."""
+    doc = _build_document()
+    reports: list[Profile] = []
+    profile = Profile(sink=reports.append)
+
+    simplify(doc, profile=profile)
+
+    assert reports == [profile]
+    assert {"options", "convert", "StyleIndex"} <= set(profile.phases)
+    elements = profile.report()["elements"]
+    assert elements["paragraph"]["count"] == 4  # noqa: PLR2004
+    assert elements["table"]["count"] == 1
+    assert elements["document"]["inclusive"] >= elements["document"]["exclusive"] >= 0
+    assert "phase" in str(profile)
+
+
+def test_profile_does_not_change_output() -> None:
+    """The instrumented conversion returns the same JSON."""
+    doc = _build_document()
+    assert simplify(doc, profile=Profile()) == simplify(doc)
+    assert simplify(doc, {"friendly-name": False}, profile=Profile()) == simplify(doc, {"friendly-name": False})
@@ -0,0 +1,254 @@
+"""Tests for the direct-from-zip reader."""
+
+from __future__ import annotations
+
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from simplify_docx import _new_context, iter_simplified_blocks, reader, simplify
+from simplify_docx.elements import document
+from simplify_docx.reader import ZipDocument, iter_file_blocks, simplify_file
+from simplify_docx.utils import nested_parts
+
+ALT_CHUNK_REL = (
+    '<Relationship Id="rIdChunk" Target="chunk.docx" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/aFChunk"/>'
+)
+
+
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def _build_document(path: Path) -> Path:
+    """Save a document using styles, numbering and a table."""
+    doc = Document()
+    doc.add_heading("Title", level=1)
+    doc.add_paragraph("  Intro “quoted”  ")
+    doc.add_paragraph("")
+    doc.add_paragraph("First", style="List Number")
+    doc.add_paragraph("Second", style="List Number")
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 1).text = "Cell"
+    for index in range(50):
+        doc.add_paragraph(f"Paragraph {index}")
+    doc.save(path)
+    return path
+
+
+def _add_alt_chunk(path: Path, chunk: Path) -> None:
+    """Embed ``chunk`` as an altChunk at the end of the document body."""
+    with zipfile.ZipFile(path) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+    parts["word/chunk.docx"] = chunk.read_bytes()
+    parts["word/_rels/document.xml.rels"] = parts["word/_rels/document.xml.rels"].replace(
+        b"</Relationships>", ALT_CHUNK_REL.encode() + b"</Relationships>"
+    )
+    parts["word/document.xml"] = parts["word/document.xml"].replace(
+        b"<w:sectPr", b'<w:altChunk r:id="rIdChunk"/><w:sectPr', 1
+    )
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+
+def test_simplify_file_matches_simplify(tmp_path: Path) -> None:
+    """The zip reader produces the same output as simplify()."""
+    path = _build_document(tmp_path / "doc.docx")
+
+    for options in ({}, {"friendly-name": False, "include-paragraph-indent": False}):
+        assert simplify_file(path, options) == simplify(Document(str(path)), options)
+        assert list(iter_file_blocks(path, options)) == list(iter_simplified_blocks(Document(str(path)), options))
+
+
+def test_simplify_file_accepts_file_objects(tmp_path: Path) -> None:
+    """The reader can stream from an in-memory file."""
+    path = _build_document(tmp_path / "doc.docx")
+
+    assert simplify_file(BytesIO(path.read_bytes())) == simplify(Document(str(path)))
+
+
+def test_body_stream_releases_converted_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only the most recently parsed body children are kept in memory."""
+    path = _build_document(tmp_path / "doc.docx")
+    monkeypatch.setattr(reader, "CHUNK_SIZE", 256)
+    sizes = []
+
+    with zipfile.ZipFile(path) as archive:
+        nodes = ZipDocument(archive).iter_body()
+        for node in nodes:
+            nodes.release()
+            sizes.append(len(node.getparent()))
+
+    assert len(sizes) > 50  # noqa: PLR2004
+    assert max(sizes) < 10  # noqa: PLR2004
+    assert sizes[-1] == 1
+
+
+def test_simplify_file_converts_embedded_alt_chunks(tmp_path: Path) -> None:
+    """AltChunks holding a .docx package are converted as nested documents."""
+    chunk = Document()
+    chunk.add_paragraph("Nested")
+    chunk.save(tmp_path / "chunk.docx")
+    path = _build_document(tmp_path / "doc.docx")
+    _add_alt_chunk(path, tmp_path / "chunk.docx")
+
+    blocks = list(iter_file_blocks(path))
+
+    assert blocks[-1]["TYPE"] == "nested-file"
+    nested_body = blocks[-1]["VALUE"]["VALUE"][0]
+    assert nested_body["TYPE"] == "body"
+    assert nested_body["VALUE"] == [{"TYPE": "paragraph", "VALUE": [{"TYPE": "text", "VALUE": "Nested"}]}]
+
+
+def test_repeated_alt_chunks_are_converted_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """AltChunks referencing the same part share one conversion, but not the JSON objects."""
+    chunk = Document()
+    chunk.add_paragraph("Nested")
+    chunk.save(tmp_path / "chunk.docx")
+    path = _build_document(tmp_path / "doc.docx")
+    _add_alt_chunk(path, tmp_path / "chunk.docx")
+    with zipfile.ZipFile(path) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+    parts["word/_rels/document.xml.rels"] = parts["word/_rels/document.xml.rels"].replace(
+        b"</Relationships>", ALT_CHUNK_REL.replace("rIdChunk", "rIdSame").encode() + b"</Relationships>"
+    )
+    parts["word/document.xml"] = parts["word/document.xml"].replace(
+        b"<w:sectPr", b'<w:altChunk r:id="rIdChunk"/><w:altChunk r:id="rIdSame"/><w:sectPr', 1
+    )
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+    converted: list[object] = []
+    open_json = document.open_json
+
+    def _counting_open_json(self: document, *args: object) -> object:
+        converted.append(self)
+        return open_json(self, *args)
+
+    monkeypatch.setattr(document, "open_json", _counting_open_json)
+    blocks = list(iter_file_blocks(path))
+
+    assert len(converted) == 1
+    assert [block["TYPE"] for block in blocks[-3:]] == ["nested-file"] * 3
+    values = [block["VALUE"] for block in blocks[-3:]]
+    assert values[0] == values[1] == values[2]
+    # each reference gets its own copy
+    values[0]["VALUE"][0]["VALUE"].clear()
+    assert values[1] == values[2] != values[0]
+    assert values[1]["VALUE"][0]["VALUE"] is not values[2]["VALUE"][0]["VALUE"]
+
+
+def test_nested_part_cycles_are_not_converted_again() -> None:
+    """A part requested while it is being converted yields None."""
+    context = _new_context(None)
+    part = object()
+    calls: list[object] = []
+
+    def convert() -> str:
+        calls.append(context.nested(part, convert))
+        return "converted"
+
+    assert context.nested(part, convert) == "converted"
+    assert context.nested(part, convert) == "converted"
+    assert calls == [None]
+
+
+def _build_nested_document(tmp_path: Path, count: int) -> Path:
+    """Save a document ending in ``count`` altChunks, each holding its own ``.docx``."""
+    path = _build_document(tmp_path / "doc.docx")
+    for index in range(count):
+        chunk = Document()
+        chunk.add_paragraph(f"Nested {index}")
+        chunk.save(tmp_path / f"chunk{index}.docx")
+    with zipfile.ZipFile(path) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+    # so that python-docx can load the document too
+    parts["[Content_Types].xml"] = parts["[Content_Types].xml"].replace(
+        b"</Types>", f'<Default Extension="docx" ContentType="{DOCX_CONTENT_TYPE}"/></Types>'.encode()
+    )
+    for index in range(count):
+        parts[f"word/chunk{index}.docx"] = (tmp_path / f"chunk{index}.docx").read_bytes()
+        rel = ALT_CHUNK_REL.replace("rIdChunk", f"rIdChunk{index}").replace("chunk.docx", f"chunk{index}.docx")
+        parts["word/_rels/document.xml.rels"] = parts["word/_rels/document.xml.rels"].replace(
+            b"</Relationships>", rel.encode() + b"</Relationships>"
+        )
+        parts["word/document.xml"] = parts["word/document.xml"].replace(
+            b"<w:sectPr", f'<w:altChunk r:id="rIdChunk{index}"/><w:sectPr'.encode(), 1
+        )
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+    return path
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_nested_parts_in_a_pool_match_serial(tmp_path: Path, pool: str) -> None:
+    """Nested documents converted by a pool of workers are spliced back in order."""
+    path = _build_nested_document(tmp_path, 3)
+
+    result = simplify_file(path, {"nested-part-workers": 2, "nested-part-pool": pool})
+
+    assert result == simplify_file(path)
+    assert [
+        block["VALUE"]["VALUE"][0]["VALUE"][0]["VALUE"][0]["VALUE"] for block in result["VALUE"][0]["VALUE"][-3:]
+    ] == [
+        "Nested 0",
+        "Nested 1",
+        "Nested 2",
+    ]
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_python_docx_nested_parts_in_a_pool_match_serial(tmp_path: Path, pool: str) -> None:
+    """Through python-docx, opaque .docx parts convert the same serially and in a pool."""
+    path = _build_nested_document(tmp_path, 3)
+
+    serial = simplify(Document(str(path)))
+
+    assert simplify(Document(str(path)), {"nested-part-workers": 2, "nested-part-pool": pool}) == serial
+    assert serial == simplify_file(path)
+
+
+def test_nested_part_pool_is_shut_down_with_the_conversion(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The workers of the nested-part pool do not outlive the conversion."""
+    path = _build_nested_document(tmp_path, 2)
+    pools: list[ThreadPoolExecutor] = []
+
+    def _pool(**kwargs: object) -> ThreadPoolExecutor:
+        pools.append(ThreadPoolExecutor(**kwargs))
+        return pools[-1]
+
+    monkeypatch.setitem(nested_parts.POOLS, "thread", _pool)
+    simplify_file(path, {"nested-part-workers": 2, "nested-part-pool": "thread"})
+
+    assert len(pools) == 1
+    with pytest.raises(RuntimeError):
+        pools[0].submit(int)
+
+
+def test_nested_parts_use_a_supplied_executor(tmp_path: Path) -> None:
+    """An executor passed as nested-part-pool is used, and left running."""
+    path = _build_nested_document(tmp_path, 2)
+
+    submitted: list[object] = []
+
+    class _Pool(ThreadPoolExecutor):
+        def submit(self, fn: Callable, /, *args: object, **kwargs: object) -> Future:
+            submitted.append(fn)
+            return super().submit(fn, *args, **kwargs)
+
+    with _Pool(max_workers=1) as pool:
+        result = simplify_file(path, {"nested-part-workers": 1, "nested-part-pool": pool})
+        assert submitted == [nested_parts.convert_package] * 2
+        assert pool.submit(int).result() == 0
+
+    assert result == simplify_file(path)
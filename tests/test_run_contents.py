@@ -27,6 +27,23 @@ def test_text_to_json_normalizes_characters() -> None:
     assert text_element.to_json(None, options)["VALUE"] == '"Hi" -'
 
 
+def test_text_to_json_option_precedence_and_inner_spaces() -> None:
+    """Quote handling wins over space handling, and inner spaces can be flattened."""
+    element = etree.Element(qn("w:t"))
+    element.text = "\u201bA\u2003 \u200e B\u200f"
+    text_element = text(element)
+
+    assert text_element.to_json(None, {})["VALUE"] == "'A  \u200e B\u200f"
+    assert text_element.to_json(None, {"dumb-quotes": False})["VALUE"] == " A  \u200e B\u200f"
+    assert (
+        text_element.to_json(
+            None,
+            {"flatten-inner-spaces": True, "ignore-left-to-right-mark": True, "ignore-right-to-left-mark": True},
+        )["VALUE"]
+        == "'A B"
+    )
+
+
 def test_empty_to_json_respects_empty_as_text() -> None:
     """Empty elements can render as text when configured."""
     element = etree.Element(qn("w:instrText"))
@@ -5,12 +5,13 @@ from __future__ import annotations
 import contextlib
 from collections.abc import Iterator
 
+import pytest
 from docx.oxml.ns import qn
 
 import simplify_docx.iterators  # noqa: F401
 from simplify_docx import __default_options__
 from simplify_docx.iterators import generic
-from simplify_docx.utils.set_options import set_options
+from simplify_docx.utils.set_options import compile_plan, set_options
 
 
 @contextlib.contextmanager
@@ -57,3 +58,32 @@ def test_set_options_respects_flatten_custom_xml() -> None:
         tags_to_yield = handlers.TAGS_TO_YIELD or {}
 
         assert qn("w:customXml") in tags_to_yield
+
+
+def test_compile_plan_is_cached_per_fingerprint() -> None:
+    """compile_plan returns the same plan for equivalent options."""
+    options = dict(__default_options__)
+    other = dict(__default_options__, **{"dumb-quotes": False})
+
+    assert compile_plan(options) is compile_plan(other)
+
+    options["flatten-hyperlink"] = False
+    plan = compile_plan(options)
+
+    assert plan is not compile_plan(other)
+    assert qn("w:hyperlink") in (plan["EG_PContent"].TAGS_TO_YIELD or {})
+
+
+def test_compile_plan_leaves_global_registry_untouched() -> None:
+    """compile_plan does not mutate the global iterator registries."""
+    options = dict(__default_options__)
+    options["flatten-customXml"] = False
+
+    with _restore_iterators():
+        saved_built = dict(generic.__built__)
+        plan = compile_plan(options)
+
+        assert generic.__built__ == saved_built
+        assert qn("w:customXml") in (plan["EG_ContentRunContents"].TAGS_TO_YIELD or {})
+        with pytest.raises(TypeError):
+            plan["EG_PContent"] = plan["CT_P"]  # type: ignore[index]
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 
-from simplify_docx import simplify
+from simplify_docx import __default_options__, _new_context, iter_simplified_blocks, simplify
+from simplify_docx.elements import document, fldChar, text
+from simplify_docx.iterators import generic, xml_iter
+from simplify_docx.utils import table_rows
 
 
 def _build_document() -> Document:
@@ -35,3 +43,282 @@ def test_simplify_can_disable_friendly_names() -> None:
     result = simplify(doc, {"friendly-name": False})
 
     assert result.get("TYPE") == "CT_Document"
+
+
+NUMBERING = (
+    f"<w:numbering {nsdecls('w')}>"
+    '<w:abstractNum w:abstractNumId="7"><w:lvl w:ilvl="0"><w:start w:val="1"/></w:lvl></w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="7"/></w:num>'
+    "</w:numbering>"
+)
+
+
+def _build_styled_document() -> Document:
+    """Create a document with direct indentation, numbering and a heading."""
+    doc = Document()
+    numbering = doc.part.numbering_part.element
+    for child in list(numbering):
+        numbering.remove(child)
+    for child in parse_xml(NUMBERING):
+        numbering.append(child)
+    doc.add_paragraph("Indented").paragraph_format.left_indent = 914400
+    num_pr = doc.add_paragraph("Item")._p.get_or_add_pPr().get_or_add_numPr()
+    num_pr.get_or_add_numId().val = 1
+    num_pr.get_or_add_ilvl().val = 0
+    doc.add_heading("Head", 2)
+    return doc
+
+
+def test_friendly_names_apply_to_value_children_only() -> None:
+    """Friendly names apply to the VALUE children only, as in the original output.
+
+    The paragraph ``style`` payloads keep their raw TYPEs.
+    """
+    heading_style = {"outlineLvl": 2, "pStyle": "Heading2", "pStyleName": "heading 2"}
+    expected = {
+        "TYPE": "document",
+        "VALUE": [
+            {
+                "TYPE": "body",
+                "VALUE": [
+                    {
+                        "TYPE": "paragraph",
+                        "VALUE": [{"TYPE": "text", "VALUE": "Indented"}],
+                        "style": {"indent": {"TYPE": "CT_Ind", "left": 1440}},
+                    },
+                    {
+                        "TYPE": "paragraph",
+                        "VALUE": [{"TYPE": "text", "VALUE": "Item"}],
+                        "style": {"numPr": {"TYPE": "numPr", "ilvl": 0, "numId": 1}},
+                    },
+                    {"TYPE": "paragraph", "VALUE": [{"TYPE": "text", "VALUE": "Head"}], "style": heading_style},
+                ],
+            }
+        ],
+    }
+    doc = _build_styled_document()
+
+    assert simplify(doc) == expected
+    raw = simplify(doc, {"friendly-name": False})
+    assert raw["VALUE"][0]["VALUE"][0] == {
+        "TYPE": "CT_P",
+        "VALUE": [{"TYPE": "CT_Text", "VALUE": "Indented"}],
+        "style": {"indent": {"TYPE": "CT_Ind", "left": 1440}},
+    }
+
+
+class _Fragment:
+    """Stand-in for the XML of a form field as read with form field support in python-docx."""
+
+    def __init__(self, **children: object) -> None:
+        """Set the child elements and attributes."""
+        self.__dict__.update(children)
+
+    def get(self, _name: str) -> None:
+        """Report no XML attributes."""
+
+
+def test_form_field_payloads_keep_raw_names() -> None:
+    """A form field's ffData, field codes and results keep their raw TYPEs, as in the original output."""
+    field = fldChar(_Fragment(ffData=_Fragment(checkBox=_Fragment())))
+    text_xml = f"<w:t {nsdecls('w')}>{{}}</w:t>"
+    field.update(text(parse_xml(text_xml.format("FORMCHECKBOX"))))
+    field.update(fldChar(_Fragment(fldCharType="separate")))
+    field.update(text(parse_xml(text_xml.format("x"))))
+
+    out = field.to_json(Document(), _new_context({"simplify-checkbox": False}))
+
+    assert out == {
+        "TYPE": "check-box",
+        "VALUE": None,
+        "ffData": {"TYPE": "CT_FFData", "checkBox": {"TYPE": "CT_FFCheckBox"}},
+        "fieldCodes": [{"TYPE": "CT_Text", "VALUE": "FORMCHECKBOX"}],
+        "fieldResults": [{"TYPE": "CT_Text", "VALUE": "x"}],
+    }
+
+
+def _build_hyperlink_document() -> Document:
+    """Create a document whose output depends on several options."""
+    doc = Document()
+    paragraph = doc.add_paragraph("\u201cQuoted\u201d ")
+    paragraph._p.append(
+        parse_xml(f'<w:hyperlink {nsdecls("w", "r")} r:id="rId99"><w:r><w:t>link</w:t></w:r></w:hyperlink>')
+    )
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(1, 1).text = "Cell"
+    return doc
+
+
+def test_simplify_is_safe_to_call_concurrently() -> None:
+    """Concurrent calls with different options do not affect each other."""
+    doc = _build_hyperlink_document()
+    variants = [
+        {},
+        {"flatten-hyperlink": False},
+        {"friendly-name": False, "dumb-quotes": False},
+        {"flatten-hyperlink": False, "friendly-name": False},
+    ]
+    expected = [simplify(doc, options) for options in variants]
+    assert len({repr(result) for result in expected}) == len(variants)
+
+    jobs = [index % len(variants) for index in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda index: simplify(doc, variants[index]), jobs))
+
+    for index, result in zip(jobs, results, strict=True):
+        assert result == expected[index]
+
+
+def test_iter_simplified_blocks_matches_simplify() -> None:
+    """Streaming the body yields the same blocks as the full conversion."""
+    doc = _build_hyperlink_document()
+    doc.add_paragraph("")
+    doc.add_paragraph("Last")
+
+    for options in ({}, {"friendly-name": False}):
+        blocks = iter_simplified_blocks(doc, options)
+        assert not isinstance(blocks, list)
+        assert list(blocks) == simplify(doc, options)["VALUE"][0]["VALUE"]
+
+
+def _build_form_document() -> Document:
+    """Create a document whose text input spans two paragraphs."""
+    doc = Document()
+    body = doc.element.body
+    body.insert(
+        0,
+        parse_xml(
+            f"<w:p {nsdecls('w')}>"
+            "<w:r><w:t>Name: </w:t></w:r>"
+            '<w:r><w:fldChar w:fldCharType="begin"><w:ffData><w:name w:val="Name"/>'
+            "<w:textInput/></w:ffData></w:fldChar></w:r>"
+            "<w:r><w:instrText> FORMTEXT </w:instrText></w:r>"
+            '<w:r><w:fldChar w:fldCharType="separate"/></w:r>'
+            "<w:r><w:t>first line</w:t></w:r>"
+            "</w:p>"
+        ),
+    )
+    body.insert(
+        1,
+        parse_xml(
+            f"<w:p {nsdecls('w')}>"
+            "<w:r><w:t> second line</w:t></w:r>"
+            '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+            "</w:p>"
+        ),
+    )
+    doc.add_paragraph("After")
+    return doc
+
+
+def test_iter_simplified_blocks_keeps_greedy_text_input() -> None:
+    """A text input continued into the next paragraph is consumed while streaming."""
+    doc = _build_form_document()
+
+    blocks = list(iter_simplified_blocks(doc))
+
+    assert blocks == simplify(doc)["VALUE"][0]["VALUE"]
+    assert [block["TYPE"] for block in blocks] == ["paragraph", "paragraph"]
+    assert blocks[0]["VALUE"] == [{"TYPE": "text", "VALUE": "Name: first line second line"}]
+
+
+def test_large_table_rows_in_workers_match_serial() -> None:
+    """Rows converted by worker processes are reassembled in order."""
+    doc = Document()
+    doc.add_paragraph("Item", style="List Number")
+    table = doc.add_table(rows=12, cols=2)
+    for index, row in enumerate(table.rows):
+        row.cells[0].text = f"Row {index}"
+        row.cells[1].add_paragraph(f"Heading {index}", style="Heading 2")
+        row.cells[1].add_paragraph("Numbered", style="List Number")
+    options = {"table-row-workers": 2, "table-row-threshold": 10}
+
+    result = simplify(doc, options)
+
+    assert result == simplify(doc)
+    rows = result["VALUE"][0]["VALUE"][1]["VALUE"]
+    assert [row["VALUE"][0]["VALUE"][0]["VALUE"][0]["VALUE"] for row in rows] == [f"Row {i}" for i in range(12)]
+
+
+def test_large_tables_share_one_row_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The row workers are started once per conversion, and stopped with it."""
+    doc = Document()
+    for _ in range(2):
+        table = doc.add_table(rows=12, cols=1)
+        for index, row in enumerate(table.rows):
+            row.cells[0].text = f"Row {index}"
+    pools: list[ProcessPoolExecutor] = []
+
+    def _pool(**kwargs: object) -> ProcessPoolExecutor:
+        pools.append(ProcessPoolExecutor(**kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(table_rows, "ProcessPoolExecutor", _pool)
+    result = simplify(doc, {"table-row-workers": 2, "table-row-threshold": 10})
+
+    assert result == simplify(doc)
+    assert len(pools) == 1
+    with pytest.raises(RuntimeError):
+        pools[0].submit(int)
+
+
+@pytest.mark.parametrize("options", [{}, {"table-row-workers": 2}])
+def test_deep_nesting_does_not_recurse(options: dict[str, object]) -> None:
+    """Tables nested in cells and nested hyperlinks are converted at any depth."""
+    depth = 1500
+    doc = Document()
+    node = doc.element.body.makeelement(qn("w:tbl"))
+    doc.element.body.insert(0, node)
+    for _ in range(depth):
+        node.append(node.makeelement(qn("w:tblPr")))
+        row = node.makeelement(qn("w:tr"))
+        cell = row.makeelement(qn("w:tc"))
+        node.append(row)
+        row.append(cell)
+        node = cell.makeelement(qn("w:tbl"))
+        cell.append(node)
+    node.getparent().replace(node, parse_xml(f"<w:p {nsdecls('w')}><w:r><w:t>table</w:t></w:r></w:p>"))
+
+    node = doc.add_paragraph()._p
+    for _ in range(depth):
+        link = node.makeelement(qn("w:hyperlink"))
+        node.append(link)
+        node = link
+    node.append(parse_xml(f"<w:r {nsdecls('w')}><w:t>link</w:t></w:r>"))
+
+    table, paragraph = simplify(doc, options)["VALUE"][0]["VALUE"]
+
+    for _ in range(depth):
+        table = table["VALUE"][0]["VALUE"][0]["VALUE"][0]
+    assert table == {"TYPE": "paragraph", "VALUE": [{"TYPE": "text", "VALUE": "table"}]}
+    assert paragraph == {"TYPE": "paragraph", "VALUE": [{"TYPE": "text", "VALUE": "link"}]}
+
+
+def test_moved_from_ranges_are_skipped() -> None:
+    """Content moved elsewhere (between w:moveFromRangeStart and its end) is dropped."""
+    doc = Document()
+    doc.element.body.insert(
+        0,
+        parse_xml(
+            f"<w:p {nsdecls('w')}><w:r><w:t>kept</w:t></w:r>"
+            '<w:moveFromRangeStart w:id="1" w:name="move1"/>'
+            "<w:moveFrom><w:r><w:t>moved</w:t></w:r></w:moveFrom>"
+            '<w:moveFromRangeEnd w:id="1"/>'
+            '<w:r><w:t xml:space="preserve"> too</w:t></w:r></w:p>'
+        ),
+    )
+
+    assert simplify(doc)["VALUE"][0]["VALUE"] == [
+        {"TYPE": "paragraph", "VALUE": [{"TYPE": "text", "VALUE": "kept too"}]}
+    ]
+
+
+def test_elements_convert_without_a_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a ConversionContext or set_options(), elements use the default plan."""
+    monkeypatch.setattr(generic, "__built__", {})
+    doc = _build_document()
+
+    out = document(doc.element).to_json(doc, dict(__default_options__))
+
+    assert out == simplify(doc)
+    assert [type(elt).__name__ for elt in xml_iter(doc.element.body, "CT_Body")] == ["paragraph", "table"]
@@ -45,3 +45,14 @@ def test_get_tag_uses_custom_namespace_mappings() -> None:
     assert tag.ns == "x"
     assert tag.tag == "item"
     assert tag.nstag == "x:item"
+
+
+def test_get_tag_caches_by_tag_and_namespace_map() -> None:
+    """get_tag reuses its results, but not across different namespace maps."""
+    namespace = "urn:example"
+    first = etree.Element(f"{{{namespace}}}item")
+    second = etree.Element(f"{{{namespace}}}item")
+
+    assert get_tag(first, nsdict={"x": namespace}) is get_tag(second, nsdict={"x": namespace})
+    assert get_tag(second, nsdict={"y": namespace}).nstag == "y:item"
+    assert get_tag(second).nstag == f"{{{namespace}}}item"
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import contextlib
+import gc
+import weakref
 from collections.abc import Iterator
 
 import pytest
@@ -11,7 +13,7 @@ from simplify_docx.iterators import generic
 from simplify_docx.iterators.generic import register_iterator
 from simplify_docx.utils import warnings as warn_mod
 from simplify_docx.utils.friendly_names import apply_friendly_names
-from simplify_docx.utils.walk import walk
+from simplify_docx.utils.walk import walk, walk_many
 
 
 @contextlib.contextmanager
@@ -76,6 +78,29 @@ def test_walk_passes_parent_list_and_index_for_list_children() -> None:
     assert seen == [("paragraph", 0)]
 
 
+def test_walk_accepts_unhashable_callables_without_keeping_them() -> None:
+    """Walk calls unhashable callables, and holds no reference to them afterwards."""
+    document = {"TYPE": "document", "VALUE": [{"TYPE": "paragraph", "VALUE": []}]}
+
+    class _Collect:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __init__(self) -> None:
+            self.seen: list[int | None] = []
+
+        def __call__(self, _node: dict[str, object], _parent: object, index: int | None) -> None:
+            self.seen.append(index)
+
+    collect = _Collect()
+    walk(document, collect, TYPE="paragraph")
+    assert collect.seen == [0]
+
+    ref = weakref.ref(collect)
+    del collect
+    gc.collect()
+    assert ref() is None
+
+
 def test_apply_friendly_names_updates_nested_types() -> None:
     """Friendly names are applied to nested elements."""
     document = {
@@ -105,3 +130,77 @@ def test_register_iterator_rejects_duplicate_names() -> None:
         register_iterator("dup-name")
         with pytest.raises(ValueError, match="already registered"):
             register_iterator("dup-name")
+
+
+def test_walk_many_applies_all_visitors_in_one_pass() -> None:
+    """walk_many dispatches by TYPE, in document order, and retires functions which return a value."""
+    document = {
+        "TYPE": "document",
+        "VALUE": [
+            {"TYPE": "paragraph", "VALUE": [{"TYPE": "text", "VALUE": "a"}]},
+            {"TYPE": "table", "VALUE": [{"TYPE": "paragraph", "VALUE": [{"TYPE": "text", "VALUE": "b"}]}]},
+            {"TYPE": "paragraph", "VALUE": [{"TYPE": "text", "VALUE": "c"}]},
+        ],
+    }
+    texts: list[str] = []
+    visited: list[str] = []
+    positions: list[int | None] = []
+
+    def _collect_text(node: dict[str, object]) -> None:
+        texts.append(node["VALUE"])  # type: ignore[arg-type]
+
+    def _first_table(node: dict[str, object]) -> dict[str, object]:
+        return node
+
+    def _second_paragraph(_node: dict[str, object], _parent: object, index: int | None) -> int | None:
+        positions.append(index)
+        return index if len(positions) > 1 else None
+
+    def _visit(node: dict[str, object]) -> None:
+        visited.append(node["TYPE"])  # type: ignore[arg-type]
+
+    results = walk_many(
+        document,
+        {"text": _collect_text, "table": [_first_table], "paragraph": _second_paragraph, None: _visit},
+        no_iter=["table"],
+    )
+
+    assert texts == ["a", "c"]
+    assert visited == ["document", "paragraph", "text", "table", "paragraph", "text"]
+    assert positions == [0, 2]
+    assert results == [None, document["VALUE"][1], 2, None]
+
+
+def test_walk_many_stops_once_every_visitor_returned() -> None:
+    """walk_many stops walking once each function has returned a value."""
+    document = {"TYPE": "document", "VALUE": [{"TYPE": "paragraph", "VALUE": []} for _ in range(3)]}
+    calls: list[int] = []
+
+    def _first(_node: dict[str, object], _parent: list[dict[str, object]], index: int) -> int:
+        calls.append(index)
+        return index
+
+    assert walk_many(document, {"paragraph": _first}) == [0]
+    assert calls == [0]
+
+
+def test_walk_many_keeps_repeated_and_unhashable_visitors_apart() -> None:
+    """Each function given is a separate visitor, whether or not it is hashable or repeated."""
+    document = {
+        "TYPE": "document",
+        "VALUE": [{"TYPE": "paragraph", "VALUE": []}, {"TYPE": "table", "VALUE": []}],
+    }
+
+    class _Index:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, _node: dict[str, object], _parent: object, index: int | None) -> int | None:
+            return index
+
+    def _type(node: dict[str, object]) -> object:
+        return node["TYPE"]
+
+    index = _Index()
+    results = walk_many(document, {"table": [index, _type], "paragraph": [_type, index]})
+
+    assert results == [1, "table", "paragraph", 0]
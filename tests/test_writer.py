@@ -0,0 +1,56 @@
+"""Tests for the JSON stream writer."""
+
+from __future__ import annotations
+
+import json
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from simplify_docx import iter_simplified_blocks, simplify, write_json, writer
+from simplify_docx.writer import write_file_json
+
+OPTIONS = ({}, {"friendly-name": False, "ignore-empty-paragraphs": True})
+
+
+def _build_document(path: Path) -> Path:
+    """Save a document with headings, quotes, an empty paragraph and a table."""
+    doc = Document()
+    doc.add_heading("Title", level=1)
+    doc.add_paragraph("  Intro “quoted”  ")
+    doc.add_paragraph("")
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 1).text = "Cell"
+    doc.save(path)
+    return path
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_matches_simplify(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """The written JSON decodes to the output of simplify(), with or without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(writer, "orjson", None)
+    elif writer.orjson is None:
+        pytest.skip("orjson is not installed")
+    path = _build_document(tmp_path / "doc.docx")
+
+    for options in OPTIONS:
+        expected = simplify(Document(str(path)), options)
+        for write, source in ((write_json, Document(str(path))), (write_file_json, path)):
+            stream = BytesIO()
+            write(source, stream, options)
+            assert json.loads(stream.getvalue()) == expected
+
+
+def test_write_ndjson_matches_blocks(tmp_path: Path) -> None:
+    """With ndjson=True each body block is written on its own line."""
+    path = _build_document(tmp_path / "doc.docx")
+
+    for options in OPTIONS:
+        expected = list(iter_simplified_blocks(Document(str(path)), options))
+        for write, source in ((write_json, Document(str(path))), (write_file_json, path)):
+            stream = BytesIO()
+            write(source, stream, options, ndjson=True)
+            assert [json.loads(line) for line in stream.getvalue().splitlines()] == expected